@@ -0,0 +1,10 @@
+"""
+Stand-alone benchmarks for OCSysInfo.
+
+Run them from the repository's root, e.g:
+
+    python -m benchmarks.pciids
+
+Every benchmark prints its results as JSON to stdout, so they can be
+stored and compared between releases.
+"""
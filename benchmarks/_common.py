@@ -0,0 +1,49 @@
+import json
+import os
+import sys
+import time
+
+
+def rss():
+    """Current resident set size of this process, in bytes."""
+
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        import resource
+
+        # `ru_maxrss` is in KiB on Linux, and in bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def timed(func, *args, **kwargs):
+    """Returns `(result, seconds)` of a single call to `func`."""
+
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+
+    return result, time.perf_counter() - start
+
+
+def summary(samples):
+    """Min/median/mean/max of a list of durations, in microseconds."""
+
+    if not samples:
+        return {}
+
+    ordered = sorted(samples)
+
+    return {
+        "n": len(ordered),
+        "min_us": round(ordered[0] * 1e6, 3),
+        "median_us": round(ordered[len(ordered) // 2] * 1e6, 3),
+        "mean_us": round(sum(ordered) / len(ordered) * 1e6, 3),
+        "max_us": round(ordered[-1] * 1e6, 3),
+    }
+
+
+def emit(name, results):
+    print(json.dumps({"benchmark": name, "python": sys.version.split(" ")[0], "results": results}, indent=4))
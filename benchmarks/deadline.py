@@ -0,0 +1,107 @@
+"""
+Resolves `--devices` unknown device IDs through `PCIIDs.get_items`, against
+sources which take `--latency` seconds to answer, with and without a deadline
+(see `--deadline`) of `--seconds`; reporting how long the batch took, and
+how many devices were resolved, or left unresolved because of it.
+
+Both sources are served locally, in place of devicehunt and pci-ids.ucw.cz.
+
+    python -m benchmarks.deadline [--devices 16] [--latency 3] [--seconds 2]
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks._common import emit, timed
+
+
+def serve(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+
+            body = b"<h3 class=\"--type-device\">\nI210 Gigabit Network Connection</h3>\n"
+
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=3)
+    parser.add_argument("--seconds", type=float, default=2)
+    args = parser.parse_args()
+
+    from src import info
+    from src.managers.pciids import DH_FIELDS, PCIIDs
+    from src.util.deadline import Deadline, DeadlineExceeded
+    from src.util.network import Network as network
+    from src.util.scraper import scrape
+
+    server = serve(args.latency)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    class LocalPCIIDs(PCIIDs):
+        def get_item_dh(self, dev, ven="any", types="pci"):
+            return scrape(f"{base}/dh/{ven}/{dev}", DH_FIELDS, timeout=30)[1]
+
+        def get_item_pi(self, dev, ven="any"):
+            return scrape(f"{base}/pi/{ven}/{dev}", DH_FIELDS, timeout=30)[1]
+
+    network.connected = True
+
+    # Lookups are slow on purpose; only the deadline should cut them short.
+    info.network_budget = 1e9
+    info.requests_timeout = 30
+
+    # IDs no local database knows.
+    keys = [(f"{0xf000 + i:04x}", "fffe", "pci") for i in range(args.devices)]
+    results = {}
+
+    try:
+        for mode, seconds in (("no_deadline", None), ("deadline", args.seconds)):
+            Deadline.start()
+            Deadline.set(seconds)
+            Deadline.degraded.clear()
+
+            # Circuits opened by lookups cut short don't carry over.
+            network.circuits.clear()
+
+            data, elapsed = timed(LocalPCIIDs().get_items, keys)
+
+            results[mode] = {
+                "seconds": round(elapsed, 3),
+                "resolved": sum(1 for value in data.values() if isinstance(value, dict) and value.get("device")),
+                "unresolved": sum(1 for value in data.values() if isinstance(value, DeadlineExceeded)),
+            }
+    finally:
+        Deadline.set(None)
+        server.shutdown()
+
+    emit("deadline", {
+        "devices": args.devices,
+        "latency": args.latency,
+        "deadline": args.seconds,
+        "reserve": info.deadline_reserve,
+        "modes": results,
+    })
+
+
+if __name__ == "__main__":
+    main()
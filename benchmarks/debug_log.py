@@ -0,0 +1,85 @@
+"""
+Compares writing `--lines` debug lines the way `Debugger.log_dbg` used to
+(opening, appending to and closing the log, and compiling the ANSI regex,
+for every line) against the queued, batched, logging backend.
+
+Only the time spent by the calling thread is measured for the latter, as
+that's what the collectors wait on; the background thread's time to drain
+the queue is reported separately.
+
+    python -m benchmarks.debug_log [--lines 20000]
+"""
+import argparse
+import os
+import re
+import shutil
+import tempfile
+import time
+
+from benchmarks._common import emit
+
+
+def legacy(path, lines):
+    for line in lines:
+        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+        with open(path, "a") as file:
+            file.write(ansi_escape.sub("", line) + "\n")
+            file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=20000)
+    args = parser.parse_args()
+
+    from src.info import color_text
+    from src.util.debugger import DebuggerInst
+    from src.util.log_backend import LogBackend as log_backend
+
+    lines = [
+        color_text(f"--> [PCI/ACPI]: Successfully constructed PCI/ACPI path(s) #{n}! — (SYS_FS)", "green")
+        for n in range(args.lines)
+    ]
+
+    root = tempfile.mkdtemp()
+
+    try:
+        start = time.perf_counter()
+        legacy(os.path.join(root, "legacy.txt"), lines)
+        before = time.perf_counter() - start
+
+        debugger = DebuggerInst()
+        debugger.file = os.path.join(root, "queued.txt")
+        debugger.toggle(True)
+        debugger.log_dbg("")
+
+        # Only time writing to the log, not printing.
+        logger = debugger.logger
+
+        start = time.perf_counter()
+
+        for line in lines:
+            logger.debug(line)
+
+        after = time.perf_counter() - start
+
+        log_backend.stop()
+        drained = time.perf_counter() - start
+
+        with open(os.path.join(root, "legacy.txt"), "rb") as a, open(debugger.file, "rb") as b:
+            if a.read() != b.read()[1:]:
+                raise SystemExit("The queued backend wrote a different log!")
+
+        emit("debug_log", {
+            "lines": args.lines,
+            "before_ms": round(before * 1e3, 3),
+            "after_ms": round(after * 1e3, 3),
+            "after_including_drain_ms": round(drained * 1e3, 3),
+        })
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Compares dumping to every format the way `FlagParser` used to (`tree`,
+`json.dumps`, `dicttoxml` and `plistlib`, one after another, each walking
+the information and writing straight into the dump) against `export`,
+which puts `_meta` together once and writes every format atomically, in
+a thread each.
+
+The information is synthetic: `--devices` devices, split across categories
+shaped like the collectors' output.
+
+    python -m benchmarks.export [--devices 2000] [--rounds 5]
+"""
+import argparse
+import json
+import logging
+import os
+import plistlib
+import shutil
+import tempfile
+from types import SimpleNamespace
+
+from benchmarks._common import emit, summary, timed
+
+
+def info(devices):
+    per = max(devices // 4, 1)
+
+    return {
+        "CPU": [{
+            "Intel(R) Core(TM) i9-9900K CPU @ 3.60GHz": {
+                "Codename": "Coffee Lake",
+                "SSE": "SSE4.2",
+                "SSSE3": "Supported",
+                "Cores": 8,
+                "Threads": 16,
+            }
+        }],
+        "GPU": [{
+            f"GPU #{n}": {
+                "Device ID": "0x3E98",
+                "Vendor": "0x8086",
+                "PCI Path": f"PciRoot(0x0)/Pci(0x2,0x{n % 8:X})",
+                "ACPI Path": f"\\_SB.PC00.GFX{n}",
+            }
+        } for n in range(per)],
+        "Network": [{
+            f"Ethernet Controller #{n}": {
+                "Device ID": "0x15BC",
+                "Vendor": "0x8086",
+                "Subsystem": {"Device ID": "0x0000", "Vendor": "0x8086"},
+            }
+        } for n in range(per)],
+        "Storage": [{
+            f"NVMe SSD #{n}": {
+                "Type": "Non-Volatile Memory Express (NVMe)",
+                "Connector": "PCIe",
+                "Location": "Internal",
+                "Size": 512110190592,
+                "Removable": False,
+            }
+        } for n in range(per)],
+        "Input": [{
+            f"Input Device <{n}> & co.": {"Bus": "USB", "Vendor": "0x046D", "Protocol": "HID"}
+        } for n in range(per)],
+    }
+
+
+def legacy(info, root):
+    import dicttoxml
+
+    from src.util.tree import tree
+
+    dicttoxml.LOG.setLevel(logging.ERROR)
+
+    with open(os.path.join(root, "info_dump.txt"), "w", encoding="utf-8") as file:
+        for key in info:
+            file.write(tree(key, info[key], color=False))
+            file.write("\n")
+
+    with open(os.path.join(root, "info_dump.json"), "w") as file:
+        file.write(json.dumps(info, indent=4, sort_keys=False))
+
+    with open(os.path.join(root, "info_dump.xml"), "wb") as file:
+        file.write(dicttoxml.dicttoxml(info, root=True))
+
+    with open(os.path.join(root, "info_dump.plist"), "wb") as file:
+        plistlib.dump(info, file, sort_keys=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    from src.error.logger import Logger
+    from src.util.dump_functions.export import FILES, export
+
+    data = info(args.devices)
+    root = tempfile.mkdtemp(prefix="ocsysinfo-export-")
+
+    try:
+        logger = Logger(root)
+        before, after = os.path.join(root, "legacy"), os.path.join(root, "export")
+
+        os.makedirs(before)
+        os.makedirs(after)
+
+        dm = SimpleNamespace(info=data)
+        targets = [(format, after) for format in FILES]
+
+        results = {
+            "devices": args.devices,
+            "legacy": summary([timed(legacy, data, before)[1] for _ in range(args.rounds)]),
+            "export": summary([timed(export, dm, targets, logger)[1] for _ in range(args.rounds)]),
+            "identical": {},
+        }
+
+        for format, name in FILES.items():
+            with open(os.path.join(before, name), "rb") as a, open(os.path.join(after, name), "rb") as b:
+                results["identical"][format] = a.read() == b.read()
+    finally:
+        shutil.rmtree(root)
+
+    results["speedup"] = round(results["legacy"]["median_us"] / results["export"]["median_us"], 2)
+
+    emit("export", results)
+
+
+if __name__ == "__main__":
+    main()
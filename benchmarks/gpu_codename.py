@@ -0,0 +1,110 @@
+"""
+Compares GPU codename lookups through the generated `gpu_index` against
+the linear scan over the `amd_gpu`/`nvidia_gpu` literal tables it replaced:
+import time, lookup time and memory allocated by the import (plus, for
+the index, building it).
+
+    python -m benchmarks.gpu_codename [--rounds 1000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks._common import emit, summary, timed
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IDS = [
+    ("0x6780", "0x1002"),  # Tahiti (first entry)
+    ("0x731f", "0x1002"),  # Navi 10
+    ("0x1b80", "0x10de"),  # GP104
+    ("0x2484", "0x10de"),  # GA104
+    ("0xffff", "0x10de"),  # Unknown (full scan)
+]
+
+IMPORT = """
+import json, sys, time, tracemalloc
+# Shared by both; not what's being measured.
+import src.info, src.util.debugger
+tracemalloc.start()
+start = time.perf_counter()
+if sys.argv[1] == "before":
+    from src.uarch.gpu.amd_gpu import amd
+    from src.uarch.gpu.nvidia_gpu import nvidia
+else:
+    from src.util.codename import _gpu_index
+    _gpu_index()
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "bytes": tracemalloc.get_traced_memory()[0]}))
+"""
+
+
+def legacy(dev, ven):
+    """The linear scan `src.util.codename.gpu` used to do."""
+
+    if "1002" in ven:
+        from src.uarch.gpu.amd_gpu import amd as items
+    else:
+        from src.uarch.gpu.nvidia_gpu import nvidia as items
+
+    for uarch in items:
+        for id in uarch.get("IDs", []):
+            if (
+                id.get("Vendor", "").lower() == ven.lower()
+                and id.get("Device", "").lower() == dev.lower()
+            ):
+                return uarch.get("Codename")
+
+    return ""
+
+
+def imported(variant, rounds=5):
+    runs = []
+
+    for _ in range(rounds):
+        # `-B`, so that no bytecode is written, but both read
+        # whatever is already cached – as a normal launch would.
+        proc = subprocess.run(
+            [sys.executable, "-B", "-c", IMPORT, variant],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+
+        runs.append(json.loads(proc.stdout))
+
+    runs.sort(key=lambda x: x["seconds"])
+
+    return {
+        "import": summary([x["seconds"] for x in runs]),
+        "allocated_bytes": runs[len(runs) // 2]["bytes"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    from src.util.codename import gpu
+
+    for dev, ven in IDS:
+        if (gpu(dev, ven) or "") != legacy(dev, ven):
+            raise SystemExit(f"Mismatch for {ven}:{dev}!")
+
+    results = {}
+
+    for variant, func in (("before", legacy), ("after", gpu)):
+        samples = []
+
+        for _ in range(args.rounds):
+            for dev, ven in IDS:
+                samples.append(timed(func, dev, ven)[1])
+
+        results[variant] = imported(variant) | {"lookup": summary(samples)}
+
+    emit("gpu_codename", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Compares asking a secondary source only once the primary one didn't answer
+(as `PCIIDs.get_item` and the ARK lookups used to) against `hedge`, which
+also asks it after `--delay` seconds without an answer, or right away.
+
+Both sources are served locally, each answering (or not) after a set
+latency; for each scenario, reports how long a lookup takes, and how many
+requests were made for it.
+
+    python -m benchmarks.hedging [--delay 0.25] [--rounds 5]
+"""
+import argparse
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._common import emit, summary, timed
+
+# (primary, secondary): how long each takes, and whether it knows the answer.
+SCENARIOS = {
+    "primary_fast": ((0.05, True), (0.05, True)),
+    "primary_slow": ((1.5, True), (0.1, True)),
+    "primary_misses": ((0.4, False), (0.1, True)),
+}
+
+
+def serve(hits):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlsplit(self.path).query)
+            hits[0] += 1
+
+            time.sleep(float(query["latency"][0]))
+
+            if query["known"][0] != "1":
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            body = b"<h3 class=\"--type-device\">\nI210 Gigabit Network Connection</h3>\n"
+
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--delay", type=float, default=0.25)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    from src import info
+    from src.util.hedging import Latency, hedge
+    from src.util.network import Network as network
+    from src.util.scraper import Field, scrape
+
+    fields = [Field("device", re.compile(r"--type-device"), following=True)]
+    hits = [0]
+    server = serve(hits)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    network.connected = True
+
+    # Lookups are slow on purpose; and there are plenty.
+    info.network_budget = 1e9
+
+    def lookup(latency, known):
+        url = f"{base}/?latency={latency}&known={int(known)}"
+
+        return scrape(url, fields, timeout=30)[1] or None
+
+    results = {}
+
+    try:
+        for name, (primary, secondary) in SCENARIOS.items():
+            attempts = [
+                (f"{name}/primary", lambda: lookup(*primary)),
+                (f"{name}/secondary", lambda: lookup(*secondary)),
+            ]
+            results[name] = {}
+
+            for mode, delay in (("sequential", -1), ("hedged", args.delay), ("immediate", 0)):
+                Latency.sources.clear()
+                hits[0] = 0
+
+                samples = []
+
+                for _ in range(args.rounds):
+                    answer, seconds = timed(hedge, attempts, delay=delay)
+                    samples.append(seconds)
+
+                    if not answer:
+                        raise SystemExit(f"No answer in '{name}' ({mode})!")
+
+                results[name][mode] = {
+                    "time": summary(samples),
+                    "requests_per_lookup": round(hits[0] / args.rounds, 2),
+                }
+    finally:
+        server.shutdown()
+
+    emit("hedging", {"delay": args.delay, "scenarios": results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Measures the startup cost of the dependency check with `python -X importtime`:
+the cumulative import time of `src.util.missing_dep`, and the wall time of
+`Requirements.test_req` on a cold (no cached verdict) and a warm start.
+
+For reference, the import time of `pkg_resources` (which the check
+used to be built on) is reported as well, if it's installed.
+
+    python -m benchmarks.importtime [--rounds 5]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+from benchmarks._common import emit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import time: self [us] | cumulative | imported package
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+CHECK = """
+import sys, time
+from src.util.missing_dep import Requirements
+start = time.perf_counter()
+Requirements(sys.argv[1]).test_req()
+print(time.perf_counter() - start)
+"""
+
+
+def importtime(code, *args):
+    """
+    Runs `code` in a fresh interpreter, returning the cumulative import time
+    (in microseconds) of every top-level import it made – anything imported
+    by the interpreter's own startup is left out – and whatever it printed.
+    """
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+
+    total = 0
+    startup = True
+
+    for match in _LINE.finditer(proc.stderr):
+        # Only top-level imports; nested ones are included in their cumulative time.
+        if len(match.group(3)) != 1:
+            continue
+
+        # `site` is the last module imported during the interpreter's startup.
+        if startup:
+            startup = match.group(4) != "site"
+            continue
+
+        total += int(match.group(2))
+
+    return total, proc.stdout.strip()
+
+
+def median(values):
+    values = sorted(values)
+
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    cold, warm = [], []
+
+    for _ in range(args.rounds):
+        cache = tempfile.mkdtemp()
+
+        cold.append(importtime(CHECK, cache))
+        warm.append(importtime(CHECK, cache))
+
+    results["missing_dep"] = {
+        "cold_import_us": median(x[0] for x in cold),
+        "cold_check_us": round(median(float(x[1]) for x in cold) * 1e6, 1),
+        "warm_import_us": median(x[0] for x in warm),
+        "warm_check_us": round(median(float(x[1]) for x in warm) * 1e6, 1),
+    }
+
+    try:
+        results["pkg_resources"] = {
+            "import_us": median(
+                importtime("import pkg_resources")[0] for _ in range(args.rounds)
+            )
+        }
+    except subprocess.CalledProcessError:
+        results["pkg_resources"] = None
+
+    emit("importtime", results)
+
+
+if __name__ == "__main__":
+    main()
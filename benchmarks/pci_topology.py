@@ -0,0 +1,136 @@
+"""
+Compares PCI path construction through `PCITopology` against the
+per-device scan of `/sys/bus/pci/devices` it replaced, on a synthetic
+sysfs tree: `--domains` PCI domains (sockets), each with `--ports` root
+ports behind which sits a PCIe switch with 8 downstream ports, each
+connected to a 4-function endpoint.
+
+    python -m benchmarks.pci_topology [--domains 2] [--ports 16] [--lookups 100]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+
+from benchmarks._common import emit, summary, timed
+
+
+def build_tree(root, domains, ports):
+    """
+    Creates `devices/pciDDDD:00/...` and the `bus/pci/devices/<slot>`
+    symlinks pointing into it, returning the slots of every endpoint.
+    """
+
+    links = os.path.join(root, "bus", "pci", "devices")
+    os.makedirs(links)
+
+    endpoints = []
+    count = 0
+
+    def add(parent, slot):
+        nonlocal count
+
+        path = os.path.join(parent, slot)
+        os.makedirs(os.path.join(path, "firmware_node"))
+
+        with open(os.path.join(path, "firmware_node", "path"), "w") as file:
+            file.write("\\_SB_.PCI0\n")
+
+        with open(os.path.join(path, "uevent"), "w") as file:
+            file.write(f"DRIVER=pcieport\nPCI_SLOT_NAME={slot}\n")
+
+        os.symlink(path, os.path.join(links, slot))
+        count += 1
+
+        return path
+
+    for domain in range(domains):
+        host = os.path.join(root, "devices", f"pci{domain:04x}:00")
+        bus = 1
+
+        for port in range(ports):
+            rp = add(host, f"{domain:04x}:00:{port:02x}.0")
+            upstream = add(rp, f"{domain:04x}:{bus:02x}:00.0")
+            down_bus = bus + 1
+
+            for down in range(8):
+                dp = add(upstream, f"{domain:04x}:{down_bus:02x}:{down:02x}.0")
+                ep_bus = down_bus + 1 + down
+
+                for function in range(4):
+                    slot = f"{domain:04x}:{ep_bus:02x}:00.{function}"
+                    add(dp, slot)
+                    endpoints.append(slot)
+
+            bus = down_bus + 9
+
+    return endpoints, count
+
+
+def legacy(sysfs, slot):
+    """The path construction `pci_from_acpi_linux` used to do."""
+
+    from src.util.pci_root import _get_valid
+
+    devices = os.path.join(sysfs, "bus", "pci", "devices")
+    pcip = f"PciRoot({hex(int(slot.split(':')[0], 16))})"
+    children = []
+    paths = [",".join(_get_valid(slot))]
+
+    for path in os.listdir(devices):
+        if slot in os.listdir(os.path.join(devices, path)):
+            children.append(path)
+
+    for child in children:
+        paths.append(",".join(_get_valid(child)))
+
+    for comp in sorted(paths, reverse=True):
+        pcip += f"/Pci({comp})"
+
+    return pcip
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--domains", type=int, default=2)
+    parser.add_argument("--ports", type=int, default=16)
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args()
+
+    from src.util.pci_root import PCITopology
+
+    root = tempfile.mkdtemp()
+
+    try:
+        endpoints, count = build_tree(root, args.domains, args.ports)
+
+        # Spread the lookups over the whole tree.
+        step = max(len(endpoints) // args.lookups, 1)
+        targets = endpoints[::step][:args.lookups]
+
+        before = [timed(legacy, root, slot)[1] for slot in targets]
+
+        topology = PCITopology(sysfs=root)
+        _, index = timed(topology.build)
+        after = [timed(topology.pci_path, slot)[1] for slot in targets]
+
+        emit("pci_topology", {
+            "functions": count,
+            "lookups": len(targets),
+            "before": {
+                "total_ms": round(sum(before) * 1e3, 3),
+                "lookup": summary(before),
+            },
+            "after": {
+                "total_ms": round((index + sum(after)) * 1e3, 3),
+                "index_ms": round(index * 1e3, 3),
+                "lookup": summary(after),
+            },
+            "example": topology.pci_path(targets[-1]),
+        })
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compares lookup latency and resident memory of the local `pci.ids`
+resolver against the HTTP (devicehunt/pci-ids.ucw.cz) path.
+
+    python -m benchmarks.pciids [--ids 8086:1533,10de:1b80] [--rounds 1000] [--database <pci.ids>] [--http]
+"""
+import argparse
+import tracemalloc
+
+from benchmarks._common import emit, rss, summary, timed
+
+DEFAULT_IDS = [
+    ("8086", "1533"),  # Intel I210
+    ("8086", "15b8"),  # Intel I219-V
+    ("10de", "1b80"),  # NVIDIA GP104
+    ("1002", "731f"),  # AMD Navi 10
+    ("10ec", "8168"),  # Realtek RTL8111
+    ("144d", "a808"),  # Samsung NVMe
+    ("8086", "a170"),  # Intel HDA
+    ("dead", "beef"),  # Unknown
+]
+
+
+def bench_local(ids, rounds, database=None):
+    from src.util.pci_ids_db import IDDatabase, PCI_IDS_PATHS
+
+    db = IDDatabase([database] if database else PCI_IDS_PATHS)
+    before = rss()
+
+    tracemalloc.start()
+
+    _, cold = timed(db.lookup, ids[0][1], ids[0][0])
+
+    samples = []
+
+    for _ in range(rounds):
+        for ven, dev in ids:
+            samples.append(timed(db.lookup, dev, ven)[1])
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "database": db.path,
+        "cold_first_lookup_us": round(cold * 1e6, 3),
+        "lookup": summary(samples),
+        "python_peak_bytes": peak,
+        "rss_delta_bytes": rss() - before,
+        "resolved": {f"{ven}:{dev}": db.lookup(dev, ven).get("device") for ven, dev in ids},
+    }
+
+
+def bench_http(ids):
+    from src.managers.pciids import PCIIDs
+
+    pci = PCIIDs()
+    before = rss()
+    samples = []
+    failed = 0
+
+    for ven, dev in ids:
+        def lookup():
+            data = pci.get_item_dh(dev, ven)
+
+            return data or pci.get_item_pi(dev, ven)
+
+        try:
+            samples.append(timed(lookup)[1])
+        except Exception:
+            failed += 1
+
+    return {
+        "lookup": summary(samples),
+        "failed": failed,
+        "rss_delta_bytes": rss() - before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ids", help="comma-separated list of VENDOR:DEVICE pairs")
+    parser.add_argument("--rounds", type=int, default=1000)
+    parser.add_argument("--database", help="path to a `pci.ids` file (defaults to the system's)")
+    parser.add_argument("--http", action="store_true", help="also benchmark the HTTP path (needs network)")
+    args = parser.parse_args()
+
+    ids = DEFAULT_IDS
+
+    if args.ids:
+        ids = [tuple(pair.split(":")) for pair in args.ids.split(",")]
+
+    results = {"local": bench_local(ids, args.rounds, args.database)}
+
+    if args.http:
+        results["http"] = bench_http(ids)
+
+    emit("pciids", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""
+Scaling benchmark for the Linux collectors.
+
+Generates synthetic sysfs/procfs trees of growing size (see `tree.SIZES`
+for those of a `--scale` of 1), replays them through `--sysroot`, and
+reports the time, peak traced memory and amount of files opened
+and directories listed, per collector, as the amount of devices grows.
+
+Device names are resolved offline, from the bundled `pci.ids`/`usb.ids`,
+so no network lookups are made.
+
+    python -m benchmarks.scaling [--scale 0.125,0.25,0.5,1] [--rounds 3]
+                                 [--save <results.json>]
+"""
@@ -0,0 +1,154 @@
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from types import SimpleNamespace
+
+from benchmarks._common import emit, summary, timed
+from benchmarks.scaling.tree import generate, scaled
+
+# Filesystem accesses made while `_counts` is set, by audit event.
+_counts = None
+
+
+def _audit(event, args):
+    if _counts is not None and event in ("open", "os.listdir", "os.scandir"):
+        _counts[event] = _counts.get(event, 0) + 1
+
+
+def measure(func, rounds):
+    """
+    Times `rounds` calls to `func`, then makes one more with allocations
+    traced and filesystem accesses counted.
+    """
+
+    global _counts
+
+    samples = [timed(func)[1] for _ in range(rounds)]
+
+    _counts = {}
+    tracemalloc.start()
+
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        counts, _counts = _counts, None
+
+    return {
+        "time": summary(samples),
+        "peak_kib": round(peak / 1024, 1),
+        "opens": counts.get("open", 0),
+        "listings": counts.get("os.listdir", 0) + counts.get("os.scandir", 0),
+    }
+
+
+def run(sizes, rounds, logger, pci):
+    from src.dumps.Linux.linux import LinuxHardwareManager
+    from src.dumps.Linux.pci_scan import PCIScanner
+    from src.util.pci_root import PCITopology, pci_from_acpi_linux
+    from src.util.sysfs_reader import SysfsReader
+    from src.util.sysroot import Sysroot as sysroot
+
+    root = tempfile.mkdtemp(prefix="ocsysinfo-scaling-")
+
+    try:
+        tree = generate(root, sizes)
+        sysroot.set(root)
+
+        def manager():
+            parent = SimpleNamespace(
+                info={}, pci=pci, logger=logger, offline=True, off_data=[], serial=True
+            )
+            manager = LinuxHardwareManager(parent)
+            manager.sysfs = SysfsReader()
+            manager.pci_topology = PCITopology(reader=manager.sysfs)
+            manager.pci_scanner = PCIScanner(manager.sysfs)
+
+            return manager
+
+        results = {}
+
+        for _, collector, _ in LinuxHardwareManager.COLLECTORS:
+            results[collector] = measure(lambda: getattr(manager(), collector)(), rounds)
+
+        # Shared by the collectors of PCI devices; included in each of their measurements above.
+        results["pci_scan"] = measure(lambda: PCIScanner().scan(), rounds)
+
+        def collected():
+            linux = manager()
+
+            for _, collector, _ in LinuxHardwareManager.COLLECTORS:
+                getattr(linux, collector)()
+
+            return linux
+
+        # Only the enrichment stage itself is measured.
+        pending = [collected() for _ in range(rounds + 1)]
+        lookups = len(pending[0].lookups)
+
+        results["enrich"] = measure(lambda: pending.pop().enrich(), rounds)
+        results["enrich"]["lookups"] = lookups
+
+        def paths():
+            topology = PCITopology()
+
+            for slot in tree.functions:
+                pci_from_acpi_linux(f"/sys/bus/pci/devices/{slot}", logger, topology)
+
+        results["pci_from_acpi_linux"] = measure(paths, rounds)
+        results["dump"] = measure(lambda: manager().dump(), rounds)
+
+        detected = manager()
+        detected.dump()
+    finally:
+        sysroot.root = ""
+        shutil.rmtree(root)
+
+    return {
+        "sizes": {**sizes, "pci_functions": len(tree.functions)},
+        "detected": {
+            category: len(value) for category, value in detected.info.items()
+            if isinstance(value, list)
+        },
+        "collectors": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", default="0.125,0.25,0.5,1")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--save", default="")
+    args = parser.parse_args()
+
+    sys.addaudithook(_audit)
+
+    from src.error.logger import Logger
+    from src.managers.pciids import PCIIDs
+
+    logs = tempfile.mkdtemp(prefix="ocsysinfo-scaling-logs-")
+
+    try:
+        logger = Logger(logs)
+        pci = PCIIDs(offline=True)
+
+        results = [
+            {"scale": float(scale), **run(scaled(float(scale)), args.rounds, logger, pci)}
+            for scale in args.scale.split(",")
+        ]
+    finally:
+        shutil.rmtree(logs, ignore_errors=True)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=4)
+
+    emit("scaling", results)
+
+
+if __name__ == "__main__":
+    main()
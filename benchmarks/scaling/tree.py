@@ -0,0 +1,243 @@
+"""
+Generates synthetic sysfs/procfs trees, laid out the way the Linux
+collectors expect them, to be replayed through `Sysroot`.
+"""
+import os
+import struct
+
+from benchmarks.smbios import memory_device, structure
+
+# Sizes of a "big box"; scaled by `--scale`.
+SIZES = {
+    "cpus": 512,
+    "nics": 64,
+    "vfs": 8,
+    "nvme": 200,
+    "gpus": 8,
+    "audio": 8,
+    "inputs": 32,
+    "dimms": 32,
+    "functions": 1024,
+}
+
+# Namespaces per NVMe controller
+NAMESPACES = 8
+
+CPUINFO = """processor\t: {n}
+vendor_id\t: GenuineIntel
+cpu family\t: 6
+model\t\t: 143
+model name\t: Intel(R) Xeon(R) Platinum 8480+
+stepping\t: 8
+physical id\t: {socket}
+siblings\t: 112
+core id\t\t: {core}
+cpu cores\t: 56
+flags\t\t: fpu vme de pse tsc msr pae mce cx8 apic sep mtrr pge mca cmov pat sse sse2 ssse3 sse4_1 sse4_2 avx avx2 avx512f
+"""
+
+
+def config(ven, dev, cls):
+    """The (unprivileged) 64 byte configuration header of a function."""
+
+    header = bytearray(64)
+    struct.pack_into("<HH4xBBBB", header, 0, ven, dev, 0x01, cls & 0xFF, (cls >> 8) & 0xFF, cls >> 16)
+
+    # Bridges have a type 1 header, without a subsystem.
+    if cls >> 8 == 0x0604:
+        header[0x0E] = 0x01
+    else:
+        struct.pack_into("<HH", header, 0x2C, ven, 0x0001)
+
+    return bytes(header)
+
+
+def scaled(scale):
+    """`SIZES`, scaled; the amount of VFs per NIC stays the same."""
+
+    return {
+        key: value if key == "vfs" else max(int(value * scale), 1)
+        for key, value in SIZES.items()
+    }
+
+
+class Tree:
+    """
+    A synthetic tree under `root`: PCI functions (each behind its own root
+    port), and the class devices, block devices, input devices, CPUs and
+    SMBIOS table referring to them.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.functions = []
+        self.domain = 0
+        self.port = 0
+        self.bus = 1
+
+    def path(self, path):
+        return os.path.join(self.root, path.lstrip("/"))
+
+    def write(self, path, data):
+        path = self.path(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "wb" if isinstance(data, bytes) else "w") as file:
+            file.write(data)
+
+    def link(self, path, target):
+        """Symlinks `path` to the absolute `target`, relatively; as sysfs does."""
+
+        path = self.path(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.symlink(os.path.relpath(self.path(target), os.path.dirname(path)), path)
+
+    def function(self, parent, slot, ven, dev, cls):
+        path = f"{parent}/{slot}"
+
+        self.write(f"{path}/vendor", f"0x{ven:04x}\n")
+        self.write(f"{path}/device", f"0x{dev:04x}\n")
+        self.write(f"{path}/class", f"0x{cls:06x}\n")
+        self.write(f"{path}/config", config(ven, dev, cls))
+        self.write(f"{path}/uevent", f"DRIVER=synthetic\nPCI_CLASS={cls:X}\nPCI_SLOT_NAME={slot}\n")
+        self.write(f"{path}/firmware_node/path", "\\_SB_.PC00.RP01\n")
+        self.link(f"/sys/bus/pci/devices/{slot}", path)
+        self.functions.append(slot)
+
+        return path
+
+    def endpoint(self, ven, dev, cls, functions=1):
+        """
+        Adds a root port, and a device with `functions` functions behind it;
+        returning their paths.
+        """
+
+        if self.port == 32 * 8 or self.bus + (functions + 7) // 8 > 0xFF:
+            self.domain += 1
+            self.port = 0
+            self.bus = 1
+
+        host = f"/sys/devices/pci{self.domain:04x}:00"
+        rp = self.function(
+            host, f"{self.domain:04x}:00:{self.port // 8:02x}.{self.port % 8}", 0x8086, 0x352A, 0x060400
+        )
+
+        paths = [
+            self.function(rp, f"{self.domain:04x}:{self.bus:02x}:{n // 8:02x}.{n % 8}", ven, dev, cls)
+            for n in range(functions)
+        ]
+
+        self.port += 1
+        self.bus += 1
+
+        return paths
+
+    def cpus(self, count):
+        self.write("/proc/cpuinfo", "\n".join(
+            CPUINFO.format(n=n, socket=n // 112, core=(n % 112) // 2)
+            for n in range(count)
+        ))
+
+    def board(self):
+        self.write("/sys/devices/virtual/dmi/id/board_name", "Synthetic Board\n")
+        self.write("/sys/devices/virtual/dmi/id/board_vendor", "OCSysInfo\n")
+
+    def nics(self, count, vfs):
+        self.link("/sys/class/net/lo", "/sys/devices/virtual/net/lo")
+        self.write("/sys/devices/virtual/net/lo/type", "772\n")
+
+        iface = 0
+
+        for _ in range(count):
+            # Physical function, followed by its virtual functions
+            for path in self.endpoint(0x8086, 0x1592, 0x020000, 1 + vfs):
+                self.link(f"/sys/class/net/eth{iface}", f"{path}/net/eth{iface}")
+                self.link(f"{path}/net/eth{iface}/device", path)
+                iface += 1
+
+    def gpus(self, count):
+        for n in range(count):
+            path = self.endpoint(0x10DE, 0x2330, 0x030200)[0]
+
+            self.link(f"/sys/class/drm/card{n}", f"{path}/drm/card{n}")
+            self.link(f"{path}/drm/card{n}/device", path)
+            self.link(f"/sys/class/drm/card{n}-DP-1", f"{path}/drm/card{n}/card{n}-DP-1")
+
+    def audio(self, count):
+        for n in range(count):
+            path = self.endpoint(0x8086, 0x51C8, 0x040300)[0]
+
+            self.link(f"/sys/class/sound/card{n}", f"{path}/sound/card{n}")
+            self.link(f"{path}/sound/card{n}/device", path)
+            self.write(f"{path}/hdaudioC{n}D0/chip_name", "ALC897\n")
+
+    def nvme(self, namespaces):
+        controllers = (namespaces + NAMESPACES - 1) // NAMESPACES
+
+        for n in range(controllers):
+            path = self.endpoint(0x144D, 0xA80A, 0x010802)[0]
+            ctrl = f"{path}/nvme/nvme{n}"
+
+            self.write(f"{ctrl}/model", "SAMSUNG MZQL23T8HCLS\n")
+            self.link(f"{ctrl}/device", path)
+
+            for ns in range(1, min(NAMESPACES, namespaces - n * NAMESPACES) + 1):
+                disk = f"{ctrl}/nvme{n}n{ns}"
+
+                self.write(f"{disk}/queue/rotational", "0\n")
+                self.write(f"{disk}/removable", "0\n")
+                self.link(f"{disk}/device", ctrl)
+                self.link(f"/sys/block/nvme{n}n{ns}", disk)
+
+    def inputs(self, count):
+        xhci = self.endpoint(0x8086, 0x7AE0, 0x0C0330)[0]
+        devices = []
+
+        for n in range(count):
+            sysfs = f"{xhci}/usb1/1-{n + 1}/1-{n + 1}:1.0/0003:046D:C52B.{n + 1:04X}/input/input{n}"
+
+            self.write(f"{sysfs}/name", "Logitech USB Receiver\n")
+            self.write(f"{sysfs}/id/vendor", "046d\n")
+            self.write(f"{sysfs}/id/product", "c52b\n")
+
+            devices.append(
+                f"I: Bus=0003 Vendor=046d Product=c52b Version=0111\n"
+                f"N: Name=\"Logitech USB Receiver\"\n"
+                f"S: Sysfs={sysfs[len('/sys'):]}\n"
+                f"H: Handlers=kbd event{n}\n"
+            )
+
+        self.write("/proc/bus/input/devices", "\n".join(devices))
+
+    def smbios(self, dimms):
+        table = b"".join(memory_device(n, n) for n in range(dimms))
+        table += structure(127, dimms, b"", [])
+
+        entry = b"_SM3_" + bytes([0, 0x18]) + bytes(0x18 - 7)
+
+        self.write("/sys/firmware/dmi/tables/smbios_entry_point", entry)
+        self.write("/sys/firmware/dmi/tables/DMI", table)
+
+    def filler(self, total):
+        """Pads the amount of PCI functions up to `total`, with ones no collector reads."""
+
+        while len(self.functions) < total:
+            self.endpoint(0x8086, 0x1BC9, 0x088000)
+
+
+def generate(root, sizes):
+    """Generates a tree of the given `sizes` (see `SIZES`) under `root`."""
+
+    tree = Tree(root)
+
+    tree.cpus(sizes["cpus"])
+    tree.board()
+    tree.nics(sizes["nics"], sizes["vfs"])
+    tree.gpus(sizes["gpus"])
+    tree.audio(sizes["audio"])
+    tree.nvme(sizes["nvme"])
+    tree.inputs(sizes["inputs"])
+    tree.smbios(sizes["dimms"])
+    tree.filler(sizes["functions"])
+
+    return tree
@@ -0,0 +1,200 @@
+"""
+Compares scraping devicehunt, pci-ids.ucw.cz, Intel ARK and WikiChip the
+way their lookups used to (downloading the whole page, then searching it)
+against `scrape`, which stops reading as soon as it has what it needs.
+
+Pages are synthetic, shaped like each site's, with `--tail` KiB of markup
+after the fields looked for; and served locally, at about `--bandwidth`
+MB/s. Checks that both capture the same values.
+
+    python -m benchmarks.scraper [--tail 256] [--bandwidth 10] [--rounds 5]
+"""
+import argparse
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks._common import emit, summary, timed
+
+FILLER = "<div class=\"row\"><span>Lorem ipsum dolor sit amet</span></div>\n"
+
+PAGES = {
+    "devicehunt": (
+        "<html>\n<body>\n"
+        "<h3 class=\"details__heading --type-device\">\n"
+        "I210 Gigabit Network Connection</h3>\n"
+        "<h3 class=\"details__heading --type-vendor\">\n"
+        "Intel Corporation</h3>\n"
+    ),
+    "pci-ids": (
+        "<html>\n<body>\n"
+        "<div class=\"item\"><p class=\"itemname\">Name: I210 Gigabit Network Connection\n"
+    ),
+    "ark": (
+        "<html>\n<body>\n"
+        "<span class=\"value\" data-key=\"CodeNameText\">\n"
+        "    <a href=\"/content/www/us/en/ark/products/codename/97787/products-formerly-coffee-lake.html\">"
+        "Products formerly Coffee Lake</a>\n"
+    ),
+    "wikichip": (
+        "<html>\n<body>\n"
+        "<td><a href=\"/wiki/amd/cores/matisse\" title=\"amd/cores/matisse\">Matisse</a></td>\n"
+        "<td><a href=\"/wiki/amd/microarchitectures/zen_2\" title=\"amd/microarchitectures/zen 2\">Zen 2</a></td>\n"
+    ),
+}
+
+
+def legacy(name, text):
+    """What each lookup used to capture out of the whole page."""
+
+    lines = text.split("\n")
+
+    if name == "devicehunt":
+        device = {}
+        caught = None
+
+        for line in lines:
+            cond = "--type-device" in line.lower()
+            if cond or ("--type-vendor" in line.lower() and caught):
+                device["device" if cond else "vendor"] = lines[lines.index(line.lower()) + 1].split("<")[0]
+                caught = device
+
+        return device
+    elif name == "pci-ids":
+        device = ""
+
+        for line in lines:
+            if "itemname" in line.lower() and ">name" in line.lower():
+                device = line.split("Name: ")[1]
+
+        return {"device": device}
+    elif name == "ark":
+        actual = None
+
+        for index in range(len(lines)):
+            if 'data-key="CodeNameText"' in lines[index]:
+                actual = lines[index + 1].strip()
+
+        return {"codename": actual}
+
+    def first(pattern):
+        try:
+            return re.search(r"(?<=\>).+(?=\<)", re.search(pattern, text).group()).group()
+        except Exception:
+            return ""
+
+    return {
+        "Codename": first(r"\<a\s?href=\"\/wiki\/amd\/cores\/(\w|\d)+\s?(\w|\d)+?\"[^>]+\>[^<]+?\<\/a\>"),
+        "Microarchitecture": first(
+            r"\<a\s?href=\"\/wiki\/amd\/microarchitectures\/(\w|\d)+\s?(\w|\d)+?\"[^>]+\>[^<]+?\<\/a\>"
+        ),
+    }
+
+
+def current(name, url):
+    from src.managers.pciids import DH_FIELDS, PI_FIELDS
+    from src.util.ark_query import CODENAME_FIELDS
+    from src.util.scraper import scrape
+    from src.util.wc_amd_query import WC_FIELDS
+
+    fields = {
+        "devicehunt": DH_FIELDS,
+        "pci-ids": PI_FIELDS,
+        "ark": CODENAME_FIELDS,
+        "wikichip": WC_FIELDS,
+    }[name]
+
+    _, values = scrape(url, fields, timeout=30)
+
+    if name == "devicehunt":
+        return {key: value.split("<")[0] for key, value in values.items()}
+    elif name == "pci-ids":
+        return {"device": values["device"].split("Name: ")[1]}
+    elif name == "ark":
+        return {"codename": values["codename"].strip()}
+
+    return {
+        "Codename": values.get("Codename", ""),
+        "Microarchitecture": values.get("Microarchitecture") or values.get("Microarchitecture (microarch)", ""),
+    }
+
+
+def serve(pages, bandwidth):
+    chunk = 16 * 1024
+    delay = chunk / (bandwidth * 1e6)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = pages[self.path.strip("/")]
+
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+
+            try:
+                for start in range(0, len(body), chunk):
+                    self.wfile.write(body[start:start + chunk])
+                    time.sleep(delay)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client stopped reading.
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tail", type=int, default=256)
+    parser.add_argument("--bandwidth", type=float, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    from src.util.accounting import Accounting as accounting
+    from src.util.network import Network as network
+
+    tail = FILLER * (args.tail * 1024 // len(FILLER))
+    pages = {name: (head + tail + "</body>\n</html>\n").encode() for name, head in PAGES.items()}
+
+    server = serve(pages, args.bandwidth)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    network.connected = True
+    accounting.enabled = True
+
+    results = {}
+
+    try:
+        for name, body in pages.items():
+            url = f"{base}/{name}"
+
+            def whole():
+                return legacy(name, network.get(url, timeout=30).content.decode("utf-8"))
+
+            before = [timed(whole)[1] for _ in range(args.rounds)]
+
+            accounting.hosts.clear()
+            after = [timed(current, name, url)[1] for _ in range(args.rounds)]
+
+            results[name] = {
+                "page_bytes": len(body),
+                "bytes_read": accounting.hosts["127.0.0.1"][1] // args.rounds,
+                "before": summary(before),
+                "after": summary(after),
+                "speedup": round(summary(before)["median_us"] / summary(after)["median_us"], 2),
+                "identical": whole() == current(name, url),
+            }
+    finally:
+        server.shutdown()
+
+    emit("scraper", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Decodes synthetic SMBIOS tables with thousands of structures through
+`parse_smbios`, and compares reading `--dimms` type 17 entries with one
+`cat` per entry (as memory detection used to) against a single read.
+
+    python -m benchmarks.smbios [--structures 5000] [--rounds 20] [--dimms 24]
+"""
+import argparse
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+
+from benchmarks._common import emit, summary, timed
+
+
+def structure(stype, handle, formatted, strings):
+    """Builds one SMBIOS structure: header, formatted area and string set."""
+
+    data = struct.pack("<BBH", stype, 4 + len(formatted), handle) + formatted
+    data += b"".join(s.encode() + b"\0" for s in strings) or b"\0"
+
+    return data + b"\0"
+
+
+def memory_device(handle, slot):
+    # Up to (and including) the Extended Size and Configured Speed fields.
+    formatted = bytearray(0x28 - 4)
+
+    def put(offset, fmt, value):
+        struct.pack_into(fmt, formatted, offset - 4, value)
+
+    put(0x0C, "<H", 0x4000)  # 16GB
+    put(0x10, "B", 1)  # Device Locator
+    put(0x11, "B", 2)  # Bank Locator
+    put(0x12, "B", 0x22)  # DDR5
+    put(0x15, "<H", 4800)
+    put(0x17, "B", 3)  # Manufacturer
+    put(0x1A, "B", 4)  # Part Number
+
+    return structure(17, handle, bytes(formatted), [
+        f"DIMM_{slot}", f"P0_Node0_Channel{slot % 12}_Dimm{slot // 12}",
+        "Samsung", "M321R2GA3BB6-CQKET",
+    ])
+
+
+def processor(handle):
+    formatted = bytearray(0x30 - 4)
+
+    struct.pack_into("B", formatted, 0x04 - 4, 1)
+    struct.pack_into("B", formatted, 0x05 - 4, 0x03)
+    struct.pack_into("B", formatted, 0x07 - 4, 2)
+    struct.pack_into("B", formatted, 0x10 - 4, 3)
+    struct.pack_into("<H", formatted, 0x14 - 4, 4000)
+    struct.pack_into("B", formatted, 0x23 - 4, 32)
+    struct.pack_into("B", formatted, 0x25 - 4, 64)
+
+    return structure(4, handle, bytes(formatted), ["CPU0", "Intel(R) Corporation", "Xeon"])
+
+
+def table(count):
+    """A table of roughly `count` structures; mostly DIMMs, plus filler types."""
+
+    parts = []
+
+    for handle in range(count):
+        kind = handle % 4
+
+        if kind == 0:
+            parts.append(memory_device(handle, handle))
+        elif kind == 1:
+            parts.append(processor(handle))
+        else:
+            # E.g. OEM strings/cache information; not decoded.
+            parts.append(structure(7 if kind == 2 else 11, handle, bytes(0x0F), ["Filler"]))
+
+    parts.append(structure(127, count, b"", []))
+
+    return b"".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--structures", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--dimms", type=int, default=24)
+    args = parser.parse_args()
+
+    from src.dumps.Linux.dmi_decode import parse_smbios, read_dmi
+
+    blob = table(args.structures)
+    decoded = parse_smbios(blob)
+
+    if len(decoded[17]) != (args.structures + 3) // 4:
+        raise SystemExit("Decoded an unexpected amount of memory devices!")
+
+    decode_all = [timed(parse_smbios, blob)[1] for _ in range(args.rounds)]
+    decode_17 = [timed(parse_smbios, blob, [17])[1] for _ in range(args.rounds)]
+
+    root = tempfile.mkdtemp()
+
+    try:
+        sources = []
+
+        for slot in range(args.dimms):
+            path = os.path.join(root, f"17-{slot}")
+
+            with open(path, "wb") as file:
+                file.write(memory_device(slot, slot))
+
+            sources.append(path)
+
+        def per_entry():
+            return [subprocess.check_output(["cat", source]) for source in sources]
+
+        def single():
+            return parse_smbios(read_dmi(sources)[1], [17])
+
+        spawned = [timed(per_entry)[1] for _ in range(args.rounds)]
+        batched = [timed(single)[1] for _ in range(args.rounds)]
+    finally:
+        shutil.rmtree(root)
+
+    emit("smbios", {
+        "structures": args.structures,
+        "table_bytes": len(blob),
+        "decode_all": summary(decode_all),
+        "decode_type_17": summary(decode_17),
+        "dimms": args.dimms,
+        "read_per_entry_subprocess": summary(spawned),
+        "read_and_decode_single_pass": summary(batched),
+    })
+
+
+if __name__ == "__main__":
+    main()
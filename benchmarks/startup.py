@@ -0,0 +1,196 @@
+"""
+Measures time-to-first-output (the "Analyzing hardware..." line) and
+the total run time of a non-interactive JSON dump, with the network
+being online, offline (connections are refused immediately)
+and firewalled (connections hang until they time out).
+
+Every scenario runs in its own process, with all HTTP traffic
+intercepted, so no real requests are made.
+
+    python -m benchmarks.startup [--scenarios online,offline,firewalled] [--rounds 3] [--latency 0.1]
+                                 [--save <results.json>] [--baseline <results.json>] [--tolerance 0.25]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks._common import emit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS = ["online", "offline", "firewalled"]
+
+
+class _FirstOutput:
+    """Wraps `sys.stdout`, recording when anything is first written to it."""
+
+    def __init__(self, stream, start):
+        self.stream = stream
+        self.start = start
+        self.first = None
+
+    def write(self, text):
+        if self.first is None and text.strip():
+            self.first = time.perf_counter() - self.start
+
+        return self.stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def _intercept(scenario, latency):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    from src.info import AppInfo
+
+    def send(self, request, **kwargs):
+        if scenario == "offline":
+            raise requests.ConnectionError(f"[{scenario}] {request.url}")
+
+        if scenario == "firewalled":
+            timeout = kwargs.get("timeout")
+            timeout = timeout[0] if isinstance(timeout, tuple) else timeout
+
+            time.sleep(timeout or 0)
+
+            raise requests.ConnectTimeout(f"[{scenario}] {request.url}")
+
+        time.sleep(latency)
+
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+
+        # Report the current version as the latest one, so no update is offered;
+        # every other lookup "fails", so nothing has to be parsed.
+        if "info.py" in request.url:
+            response.status_code = 200
+            response._content = f'version = "{AppInfo.version}"'.encode()
+        elif "google.com" in request.url:
+            response.status_code = 200
+            response._content = b""
+        else:
+            response.status_code = 404
+            response._content = b""
+
+        return response
+
+    HTTPAdapter.send = send
+
+
+def child(scenario, latency, out):
+    start = time.perf_counter()
+    stdout = sys.stdout = _FirstOutput(sys.stdout, start)
+
+    sys.path.insert(0, ROOT)
+
+    _intercept(scenario, latency)
+
+    sys.argv = ["main.py", "--no-interactive", "--off-data", "{Memory}", "-J", tempfile.mkdtemp()]
+
+    from src.main import main
+
+    try:
+        main()
+    except SystemExit:
+        pass
+
+    with open(out, "w") as file:
+        json.dump({"first_output": stdout.first, "total": time.perf_counter() - start}, file)
+
+
+def run(scenario, latency):
+    fd, out = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+
+    # A fresh `HOME`, so every run starts with an empty lookup cache.
+    env = dict(os.environ, HOME=tempfile.mkdtemp())
+
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.startup", "--child", scenario,
+             "--latency", str(latency), "--out", out],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL, check=True,
+        )
+
+        with open(out, "r") as file:
+            return json.load(file)
+    finally:
+        os.unlink(out)
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns every scenario whose median time-to-first-output
+    regressed by more than `tolerance` (relative) against `baseline`.
+    """
+
+    regressions = []
+
+    for scenario, data in results.items():
+        before = baseline.get(scenario, {}).get("first_output_ms")
+
+        if before is None:
+            continue
+
+        # Allow some absolute slack, as these are tiny numbers.
+        if data["first_output_ms"] > before * (1 + tolerance) + 50:
+            regressions.append(
+                f"{scenario}: {before}ms -> {data['first_output_ms']}ms"
+            )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--save")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--child", choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(args.child, args.latency, args.out)
+
+    results = {}
+
+    for scenario in args.scenarios.split(","):
+        runs = [run(scenario, args.latency) for _ in range(args.rounds)]
+
+        first = sorted(r["first_output"] or 0 for r in runs)
+        total = sorted(r["total"] for r in runs)
+
+        results[scenario] = {
+            "rounds": len(runs),
+            "first_output_ms": round(first[len(first) // 2] * 1e3, 1),
+            "total_ms": round(total[len(total) // 2] * 1e3, 1),
+        }
+
+    emit("startup", results)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+
+        if regressions:
+            print("Regressed:\n  " + "\n  ".join(regressions), file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
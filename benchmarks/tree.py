@@ -0,0 +1,141 @@
+"""
+Compares rendering a category of `--nodes` nodes with the way `tree` used
+to (concatenating the output through recursion, with `re.sub` and
+`color_text` for every line) against `render`, in both modes, streaming
+into an `io.StringIO`.
+
+The former is quadratic in the size of the output, so it's only measured
+up to `--legacy-max` nodes. Also renders a single chain of `--depth`
+nested dicts, which only the iterative mode can.
+
+    python -m benchmarks.tree [--nodes 1000,10000,100000] [--rounds 3]
+"""
+import argparse
+import io
+import re
+
+from benchmarks._common import emit, summary, timed
+
+
+def legacy(name, data, nest=1, parent="", looped={}, value="", color=True):
+    from src.info import color_text
+
+    spacing = ""
+    sp = ""
+
+    i = looped.get("i", 1)
+    l = looped.get("l", len(data))
+
+    if nest == 1:
+        spacing = color_text("─ ", "cyan") if color else "─ "
+
+    if isinstance(data, dict):
+        if nest == 1:
+            value += f"{spacing}{name}\n"
+
+        for key in data:
+            if not key:
+                continue
+
+            f = color_text("├── ", "cyan") if color else "├── "
+            s = color_text("└── ", "cyan") if color else "└── "
+
+            if len(looped):
+                sp = (
+                    re.sub(
+                        r"├",
+                        color_text("│", "cyan") if color else "│",
+                        re.sub(r"─", " ", re.sub(r"└", " ", parent)),
+                    )
+                    + (f if i < l else s)
+                )
+            else:
+                sp = " " * (len(parent) if parent else 2) + (f if i < l else s)
+
+            if len(key) and isinstance(data[key], dict):
+                value += f"{sp}{key}\n"
+                value = legacy(key, data[key], nest + 1, sp, {"i": 1}, value, color)
+            else:
+                if i >= l:
+                    value += f"{re.sub(r'├', color_text('└', 'cyan') if color else '└', sp)}{key}: {data[key]}\n"
+                else:
+                    value += f"{sp}{key}: {data[key]}\n"
+
+            i += 1
+
+    elif isinstance(data, list):
+        value += f"{spacing}{name}\n"
+
+        i = 1
+        for d in data:
+            if not d:
+                continue
+
+            value = legacy(name, d, nest + 1, spacing, {"i": i, "l": len(data)}, value, color)
+            i += 1
+
+    return value
+
+
+def category(nodes):
+    """A list of devices, shaped like the collectors' output, of about `nodes` nodes."""
+
+    # Each device is 10 nodes.
+    return [{
+        f"Device #{n}": {
+            "Device ID": "0x15BC",
+            "Vendor": "0x8086",
+            "PCI Path": f"PciRoot(0x0)/Pci(0x1C,0x{n % 8:X})",
+            "ACPI Path": f"\\_SB.PC00.RP{n % 32:02}",
+            "Subsystem": {"Device ID": "0x0000", "Vendor": "0x8086", "Revision": n % 4},
+        }
+    } for n in range(max(nodes // 10, 1))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", default="1000,10000,100000")
+    parser.add_argument("--legacy-max", type=int, default=20000)
+    parser.add_argument("--depth", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    from src.util.tree import render
+
+    def streamed(data, iterative):
+        render("Network", data, io.StringIO(), iterative=iterative)
+
+    results = []
+
+    for nodes in map(int, args.nodes.split(",")):
+        data = category(nodes)
+        result = {"nodes": nodes}
+
+        for mode, iterative in (("recursive", False), ("iterative", True)):
+            result[mode] = summary([timed(streamed, data, iterative)[1] for _ in range(args.rounds)])
+            result[mode]["ns_per_node"] = round(result[mode]["median_us"] * 1e3 / nodes, 1)
+
+        if nodes <= args.legacy_max:
+            result["legacy"] = summary([timed(legacy, "Network", data)[1] for _ in range(args.rounds)])
+            result["legacy"]["ns_per_node"] = round(result["legacy"]["median_us"] * 1e3 / nodes, 1)
+
+        results.append(result)
+
+    deep = leaf = {}
+
+    for _ in range(args.depth):
+        leaf["Nested"] = leaf = {}
+
+    leaf["Value"] = 1
+
+    emit("tree", {
+        "scaling": results,
+        "deep": {
+            "depth": args.depth,
+            "iterative": summary([timed(streamed, deep, True)[1]]),
+        },
+    })
+
+
+if __name__ == "__main__":
+    main()
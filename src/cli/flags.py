@@ -5,6 +5,9 @@ from src.cli.ui import clear
 from src.info import AppInfo, color_text
 from src.managers.devicemanager import DeviceManager
 from src.util.debugger import Debugger as debugger
+from src.util.privileged_cache import PrivilegedCache as privileged_cache
+from src.util.sysroot import Sysroot as sysroot
+from src.util.dump_functions.export import export
 from src.util.dump_functions.json import dump_json
 from src.util.dump_functions.plist import dump_plist
 from src.util.dump_functions.text import dump_txt
@@ -17,9 +20,10 @@ class FlagParser:
     in the very case that they're presented.
     """
 
-    def __init__(self, logger, dm=None, offline=False):
+    def __init__(self, logger, dm=None, offline=False, updater=None):
         self.args = argv[1:]
         self.dm = dm
+        self.updater = updater
         self.toggled_off = []
 
         if "--off-data" in self.args:
@@ -29,10 +33,39 @@ class FlagParser:
 
             self.off_data(self.args[self.args.index("--off-data") + 1])
 
+        if "--cache-privileged" in self.args:
+            privileged_cache.enable()
+
+        self.capture = self.value("--capture")
+        root = self.value("--sysroot")
+
+        if self.capture and root:
+            debugger.log_dbg(color_text("--> '--capture' only captures the live system – can't be used with '--sysroot'!", "red"))
+            exit(1)
+
+        if root:
+            try:
+                sysroot.set(root)
+            except Exception as e:
+                print(color_text(f"--> Invalid sysroot '{root}'!\n\t^^^^^^^{str(e)}", "red"))
+                exit(1)
+
+        if self.capture:
+            sysroot.record()
+
+        deadline = self.seconds("--deadline")
+
         if not self.dm and not list(filter(lambda x: "-h" in x.lower(), self.args)):
             print(color_text(
                 "--> Analyzing hardware... (this might take a while, don't panic)", "red"))
-            self.dm = DeviceManager(logger, off_data=self.toggled_off, offline=offline)
+            self.dm = DeviceManager(
+                logger, 
+                off_data=self.toggled_off, 
+                offline=offline, 
+                serial="--serial" in self.args,
+                refresh="--refresh" in self.args,
+                deadline=deadline
+            )
             self.dm.info = {
                 k: v
                 for (k, v) in self.dm.info.items()
@@ -47,6 +80,12 @@ class FlagParser:
         if (
             not self.interactive or 
             "--offline" in self.args or
+            "--serial" in self.args or
+            "--cache-privileged" in self.args or
+            "--refresh" in self.args or
+            "--timings" in self.args or
+            "--profile" in self.args or
+            "--stats" in self.args or
             (
                 "-dbg"    in self.args or 
                 "-debug"  in self.args or
@@ -58,6 +97,12 @@ class FlagParser:
                 if (
                     "--no-interactive" in self.args[i].lower() or
                     "--offline" in self.args[i].lower() or
+                    "--serial" in self.args[i].lower() or
+                    "--cache-privileged" in self.args[i].lower() or
+                    "--refresh" in self.args[i].lower() or
+                    "--timings" in self.args[i].lower() or
+                    "--profile" in self.args[i].lower() or
+                    "--stats" in self.args[i].lower() or
                     self.args[i].lower() in ["-dbg", "--debug", "-debug"]
                 ):
                     del self.args[i]
@@ -65,6 +110,9 @@ class FlagParser:
 
                 i += 1
 
+        if self.capture and self.dm:
+            self.capture_sysroot()
+
         self.flags = [
             {
                 "Aliases": ["--help", "-H"],
@@ -77,6 +125,7 @@ class FlagParser:
             {
                 "Aliases": ["--text", "--txt", "-tx", "-T"],
                 "Command": dump_txt,
+                "Format": "txt",
                 "Log": {
                     "Failed": "Failed to dump to TXT file (FLAGS)",
                     "Success": "Successfully dumped to TXT file (FLAGS)",
@@ -85,6 +134,7 @@ class FlagParser:
             {
                 "Aliases": ["--json", "-J"],
                 "Command": dump_json,
+                "Format": "json",
                 "Log": {
                     "Failed": "Failed to dump to JSON file (FLAGS)",
                     "Success": "Successfully dumped to JSON file (FLAGS)",
@@ -93,6 +143,7 @@ class FlagParser:
             {
                 "Aliases": ["--xml", "-X"],
                 "Command": dump_xml,
+                "Format": "xml",
                 "Log": {
                     "Failed": "Failed to dump to XML file (FLAGS)",
                     "Success": "Successfully dumped to XML file (FLAGS)",
@@ -101,6 +152,7 @@ class FlagParser:
             {
                 "Aliases": ["--plist", "-P"],
                 "Command": dump_plist,
+                "Format": "plist",
                 "Log": {
                     "Failed": "Failed to dump to Plist file (FLAGS)",
                     "Success": "Successfully dumped to Plist file (FLAGS)",
@@ -148,6 +200,42 @@ class FlagParser:
                     "[--offline]",
                     "runs the application in OFFLINE mode, regardless of whether or not an internet connection is available"
                 ),
+                (
+                    "[--serial]",
+                    "collects hardware information one category at a time, instead of concurrently (useful for debugging)"
+                ),
+                (
+                    "[--refresh]",
+                    "collects all hardware information again, instead of re-using what hasn't changed since the last run"
+                ),
+                (
+                    "[--sysroot] <path>",
+                    "reads sysfs/procfs from the given directory, or capture, instead of the running system (Linux only)"
+                ),
+                (
+                    "[--capture] <path>",
+                    "captures the sysfs/procfs files read while detecting hardware into a tarball (.tar.gz/.tar.xz), for use with '--sysroot' (Linux only)"
+                ),
+                (
+                    "[--cache-privileged]",
+                    "when ran as root, caches data which requires root to read (e.g. RAM modules), so that unprivileged runs can use it until the next reboot"
+                ),
+                (
+                    "[--timings]",
+                    "prints how long each part of the run took, slowest first, and adds them to JSON/XML/plist dumps (under '_meta')"
+                ),
+                (
+                    "[--profile]",
+                    "profiles the whole run with cProfile, writing the stats to a .pstats file next to the log"
+                ),
+                (
+                    "[--stats]",
+                    "prints how much work the run did (files read, subprocesses spawned, HTTP requests made, ...), and adds it to JSON/XML/plist dumps (under '_meta')"
+                ),
+                (
+                    "[--deadline] <seconds>",
+                    "dumps whatever was discovered within the given amount of seconds, skipping device/codename lookups which don't make it in time – listed under '_meta' in JSON/XML/plist dumps"
+                ),
                 (
                     "[-dbg/-debug/--debug]",
                     "runs the application in DEBUG mode."
@@ -161,7 +249,7 @@ class FlagParser:
             print(" " + "#" + " " * 10 + title + " " * 10 + "#")
             print("#" * (len(title) + 22), "\n" * 2)
             print(
-                "<executable> \n  | [--help/-H] \n  | [--text/--txt/-tx/-T] \n  | [--json/-J] \n  | [--xml/-X] \n  | [--plist/-P]\n  | [--no-interactive]\n  | [--offline]\n"
+                "<executable> \n  | [--help/-H] \n  | [--text/--txt/-tx/-T] \n  | [--json/-J] \n  | [--xml/-X] \n  | [--plist/-P]\n  | [--no-interactive]\n  | [--offline]\n  | [--serial]\n  | [--refresh]\n  | [--sysroot]\n  | [--capture]\n  | [--cache-privileged]\n  | [--timings]\n  | [--profile]\n  | [--stats]\n  | [--deadline]\n"
             )
 
             for argument in arguments:
@@ -197,22 +285,30 @@ class FlagParser:
         if self.missing:
             self.prompts()
 
+        ok = color_text("   OK   ", "green")
+        fail = color_text(" FAILED ", "red")
+
         for completed in self.completed:
             desc = self.dump_desc(completed.get('Type'))
 
-            try:
-                ok = color_text("   OK   ", "green")
+            print(
+                f"[{ok}]   Attempting to dump {desc} to {completed.get('Path')}...")
+            self.logger.info(
+                f"Attempting to dump {desc} file to {completed.get('Path')}...",
+                __file__,
+            )
 
-                print(
-                    f"[{ok}]   Attempting to dump {desc} to {completed.get('Path')}...")
-                self.logger.info(
-                    f"Attempting to dump {desc} file to {completed.get('Path')}...",
-                    __file__,
-                )
+        # Every format is written from a single walk of the information.
+        results = export(
+            self.dm,
+            [(self.dump_format(completed.get("Type")), completed.get("Path")) for completed in self.completed],
+            self.logger
+        ) if self.completed else []
 
-                completed.get("Command")(
-                    self.dm, completed.get("Path"), self.logger)
+        for completed, result in zip(self.completed, results):
+            desc = self.dump_desc(completed.get('Type'))
 
+            if not isinstance(result, Exception):
                 print(
                     f"[{ok}]   Successfully dumped hardware information to {desc} file! Stored in {completed.get('Path')}\n"
                 )
@@ -220,21 +316,99 @@ class FlagParser:
                     f"Successfully dumped hardware information to {desc} file! Stored in {completed.get('Path')}",
                     __file__,
                 )
-            except Exception as e:
-                fail = color_text(" FAILED ", "red")
+            else:
                 print(
                     f"[{fail}]   Failed to dump to {desc} file in {completed.get('Path')}...",
                     __file__,
                 )
                 self.logger.error(
-                    f"Failed to dump to {desc}!\n\t^^^^^^^^^^^^{str(e)}",
+                    f"Failed to dump to {desc}!\n\t^^^^^^^^^^^^{str(result)}",
                     __file__,
                 )
 
         self.logger.info("Successfully exited after dumping.\n\n", __file__)
-        
+
+        if self.updater and self.interactive:
+            self.updater.finish()
+
         exit(0)
 
+    def value(self, flag):
+        """
+        Removes `flag`, and the value following it, from the arguments;
+        returning said value – or `None`, if the flag isn't present.
+        """
+
+        if flag not in self.args:
+            return None
+
+        index = self.args.index(flag)
+
+        if len(self.args) == index + 1 or self.args[index + 1].startswith("-"):
+            debugger.log_dbg(color_text(f"--> No path for '{flag}'!", "red"))
+            exit(1)
+
+        value = self.parse_path(self.args[index + 1])
+
+        del self.args[index:index + 2]
+
+        return value
+
+    def seconds(self, flag):
+        """
+        Removes `flag`, and the amount of seconds following it, from the arguments;
+        returning said amount – or `None`, if the flag isn't present.
+
+        Exits if it's missing, or isn't a positive number.
+        """
+
+        if flag not in self.args:
+            return None
+
+        index = self.args.index(flag)
+        value = self.args[index + 1] if len(self.args) > index + 1 else None
+
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            seconds = None
+
+        if seconds is None or not seconds > 0 or seconds == float("inf"):
+            print(color_text(
+                f"--> '{flag}' needs a positive amount of seconds" +
+                (f" – got '{value}'!" if value is not None else "!"),
+                "red"
+            ))
+            exit(1)
+
+        del self.args[index:index + 2]
+
+        return seconds
+
+    def capture_sysroot(self):
+        ok = color_text("   OK   ", "green")
+
+        try:
+            dest = sysroot.capture(self.capture)
+        except Exception as e:
+            fail = color_text(" FAILED ", "red")
+            print(f"[{fail}]   Failed to capture sysfs/procfs into {self.capture}...")
+            self.logger.error(
+                f"Failed to capture sysfs/procfs!\n\t^^^^^^^^^^^^{str(e)}",
+                __file__,
+            )
+            exit(1)
+
+        print(f"[{ok}]   Captured the sysfs/procfs files used by this dump into {dest}\n")
+        self.logger.info(f"Captured sysfs/procfs into {dest}", __file__)
+
+        # Nothing else to do.
+        if not [arg for arg in self.args if arg.startswith("-")]:
+            if self.updater and self.interactive:
+                self.updater.finish()
+
+            exit(0)
+
     def off_data(self, arr):
         del self.args[self.args.index("--off-data")]
 
@@ -389,6 +563,13 @@ class FlagParser:
 
         return func
 
+    def dump_format(self, dump_type):
+        for flag in self.flags:
+            if dump_type in flag.get("Aliases", []):
+                return flag.get("Format")
+
+        return None
+
     def delete_item(self, item, target):
         for i in range(len(target)):
             if target[i] == item:
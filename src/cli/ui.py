@@ -9,7 +9,7 @@ from src.util.dump_functions.text import dump_txt
 from src.util.dump_functions.json import dump_json
 from src.util.dump_functions.xml import dump_xml
 from src.util.dump_functions.plist import dump_plist
-from src.util.tree import tree
+from src.util.tree import render
 
 
 def hack_disclaimer():
@@ -264,8 +264,8 @@ class UI:
                 )
 
                 if key and not is_empty and not key in self.dm.off_data:
-                    val = tree(key, self.dm.info[key])
-                    print(val)
+                    render(key, self.dm.info[key], sys.stdout)
+                    print()
             except Exception as e:
                 self.logger.critical(
                     f"Failed to discover hardware! This should not happen.\n\t^^^^^^^^^{str(e)}",
@@ -10,11 +10,20 @@
 # how to decode specific data from DMI tables.
 #
 # This is all thanks to them.
+import os
+import subprocess
+
+from src.util.sysfs_reader import SysfsReader
+
+DMI_TABLES = "/sys/firmware/dmi/tables"
+DMI_ENTRIES = "/sys/firmware/dmi/entries"
+
+
 def get_string_entry(string, n):
-    if n == 0:
+    if n == 0 or n > len(string):
         return "Unknown"
     else:
-        return string[n - 1].decode("ascii")
+        return string[n - 1].decode("ascii", "replace")
 
 MEMORY_TYPE = {
     0x01: "Other",
@@ -45,5 +54,337 @@ MEMORY_TYPE = {
     0x1A: "DDR4",
     0x1B: "LPDDR",
     0x1C: "LPDDR2",
-    0x1D: "LPDDR3"
-}
\ No newline at end of file
+    0x1D: "LPDDR3",
+    0x1E: "LPDDR4",
+    0x1F: "Logical non-volatile device",
+    0x20: "HBM",
+    0x21: "HBM2",
+    0x22: "DDR5",
+    0x23: "LPDDR5",
+    0x24: "HBM3",
+}
+
+PROCESSOR_TYPE = {
+    0x01: "Other",
+    0x02: "UNKNOWN",
+    0x03: "Central Processor",
+    0x04: "Math Processor",
+    0x05: "DSP Processor",
+    0x06: "Video Processor",
+}
+
+MEMORY_ARRAY_LOCATION = {
+    0x01: "Other",
+    0x02: "UNKNOWN",
+    0x03: "System board or motherboard",
+    0x04: "ISA add-on card",
+    0x05: "EISA add-on card",
+    0x06: "PCI add-on card",
+    0x07: "MCA add-on card",
+    0x08: "PCMCIA add-on card",
+    0x09: "Proprietary add-on card",
+    0x0A: "NuBus",
+}
+
+MEMORY_ARRAY_USE = {
+    0x01: "Other",
+    0x02: "UNKNOWN",
+    0x03: "System memory",
+    0x04: "Video memory",
+    0x05: "Flash memory",
+    0x06: "Non-volatile RAM",
+    0x07: "Cache memory",
+}
+
+
+def _int(data, offset, size):
+    """
+    Little-endian integer of `size` bytes at `offset`,
+    or `None` if the structure is too short to hold it.
+    """
+
+    if len(data) < offset + size:
+        return None
+
+    return int.from_bytes(data[offset: offset + size], "little")
+
+
+def _str(data, strings, offset):
+    """
+    String referenced by the byte at `offset`, or `None`
+    if the structure is too short to hold it.
+    """
+
+    if len(data) <= offset:
+        return None
+
+    return get_string_entry(strings, data[offset]).strip()
+
+
+def _present(fields):
+    """`fields`, without those the structure was too short to hold (older SMBIOS versions)."""
+
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def decode_bios(data, strings):
+    """Type 0 – BIOS Information."""
+
+    return _present({
+        "Vendor": _str(data, strings, 0x04),
+        "Version": _str(data, strings, 0x05),
+        "Release Date": _str(data, strings, 0x08),
+    })
+
+
+def decode_system(data, strings):
+    """Type 1 – System Information."""
+
+    return _present({
+        "Manufacturer": _str(data, strings, 0x04),
+        "Product Name": _str(data, strings, 0x05),
+        "Version": _str(data, strings, 0x06),
+        "Family": _str(data, strings, 0x1A),
+    })
+
+
+def decode_baseboard(data, strings):
+    """Type 2 – Baseboard Information."""
+
+    return _present({
+        "Manufacturer": _str(data, strings, 0x04),
+        "Product": _str(data, strings, 0x05),
+        "Version": _str(data, strings, 0x06),
+    })
+
+
+def decode_processor(data, strings):
+    """Type 4 – Processor Information."""
+
+    cores = _int(data, 0x23, 1)
+    threads = _int(data, 0x25, 1)
+
+    # 0xFF means the real value is in the 2-byte
+    # "Core/Thread Count 2" fields (SMBIOS 3.0+).
+    if cores == 0xFF:
+        cores = _int(data, 0x2A, 2) or cores
+
+    if threads == 0xFF:
+        threads = _int(data, 0x2E, 2) or threads
+
+    return _present({
+        "Socket": _str(data, strings, 0x04),
+        "Type": PROCESSOR_TYPE.get(_int(data, 0x05, 1), "UNKNOWN"),
+        "Manufacturer": _str(data, strings, 0x07),
+        "Version": _str(data, strings, 0x10),
+        "Max Speed": _int(data, 0x14, 2),
+        "Current Speed": _int(data, 0x16, 2),
+        "Cores": cores,
+        "Threads": threads,
+    })
+
+
+def decode_memory_array(data, strings):
+    """Type 16 – Physical Memory Array."""
+
+    # In KB; 0x80000000 means the real value, in bytes,
+    # is in the 8-byte "Extended Maximum Capacity" field.
+    capacity = _int(data, 0x07, 4)
+
+    if capacity == 0x80000000:
+        capacity = (_int(data, 0x0F, 8) or 0) // 1024
+
+    return _present({
+        "Location": MEMORY_ARRAY_LOCATION.get(_int(data, 0x04, 1), "UNKNOWN"),
+        "Use": MEMORY_ARRAY_USE.get(_int(data, 0x05, 1), "UNKNOWN"),
+        "Maximum Capacity": f"{capacity // 1024}MB" if capacity else "UNKNOWN SIZE",
+        "Slots": _int(data, 0x0D, 2),
+    })
+
+
+def decode_memory_device(data, strings):
+    """
+    Type 17 – Memory Device.
+
+    `Capacity` is missing if the slot is empty.
+    """
+
+    """
+    ---------------------
+    |      CAPACITY     |
+    ---------------------
+
+    The 2 bytes at offset 0Ch hold the size, in MB if bit 15 is clear, or in KB if set.
+    0x7FFF means the module is (32GB-1MB) or larger, so the size (in MB) is held in
+    the 4 bytes at offset 1Ch instead. 0xFFFF means the size is unknown, and 0
+    means that no module is installed.
+    """
+    size = _int(data, 0x0C, 2)
+
+    if not size:
+        capacity = None
+    elif size == 0xFFFF:
+        capacity = "UNKNOWN SIZE"
+    elif size == 0x7FFF:
+        capacity = f"{(_int(data, 0x1C, 4) or 0) & 0x7FFFFFFF}MB"
+    elif size & 0x8000:
+        capacity = f"{size & 0x7FFF}KB"
+    else:
+        capacity = f"{size}MB"
+
+    return _present({
+        "Capacity": capacity,
+        "Channel": _str(data, strings, 0x10),
+        "Bank": _str(data, strings, 0x11),
+        "Type": MEMORY_TYPE.get(_int(data, 0x12, 1), "UNKNOWN"),
+        "Speed": _int(data, 0x15, 2),
+        "Manufacturer": _str(data, strings, 0x17),
+        "Part Number": _str(data, strings, 0x1A),
+    })
+
+
+DECODERS = {
+    0: decode_bios,
+    1: decode_system,
+    2: decode_baseboard,
+    4: decode_processor,
+    16: decode_memory_array,
+    17: decode_memory_device,
+}
+
+
+def parse_smbios(table, types=None):
+    """
+    Walks an SMBIOS structure table in a single pass, decoding every
+    structure whose type has a decoder (see `DECODERS`) – or only
+    those in `types`, if given.
+
+    The table is copied into `bytes` once (it may be a `bytearray`, or
+    `memoryview`); structures are then sliced out of it through a
+    `memoryview`, only the string sets of decoded ones being copied.
+
+    Fields which a structure is too short to hold are left out.
+
+    Returns a dictionary of `{type: [decoded structures]}`.
+    """
+
+    types = set(DECODERS if types is None else types) & set(DECODERS)
+    table = bytes(table)
+    view = memoryview(table)
+    result = {stype: [] for stype in types}
+    offset = 0
+
+    # Every structure is a 4-byte header (type, length, handle)
+    # followed by its formatted area, and then its string set;
+    # which is terminated by two NUL bytes.
+    while offset + 4 <= len(table):
+        stype = view[offset]
+        length = view[offset + 1]
+
+        if length < 4:
+            break
+
+        end = table.find(b"\0\0", offset + length)
+
+        if end == -1:
+            break
+
+        if stype in types:
+            strings = table[offset + length: end].split(b"\0") if end > offset + length else []
+
+            result[stype].append(
+                DECODERS[stype](view[offset: offset + length], strings)
+            )
+
+        offset = end + 2
+
+        # End-of-table
+        if stype == 127:
+            break
+
+    return result
+
+
+def entry_point_length(blob):
+    """Length of the SMBIOS (2.x or 3.x) entry point at the start of `blob`."""
+
+    if blob[:5] == b"_SM3_" and len(blob) > 6:
+        return blob[6]
+    elif blob[:4] == b"_SM_" and len(blob) > 5:
+        return blob[5]
+
+    return 0
+
+
+def dmi_sources(reader=None):
+    """
+    Files holding the SMBIOS table: the entry point and the table itself,
+    or, on kernels without `/sys/firmware/dmi/tables`, the individual
+    structures; which concatenated form a valid table as well.
+    """
+
+    reader = reader or SysfsReader()
+
+    if reader.isfile(os.path.join(DMI_TABLES, "DMI")):
+        return [
+            os.path.join(DMI_TABLES, "smbios_entry_point"),
+            os.path.join(DMI_TABLES, "DMI"),
+        ]
+
+    if not reader.isdir(DMI_ENTRIES):
+        return []
+
+    # Entries are named `<type>-<instance>`; they're put back in the order
+    # of the table, as far as that's known, numerically – anything else would
+    # put the end-of-table structure (`127-0`) before, say, `17-0`.
+    entries = []
+
+    for entry in reader.listdir(DMI_ENTRIES):
+        try:
+            stype, instance = map(int, entry.split("-"))
+        except ValueError:
+            continue
+
+        # Not needed: the table is only walked as far as it goes.
+        if stype == 127:
+            continue
+
+        entries.append((stype, instance, os.path.join(DMI_ENTRIES, entry, "raw")))
+
+    return [path for _, _, path in sorted(entries)]
+
+
+def dmi_readable(sources, reader=None):
+    reader = reader or SysfsReader()
+
+    return all(reader.access(source, os.R_OK) for source in sources)
+
+
+def read_dmi(sources, sudo=False, reader=None, timeout=None):
+    """
+    Reads all of `sources` at once – directly, or with a single `sudo cat`
+    if `sudo` – returning the `(entry point, table)` they hold.
+
+    Given a `timeout`, `sudo` fails rather than prompt for a password,
+    and raises `subprocess.TimeoutExpired` if it takes any longer.
+    """
+
+    reader = reader or SysfsReader()
+
+    if sudo:
+        blob = subprocess.check_output(
+            ["sudo", *(["-n"] if timeout is not None else []), "cat", *map(reader.path, sources)],
+            timeout=timeout
+        )
+    else:
+        blob = b"".join(map(reader.read_bytes, sources))
+
+    return split_dmi(blob)
+
+
+def split_dmi(blob):
+    """Splits the entry point and table, as read together, apart."""
+
+    length = entry_point_length(blob)
+
+    return blob[:length], blob[length:]
\ No newline at end of file
@@ -1,14 +1,21 @@
 import os
 import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from sys import exit
 from src.error.cpu_err import cpu_err
 from src.info import color_text
 from src.util.codename import gpu
-from src.util.pci_root import pci_from_acpi_linux
+from src.util.pci_root import PCITopology, pci_from_acpi_linux
 from src.util.codename_manager import CodenameManager
+from src.util.deadline import Deadline as deadline, DeadlineExceeded
 from src.util.debugger import Debugger as debugger
-from .dmi_decode import get_string_entry, MEMORY_TYPE
+from src.util.privileged_cache import PrivilegedCache as privileged_cache
+from src.util.sysfs_reader import SysfsReader
+from src.util.timings import Timings as timings
+from .pci_scan import PCIScanner
+from .dmi_decode import dmi_readable, dmi_sources, parse_smbios, read_dmi, split_dmi
 
 
 class LinuxHardwareManager:
@@ -25,62 +32,193 @@ class LinuxHardwareManager:
         self.logger = parent.logger
         self.offline = parent.offline
         self.off_data = parent.off_data
+        self.serial = parent.serial
+        self.lookups = []
+        self.sysfs = None
+        self.pci_topology = None
+        self.pci_scanner = None
+
+    # Category, collector and description of every piece of data
+    # we extract, in the order they're presented in the dump.
+    COLLECTORS = [
+        ("CPU", "cpu_info", "CPU"),
+        ("Motherboard", "mobo_info", "Baseboard"),
+        ("GPU", "gpu_info", "GPU"),
+        ("Memory", "mem_info", "RAM"),
+        ("Network", "net_info", "NIC"),
+        ("Audio", "audio_info", "Audio"),
+        ("Input", "input_info", "Input device"),
+        ("Storage", "block_info", "Storage"),
+    ]
+
+    # Collectors which may prompt the user, and therefore
+    # always run on the calling thread.
+    INTERACTIVE = ["mem_info"]
 
     def dump(self):
-        if not "CPU" in self.off_data and not self.info.get("CPU", []):
-            debugger.log_dbg("--> [LINUX]: Attempting to fetch CPU information...")
-            self.cpu_info()
-            debugger.log_dbg()
-
-        if not "Motherboard" in self.off_data and not self.info.get("Motherboard", {}):
-            debugger.log_dbg("--> [LINUX]: Attempting to fetch Baseboard information...")
-            self.mobo_info()
-            debugger.log_dbg()
-
-        if not "GPU" in self.off_data and not self.info.get("GPU", []):
-            debugger.log_dbg("--> [LINUX]: Attempting to fetch GPU information...")
-            self.gpu_info()
-            debugger.log_dbg()
-
-        if not "Memory" in self.off_data and not self.info.get("Memory", []):
-            debugger.log_dbg("--> [LINUX]: Attempting to fetch RAM information...")
-            self.mem_info()
-            debugger.log_dbg()
-
-        if not "Network" in self.off_data and not self.info.get("Network", []):
-            debugger.log_dbg("--> [LINUX]: Attempting to fetch NIC information...")
-            self.net_info()
-            debugger.log_dbg()
-
-        if not "Audio" in self.off_data and not self.info.get("Audio", []):
-            debugger.log_dbg("--> [LINUX]: Attempting to fetch Audio information...")
-            self.audio_info()
-            debugger.log_dbg()
-
-        if not "Input" in self.off_data and not self.info.get("Input", []):
-            debugger.log_dbg("--> [LINUX]: Attempting to fetch Input device information...")
-            self.input_info()
-            debugger.log_dbg()
-
-        if not "Storage" in self.off_data and not self.info.get("Storage", []):
-            debugger.log_dbg("--> [LINUX]: Attempting to fetch Storage information...")
-            self.block_info()
-            debugger.log_dbg()
+        # Every sysfs/procfs read of this run goes through it;
+        # so whatever several collectors need is only read once.
+        self.sysfs = SysfsReader()
+
+        # Shared by every collector constructing PCI paths;
+        # indexed (once) the first time it's needed.
+        self.pci_topology = PCITopology(reader=self.sysfs)
+
+        # Shared by every collector of PCI devices;
+        # scanned (once) the first time it's needed.
+        self.pci_scanner = PCIScanner(self.sysfs)
+
+        collectors = [
+            collector for collector in self.COLLECTORS
+            if not collector[0] in self.off_data and not self.info.get(collector[0])
+        ]
+
+        if self.serial:
+            for collector in collectors:
+                self.run_collector(*collector)
+        else:
+            interactive = [c for c in collectors if c[1] in self.INTERACTIVE]
+            others = [c for c in collectors if not c[1] in self.INTERACTIVE]
+
+            # Every category reads its own, independent, sysfs tree –
+            # so they're collected concurrently.
+            with ThreadPoolExecutor(max_workers=max(len(others), 1)) as pool:
+                futures = [pool.submit(self.run_collector, *c) for c in others]
+
+                for collector in interactive:
+                    self.run_collector(*collector)
+
+                for future in futures:
+                    future.result()
+
+        # Collectors finish in any order; restore the expected one.
+        order = [collector[0] for collector in self.COLLECTORS]
+        data = sorted(
+            self.info.items(),
+            key=lambda item: order.index(item[0]) if item[0] in order else len(order)
+        )
+
+        self.info.clear()
+        self.info.update(data)
+
+        self.enrich()
+
+    def run_collector(self, category, collector, desc):
+        """
+        Runs a single collector, isolating its failures
+        so they can't abort any of the others.
+        """
+
+        debugger.log_dbg(f"--> [LINUX]: Attempting to fetch {desc} information...")
+
+        start = time.perf_counter()
 
-    def cpu_info(self):
         try:
+            with timings.span(f"collector.{collector}"):
+                getattr(self, collector)()
+        except Exception as e:
             debugger.log_dbg(color_text(
-                "--> [CPU]: Attempting to fetch relevant information of current CPU... — (PROC_FS)",
-                "yellow"
+                f"--> [LINUX]: Failed to fetch {desc} information – ignoring!" +
+                f"\n\t^^^^^^^{str(e)}",
+                "red"
             ))
 
-            cpus = open("/proc/cpuinfo", "r").read()
+            self.logger.error(
+                f"Failed to obtain {category} information (SYS_FS)\n\t^^^^^^^^^{str(e)}",
+                __file__,
+            )
+
+        debugger.log_dbg(
+            f"--> [LINUX]: Finished fetching {desc} information in " +
+            f"{(time.perf_counter() - start) * 1000:.2f}ms\n"
+        )
+
+    def defer_lookup(self, category, entry, dev, ven, types="pci", default="", name=None):
+        """
+        Registers `entry` – a `{model: data}` dictionary, already added to `self.info` –
+        to be renamed once the model of the given device is resolved in `enrich`.
+
+        `name` builds the new key from the resolved data, and defaults to its device name.
+        """
+
+        self.lookups.append((
+            category, 
+            entry, 
+            (dev, ven, types), 
+            default, 
+            name or (lambda item: item.get("device"))
+        ))
+
+    @timings.timed("enrich")
+    def enrich(self):
+        """
+        Enrichment stage, ran after every collector's discovery pass.
+
+        Resolves the models of all devices registered through `defer_lookup` in one go,
+        with duplicate IDs only being looked up once, and concurrently.
+        Those which aren't resolved before the deadline, if any, keep their default model.
+        """
+
+        if not self.lookups:
+            return
+
+        lookups, self.lookups = self.lookups, []
+
+        debugger.log_dbg(color_text(
+            f"--> [LINUX]: Attempting to resolve models of {len(lookups)} device(s)...",
+            "yellow"
+        ))
+
+        results = self.pci.get_items([lookup[2] for lookup in lookups])
+
+        for category, entry, key, default, name in lookups:
+            data = results.get(key) or {}
+
+            if isinstance(data, DeadlineExceeded):
+                debugger.log_dbg(color_text(
+                    f"--> [{category}]: Deadline reached before resolving the model of device '{key[1]}:{key[0]}' – skipping!",
+                    "yellow"
+                ))
+
+                deadline.degrade(category, f"{key[1]}:{key[0]}", "Model")
+
+                data = {}
+            elif isinstance(data, Exception):
+                debugger.log_dbg(color_text(
+                    f"--> [{category}]: Failed to obtain model of device '{key[1]}:{key[0]}' – ignoring!" +
+                    f"\n\t^^^^^^^{str(data)}",
+                    "red"
+                ))
+
+                self.logger.warning(
+                    f"Failed to obtain model for {category} device (SYS_FS) – Non-critical, ignoring",
+                    __file__,
+                )
+
+                data = {}
+
+            model = name(data) or default
+            fields = next(iter(entry.values()))
+
+            entry.clear()
+            entry[model] = fields
+
+        debugger.log_dbg(color_text(
+            "--> [LINUX]: Successfully resolved device models!\n",
+            "green"
+        ))
+
+    def cpu_info(self):
+        debugger.log_dbg(color_text(
+            "--> [CPU]: Attempting to fetch relevant information of current CPU... — (PROC_FS)",
+            "yellow"
+        ))
+
+        cpus = self.sysfs.read("/proc/cpuinfo", strip=False)
+
+        if cpus is None:
+            e = self.sysfs.error("/proc/cpuinfo")
 
-            debugger.log_dbg(color_text(
-                "--> [CPU]: Successfully obtained relevant information of current CPU! — (PROC_FS)",
-                "green"
-            ))
-        except Exception as e:
             debugger.log_dbg(color_text(
                 "--> [CPU]: Failed to fetch relevant information of current CPU! — (PROC_FS)",
                 "red"
@@ -93,13 +231,18 @@ class LinuxHardwareManager:
 
             cpu_err(e)
 
+        debugger.log_dbg(color_text(
+            "--> [CPU]: Successfully obtained relevant information of current CPU! — (PROC_FS)",
+            "green"
+        ))
+
         self.info["CPU"] = []
 
-        architecture = subprocess.run(
-            ['uname', '-m'], capture_output=True, text=True)
+        # That of the captured machine, when replaying one.
+        architecture = self.sysfs.machine() or ""
 
         # Check if the architecture is ARM.
-        if architecture.stdout == "aarch64\n" or "arm" in architecture.stdout:
+        if architecture == "aarch64" or "arm" in architecture:
             debugger.log_dbg(color_text(
                 "--> [CPU]: Detected ARM chip – continuing... — (PROC_FS)",
                 "cyan"
@@ -218,9 +361,7 @@ class LinuxHardwareManager:
             # Count the amount of times 'processor'
             # is matched, since threads are enumerated
             # individually.
-            data[model]["Threads"] = (
-                open("/proc/cpuinfo", "r").read().count("processor")
-            )
+            data[model]["Threads"] = cpus.count("processor")
 
             debugger.log_dbg(color_text(
                 "--> [CPU]: Successfully obtained thread count of current CPU! — (PROC_FS)",
@@ -239,126 +380,70 @@ class LinuxHardwareManager:
 
             pass
 
-        if not self.offline:
-            self.cnm = CodenameManager(model, vendor)
+        # CPUID signature, used to look the codename up locally.
+        signature = [
+            re.search(rf"^{field}\s*: (\d+)$", cpu, re.M)
+            for field in ("cpu family", "model", "stepping")
+        ]
+        vendor_id = re.search(r"(?<=vendor_id\t\: ).+(?=\n)", cpu)
 
-            if self.cnm.codename:
-                data[model]["Codename"] = self.cnm.codename
+        self.cnm = CodenameManager(
+            model,
+            vendor_id.group() if vendor_id else vendor,
+            signature=tuple(int(x.group(1)) for x in signature) if all(signature) else None,
+            offline=self.offline
+        )
+
+        if self.cnm.codename:
+            data[model]["Codename"] = self.cnm.codename
 
         self.info.get("CPU").append(data)
 
     def gpu_info(self):
-
-        # Because DD wanted this for WSL*.
-        if not os.path.exists("/sys/class/drm"):
-            debugger.log_dbg(color_text(
-                "--> [GPU]: WSL detected – skipping! — (SYS_FS/DRM)",
-                "cyan"
-            ))
-
-            return
-
         self.info["GPU"] = []
 
-        for file in os.listdir("/sys/class/drm/"):
-
-            # DRM devices (not FBDev) are enumerated with the format `cardX`
-            # inside of sysfs's DRM directory. So we look for those, and traverse
-            # them. We look for the `device` and `vendor` file, which should always be there.
-            if "card" in file and not "-" in file:
-                path = f"/sys/class/drm/{file}/device"
-                data = {}
-
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [GPU]: Attempting to fetch device/vendor IDs... — (SYS_FS/DRM)",
-                        "yellow"
-                    ))
-
-                    ven = open(f"{path}/vendor", "r").read().strip()
-                    dev = open(f"{path}/device", "r").read().strip()
-
-                    data = {"Device ID": dev, "Vendor": ven}
+        # Display controllers (class 0x03), whether
+        # or not they're driven by a DRM driver.
+        for function in self.pci_scanner.devices("GPU"):
+            dev, ven = function.device_id, function.vendor_id
+            data = {"Device ID": dev, "Vendor": ven}
 
-                    debugger.log_dbg(color_text(
-                        "--> [GPU]: Successfully obtained IDs! — (SYS_FS/DRM)",
-                        "green"
-                    ))
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [GPU]: Failed to obtain IDs – critical! — (SYS_FS/DRM)",
-                        "red"
-                    ))
-
-                    self.logger.critical(
-                        f"Failed to obtain vendor/device id for GPU device (SYS_FS/DRM)\n\t^^^^^^^^^{str(e)}",
-                        __file__,
-                    )
-
-                    continue
-
-                if self.offline:
-                    debugger.log_dbg(color_text(
-                        "--> [GPU]: Model name is unobtainable - system is offline – ignoring! — (SYS_FS/DRM)",
-                        "red"
-                    ))
+            debugger.log_dbg(color_text(
+                f"--> [GPU]: Found '{ven}:{dev}' at {function.slot}! — (SYS_FS/PCI)",
+                "green"
+            ))
 
-                    model = "Unknown GPU Device"
-                else:
-                    try:
-                        debugger.log_dbg(color_text(
-                            "--> [GPU]: Attempting to fetch model... — (SYS_FS/DRM)",
-                            "yellow"
-                        ))
-
-                        model = self.pci.get_item(
-                            dev[2:], ven[2:]).get("device")
-
-                        debugger.log_dbg(color_text(
-                            "--> [GPU]: Successfully obtained model! — (SYS_FS/DRM)",
-                            "green"
-                        ))
-                    except Exception:
-                        model = "Unknown GPU Device"
-
-                        debugger.log_dbg(color_text(
-                            "--> [GPU]: Failed to obtain model – ignoring! — (SYS_FS/DRM)",
-                            "red"
-                        ))
-
-                        self.logger.warning(
-                            f"Failed to obtain model for GPU Device (SYS_FS/DRM) – Non-critical, ignoring",
-                            __file__,
-                        )
+            try:
+                pcir = pci_from_acpi_linux(function.path, self.logger, self.pci_topology, function.slot)
 
-                try:
-                    pcir = pci_from_acpi_linux(path, self.logger)
+                if pcir:
+                    acpi = pcir.get("ACPI Path")
+                    pcip = pcir.get("PCI Path")
 
-                    if pcir:
-                        acpi = pcir.get("ACPI Path")
-                        pcip = pcir.get("PCI Path")
+                    if acpi:
+                        data["ACPI Path"] = acpi
 
-                        if acpi:
-                            data["ACPI Path"] = acpi
+                    if pcip:
+                        data["PCI Path"] = pcip
+            except Exception as e:
+                debugger.log_dbg(color_text(
+                    "--> [GPU]: Failed during PCI/ACPI path construction – ignoring! — (SYS_FS/PCI)",
+                    "red"
+                ))
 
-                        if pcip:
-                            data["PCI Path"] = pcip
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [GPU]: Failed during PCI/ACPI path construction – ignoring! — (SYS_FS/DRM)",
-                        "red"
-                    ))
+                self.logger.error(
+                    f"Failed during ACPI/PCI path construction (SYS_FS/PCI)\n\t^^^^^^^^^{str(e)}"
+                )
 
-                    self.logger.error(
-                        f"Failed during ACPI/PCI path construction (SYS_FS/DRM)\n\t^^^^^^^^^{str(e)}"
-                    )
+            gpucname = gpu(dev, ven)
 
-                gpucname = gpu(dev, ven)
+            if gpucname:
+                data["Codename"] = gpucname
 
-                if gpucname:
-                    data["Codename"] = gpucname
+            entry = {"Unknown GPU Device": data}
 
-                self.info["GPU"].append({model: data})
+            self.info["GPU"].append(entry)
+            self.defer_lookup("GPU", entry, dev[2:], ven[2:], default="Unknown GPU Device")
 
     # Special thanks to the following individuals:
     #
@@ -371,513 +456,234 @@ class LinuxHardwareManager:
     #
     # It wouldn't even exist without them.
     def mem_info(self):
-        if not os.path.isdir("/sys/firmware/dmi/entries"):
+        sources = dmi_sources(self.sysfs)
+
+        if not sources:
             debugger.log_dbg(color_text(
-                "--> [RAM]: Individual DMI table entries don't exist – skipping RAM detection! — (SYS_FS/DMI)",
+                "--> [RAM]: DMI tables don't exist – skipping RAM detection! — (SYS_FS/DMI)",
                 "red"
             ))
 
             return
 
-        print(
-            "\nWe apologise for the inconvenience, but we really need you to run this specific call as sudo."
-        )
-        print("It's for extracting information about your system's RAM modules.")
-        print("It's simply running: 'sudo cat /sys/firmware/dmi/entries/17-*/raw'\n")
-
-        response = input(
-            "You can feel free to respond with 'N' if you don't wish to proceed with this! Or 'Y' if you do: "
-        )
+        sudo = not dmi_readable(sources, self.sysfs)
 
-        if "n" in response.lower():
-            print("Cancelled, bailing memory detection...")
+        # Left behind by a privileged run during this boot, if any.
+        cached = privileged_cache.get("dmi") if sudo and not self.sysfs.root else None
 
+        # Only bother the user if the tables
+        # can't be read without privileges.
+        #
+        # Runs under a deadline are unattended; `sudo` is
+        # only given until then, and never prompts for a password.
+        if sudo and cached is None and deadline.active:
             debugger.log_dbg(color_text(
-                "--> [RAM]: Memory detection cancelled – bailing! — (SYS_FS/DMI)",
-                "cyan"
+                "--> [RAM]: Running under a deadline – trying 'sudo' without prompting... — (SYS_FS/DMI)",
+                "yellow"
             ))
-
-            return
-
-        self.info["Memory"] = []
-
-        # DMI table dump of memory slot entries.
-        #
-        # Type 17 indicates a memory slot device.
-        parent_dir = [
-            p
-            for p in os.scandir("/sys/firmware/dmi/entries")
-            if "17-" in p.path.split("/")[-1]
-        ]
-
-        for child_dir in parent_dir:
-
-            # The contents of the binary file.
-            value = subprocess.check_output(
-                [
-                    "sudo",
-                    "cat",
-                    f"{child_dir.path}/raw",
-                ]
+        elif sudo and cached is None:
+            print(
+                "\nWe apologise for the inconvenience, but we really need you to run this specific call as sudo."
             )
-            data = {}
-            part_no = ""
-
-            if "dimm" in value.upper().decode("latin-1").strip().lower():
-                length_field = value[0x1]
-                strings = value[length_field: len(value)].split(b"\0")
+            print("It's for extracting information about your system's RAM modules.")
+            print(f"It's simply running: 'sudo cat {' '.join(sources)}'\n")
 
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Attempting to obtain Part-Number... — (SYS_FS/DMI)",
-                        "yellow"
-                    ))
-
-                    """
-                    ---------------------
-                    |    Part Number    |
-                    ---------------------
-
-                    Obtains the value at offset 1Ah, which indicates at which index, pre-sanitisation,
-                    in the `strings` list the real string value is stored.
-
-                    Which is: `strings[value[0x1A] - 1]`, after obtaining it, it decodes it to `ascii`.
-
-                    Special thanks to [Quist](https://github.com/nadiaholmquist) for this.
-                    """
-                    part_no = get_string_entry(
-                        strings, value[0x1A]).strip() + " (Part Number)"
-                    data[part_no] = {}
-
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Successfully obtained Part-Number! — (SYS_FS/DMI)",
-                        "green"
-                    ))
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Failed to obtain Part-Number – critical! — (SYS_FS/DMI)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
-
-                    self.logger.warning(
-                        f"Unable to determine part number for memory (RAM) module (SYS_FS/DMI)\n\t^^^^^^^^^{str(e)}",
-                        __file__,
-                    )
-
-                    continue
-
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Attempting to obtain DIMM type... — (SYS_FS/DMI)",
-                        "yellow"
-                    ))
-
-                    # The DIMM type value is stored at offset 12h
-                    data[part_no]["Type"] = MEMORY_TYPE[value[0x12]]
-
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Successfully obtained DIMM type! — (SYS_FS/DMI)",
-                        "green"
-                    ))
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Failed to obtain DIMM type – ignoring! — (SYS_FS/DMI)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
-
-                    self.logger.warning(
-                        f"Unable to determine type of memory (RAM) module (SYS_FS/DMI)\n\t^^^^^^^^{str(e)}",
-                        __file__,
-                    )
-
-                    data[part_no]["Type"] = "UNKNOWN"
-
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Attempting to obtain DIMM location... — (SYS_FS/DMI)",
-                        "yellow"
-                    ))
-
-                    # Explanation same as for Part Number.
-                    data[part_no]["Slot"] = {
-                        "Channel": get_string_entry(strings, value[0x10]), 
-                        "Bank": get_string_entry(strings, value[0x11])
-                    }
-
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Successfully obtained DIMM location! — (SYS_FS/DMI)",
-                        "green"
-                    ))
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Failed to obtain DIMM location – critical! — (SYS_FS/DMI)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
-
-                    self.logger.warning(
-                        f"Unable to determine slot location for memory (RAM) module (SYS_FS/DMI)\n\t^^^^^^^^^{str(e)}",
-                        __file__,
-                    )
-
-                    continue
-
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Attempting to obtain manufacturer... — (SYS_FS/DMI)",
-                        "yellow"
-                    ))
+            response = input(
+                "You can feel free to respond with 'N' if you don't wish to proceed with this! Or 'Y' if you do: "
+            )
 
-                    # Explanation same as for Part Number.
-                    data[part_no]["Manufacturer"] = get_string_entry(strings, value[0x17])
+            if "n" in response.lower():
+                print("Cancelled, bailing memory detection...")
 
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Successfully obtained manufacturer! — (SYS_FS/DMI)",
-                        "green"
-                    ))
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Failed to obtain manufacturer – critical! — (SYS_FS/DMI)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
+                debugger.log_dbg(color_text(
+                    "--> [RAM]: Memory detection cancelled – bailing! — (SYS_FS/DMI)",
+                    "cyan"
+                ))
 
-                    self.logger.warning(
-                        f"Unable to determine manufacturer for memory (RAM) module (SYS_FS/DMI)\n\t^^^^^^^^^^^^{str(e)}",
-                        __file__,
-                    )
+                return
 
-                    continue
+        try:
+            debugger.log_dbg(color_text(
+                "--> [RAM]: Attempting to read the SMBIOS table... — (SYS_FS/DMI)",
+                "yellow"
+            ))
 
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Attempting to obtain RAM module capacity... — (SYS_FS/DMI)",
-                        "yellow"
-                    ))
+            if cached is not None:
+                entry, table = split_dmi(cached)
+            else:
+                entry, table = read_dmi(sources, sudo=sudo, reader=self.sysfs, timeout=deadline.timeout())
 
-                    """
-                    ---------------------
-                    |      CAPACITY     |
-                    ---------------------
-
-                    Looks at the 2 bytes at offset 0Ch to hopefully determine its size;
-                    in case the of these 2 bytes is equal to 0x7FFF, it looks at the 4 bytes
-                    at offset 1Ch.
-
-                    In the case that the value at offset 0Ch is equal to 0xFFFF,
-                    it would mean that the size is unknown.
-                    """
-
-                    """
-                    2 bytes, at offset 0Ch
-                    
-                    We convert it into an integer from the bytes values, specifying
-                    that it is in LE (little endian) format.
-                    
-                    Meaning, it will properly accommodate the values to represent its BE (big endian)
-                    value in the end.
-                    
-                    For example,
-                        (  Little  )  (   Big   )
-                        '\x00\x10' -> '\x10\x00'
-                        
-                    Finally, '\x10\x00' will yield `4096` in decimal (0x1000 in hexadecimal);
-                    which is correct. This was done on a system with 4x4GB memory modules.
-                    
-                    Aka, 4x4096MB modules, in this case--since the 15th bit value is `0`, 
-                    meaning it's represented in MB, and not KB.
-                    """
-                    size = int.from_bytes(value[0x0C:0x0E], "little")
-
-                    if size == 0xFFFF:
-                        debugger.log_dbg(color_text(
-                            "--> [RAM]: Failed to determine capacity – ignoring! — (SYS_FS/DMI)",
-                            "red"
-                        ))
-
-                        data["Capacity"] = "UNKNOWN SIZE"
-
-                    # In cases where the individual memory module's
-                    # capacity is `n >= (32GB-1MB)`, the value at 0Ch
-                    # will be `0x7FFF`; meaning we should look at 1Ch instead.
-                    elif size == 0x7FFF:
-                        # 4 bytes, at offset 1Ch
-                        size = int(
-                            "".join(
-                                reversed(value.hex()[0x1C: 0x1C + 0x4])), 16
-                        )
-
-                    # Whether or not the value is represented in KB or MB
-                    #
-                    # 0 - MB
-                    # 1 - KB
-                    rep = "MB" if (size >> 15) & 1 == 0 else "KB"
-
-                    data[part_no]["Capacity"] = f"{size}{rep}"
-
-                    if "unknown" not in data["Capacity"].lower():
-                        debugger.log_dbg(color_text(
-                            "--> [RAM]: Successfully obtained capacity size! — (SYS_FS/DMI)",
-                            "green"
-                        ))
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [RAM]: Failed to obtain capacity size – critical! — (SYS_FS/DMI)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
+                # A replayed machine's tables don't belong to this boot.
+                if not self.sysfs.root:
+                    privileged_cache.store("dmi", entry + table)
 
-                    self.logger.warning(
-                        f"Unable to determine size for memory (RAM) module (SYS_FS/DMI)\n\t^^^^^^^^^{str(e)}",
-                        __file__,
-                    )
-                    
-                    continue
+            # Type 17 indicates a memory slot device.
+            devices = parse_smbios(table, types=[17])[17]
 
-            self.info["Memory"].append(data)
+            debugger.log_dbg(color_text(
+                f"--> [RAM]: Successfully decoded {len(devices)} memory slot(s)! — (SYS_FS/DMI)",
+                "green"
+            ))
+        except Exception as e:
+            # Either `sudo` needed a password, or didn't make it in time.
+            if sudo and cached is None and deadline.active:
+                deadline.degrade(
+                    "Memory", "SMBIOS", "Modules",
+                    "Timed out" if isinstance(e, subprocess.TimeoutExpired) else "Unresolved"
+                )
 
-    def net_info(self):
-        if not os.path.isdir("/sys/class/net"):
             debugger.log_dbg(color_text(
-                "--> [Network]: Network controllers are not enumerated – critical! — (SYS_FS/NET)",
+                "--> [RAM]: Failed to read the SMBIOS table – critical! — (SYS_FS/DMI)" +
+                f"\n\t^^^^^^^{str(e)}",
                 "red"
             ))
 
-            return
-
-        self.info["Network"] = []
-
-        for file in os.listdir("/sys/class/net"):
-            path = f"/sys/class/net/{file}/device"
-            data = {}
-
-            # We ensure that the enumerated directory in the sysfs net
-            # directory is a valid card, since it'll contain a `vendor` and
-            # `device` file.
-            if os.path.isfile("{}/device".format(path)):
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [Network]: Attempting to obtain device/vendor IDs of current NIC... — (SYS_FS/NET)",
-                        "yellow"
-                    ))
-
-                    ven = open(f"{path}/vendor", "r").read().strip()
-                    dev = open(f"{path}/device", "r").read().strip()
-
-                    data = {"Device ID": dev, "Vendor": ven}
-
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [Network]: Failed to obtain IDs of current NICs – critical! — (SYS_FS/NET)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
-
-                    self.logger.error(
-                        f"Failed to obtain vendor/device id for Network controller (SYS_FS/NET)\n\t^^^^^^^^^{str(e)}",
-                        __file__,
-                    )
-
-                    return
+            self.logger.error(
+                f"Failed to read the SMBIOS table (SYS_FS/DMI)\n\t^^^^^^^^^{str(e)}",
+                __file__,
+            )
 
-                if self.offline:
-                    debugger.log_dbg(color_text(
-                        "--> [Network]: Cannot obtain model of current NIC - machine is offline – ignoring! — (SYS_FS/NET)",
-                        "red"
-                    ))
+            return
 
-                    model = "Unknown Network Controller"
-                else:
-                    try:
-                        debugger.log_dbg(color_text(
-                            "--> [Network]: Attempting to obtain model of current NIC... — (SYS_FS/NET)",
-                            "yellow"
-                        ))
-
-                        model = self.pci.get_item(
-                            dev[2:], ven[2:]).get("device")
-                    except Exception:
-                        model = "Unknown Network Controller"
-
-                        debugger.log_dbg(color_text(
-                            "--> [Network]: Failed to obtain model of current NIC – ignoring! — (SYS_FS/NET)" +
-                            f"\n\t^^^^^^^{str(e)}",
-                            "red"
-                        ))
-
-                        self.logger.warning(
-                            f"Failed to obtain model for Network Controller (SYS_FS/NET) – Non-critical, ignoring",
-                            __file__,
-                        )
+        self.info["Memory"] = []
 
-                try:
-                    pcir = pci_from_acpi_linux(path, self.logger)
+        for device in devices:
+            # Empty slot
+            if not device.get("Capacity"):
+                continue
 
-                    if pcir:
-                        acpi = pcir.get("ACPI Path")
-                        pcip = pcir.get("PCI Path")
+            part_no = (device.get("Part Number") or "Unknown") + " (Part Number)"
 
-                        if acpi:
-                            data["ACPI Path"] = acpi
+            # Fields the module's structure doesn't hold are left out.
+            slot = {
+                key: device[key] for key in ("Channel", "Bank") if key in device
+            }
+            fields = {
+                "Type": device.get("Type"),
+                "Slot": slot or None,
+                "Manufacturer": device.get("Manufacturer"),
+                "Capacity": device.get("Capacity"),
+            }
 
-                        if pcip:
-                            data["PCI Path"] = pcip
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [Network]: Failed during PCI/ACPI path construction – ignoring! — (SYS_FS/NET)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
+            self.info["Memory"].append({
+                part_no: {key: value for key, value in fields.items() if value is not None}
+            })
 
-                    self.logger.error(
-                        f"Failed during ACPI/PCI path construction (SYS_FS/NET)\n\t^^^^^^^^^{str(e)}"
-                    )
+    def net_info(self):
+        self.info["Network"] = []
 
-                self.info["Network"].append({model: data})
+        # Network controllers (class 0x02); including
+        # those without an interface, or driver.
+        for function in self.pci_scanner.devices("Network"):
+            dev, ven = function.device_id, function.vendor_id
+            data = {"Device ID": dev, "Vendor": ven}
 
-    def audio_info(self):
-        if not os.path.isabs("/sys/class/sound"):
             debugger.log_dbg(color_text(
-                "--> [Audio]: Audio controllers are not enumerated – critical! — (SYS_FS/SOUND)",
-                "red"
+                f"--> [Network]: Found '{ven}:{dev}' at {function.slot}! — (SYS_FS/PCI)",
+                "green"
             ))
 
-            return
-
-        self.info["Audio"] = []
-        
-        for file in os.listdir("/sys/class/sound"):
-
-            # Sound devices are enumerated similarly to DRM devices,
-            # with the format `cardX`, so we look for those, and look
-            # for `vendor` and `device` files.
-            if "card" in file.lower() and not "-" in file.lower():
-                path = f"/sys/class/sound/{file}/device"
-                data = {}
+            try:
+                pcir = pci_from_acpi_linux(function.path, self.logger, self.pci_topology, function.slot)
 
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [Audio]: Attempting to obtain device/vendor IDs of current Audio controller... — (SYS_FS/SOUND)",
-                        "yellow"
-                    ))
+                if pcir:
+                    acpi = pcir.get("ACPI Path")
+                    pcip = pcir.get("PCI Path")
 
-                    ven = open(f"{path}/vendor", "r").read().strip()
-                    dev = open(f"{path}/device", "r").read().strip()
+                    if acpi:
+                        data["ACPI Path"] = acpi
 
-                    data = {"Device ID": dev, "Vendor": ven}
+                    if pcip:
+                        data["PCI Path"] = pcip
+            except Exception as e:
+                debugger.log_dbg(color_text(
+                    "--> [Network]: Failed during PCI/ACPI path construction – ignoring! — (SYS_FS/PCI)" +
+                    f"\n\t^^^^^^^{str(e)}",
+                    "red"
+                ))
 
-                    debugger.log_dbg(color_text(
-                        "--> [Audio]: Successfully obtained IDs of current Audio controller! — (SYS_FS/SOUND)",
-                        "green"
-                    ))
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [Audio]: Failed to obtain IDs of current Audio controller – critical! — (SYS_FS/SOUND)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
+                self.logger.error(
+                    f"Failed during ACPI/PCI path construction (SYS_FS/PCI)\n\t^^^^^^^^^{str(e)}"
+                )
 
-                    self.logger.warning(
-                        f"Failed to obtain vendor/device id for Audio device/controller (SYS_FS/SOUND)\n\t^^^^^^^^^{str(e)}",
-                        __file__,
-                    )
+            entry = {"Unknown Network Controller": data}
 
-                    continue
+            self.info["Network"].append(entry)
+            self.defer_lookup("Network", entry, dev[2:], ven[2:], default="Unknown Network Controller")
 
-                if self.offline:
-                    debugger.log_dbg(color_text(
-                        "--> [Audio]: Cannot obtain model of current Audio controller - machine is offline – ignoring! — (SYS_FS/SOUND)",
-                        "red"
-                    ))
+    def audio_info(self):
+        self.info["Audio"] = []
 
-                    model = "Unknown Sound Device"
-                else:
-                    try:
-                        debugger.log_dbg(color_text(
-                            "--> [Audio]: Attempting to obtain model of current Audio controller... — (SYS_FS/SOUND)",
-                            "yellow"
-                        ))
-
-                        model = self.pci.get_item(
-                            dev[2:], ven[2:]).get("device")
-
-                        debugger.log_dbg(color_text(
-                            "--> [Audio]: Successfully obtained model of current Audio controller! — (SYS_FS/SOUND)",
-                            "green"
-                        ))
-                    except Exception as e:
-                        model = "Unknown Sound Device"
-
-                        debugger.log_dbg(color_text(
-                            "--> [Audio]: Failed to obtain model of current Audio controller – ignoring! — (SYS_FS/SOUND)" +
-                            f"\n\t^^^^^^^{str(e)}",
-                            "red"
-                        ))
-
-                        self.logger.warning(
-                            f"Failed to obtain model for Audio device/controller (SYS_FS/SOUND) – Non-critical, ignoring",
-                            __file__,
-                        )
+        # Audio and HD-A controllers (class 0x04, subclasses 0x01 and 0x03).
+        for function in self.pci_scanner.devices("Audio"):
+            path = function.path
+            dev, ven = function.device_id, function.vendor_id
+            data = {"Device ID": dev, "Vendor": ven}
 
-                try:
-                    pcir = pci_from_acpi_linux(f"{path}", self.logger)
+            debugger.log_dbg(color_text(
+                f"--> [Audio]: Found '{ven}:{dev}' at {function.slot}! — (SYS_FS/PCI)",
+                "green"
+            ))
 
-                    if pcir:
-                        acpi = pcir.get("ACPI Path")
-                        pcip = pcir.get("PCI Path")
+            try:
+                pcir = pci_from_acpi_linux(path, self.logger, self.pci_topology, function.slot)
 
-                        if acpi:
-                            data["ACPI Path"] = acpi
+                if pcir:
+                    acpi = pcir.get("ACPI Path")
+                    pcip = pcir.get("PCI Path")
 
-                        if pcip:
-                            data["PCI Path"] = pcip
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [Audio]: Failed during PCI/ACPI path construction – ignoring! — (SYS_FS/SOUND)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
+                    if acpi:
+                        data["ACPI Path"] = acpi
 
-                    self.logger.error(
-                        f"Failed during ACPI/PCI path construction (SYS_FS/SOUND)\n\t^^^^^^^^^{str(e)}"
-                    )
+                    if pcip:
+                        data["PCI Path"] = pcip
+            except Exception as e:
+                debugger.log_dbg(color_text(
+                    "--> [Audio]: Failed during PCI/ACPI path construction – ignoring! — (SYS_FS/PCI)" +
+                    f"\n\t^^^^^^^{str(e)}",
+                    "red"
+                ))
 
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [Audio]: Attempting to obtain HDA codec for all matching devices... — (SYS_FS/SOUND)",
-                        "yellow"
-                    ))
+                self.logger.error(
+                    f"Failed during ACPI/PCI path construction (SYS_FS/PCI)\n\t^^^^^^^^^{str(e)}"
+                )
 
-                    dirs = [n for n in os.listdir(
-                        path) if "hdaudio" in n.lower()]
+            try:
+                debugger.log_dbg(color_text(
+                    "--> [Audio]: Attempting to obtain HDA codec for all matching devices... — (SYS_FS/SOUND)",
+                    "yellow"
+                ))
 
-                    for dir in dirs:
-                        if not os.path.isfile(f"{path}/{dir}/chip_name"):
-                            continue
+                dirs = [n for n in self.sysfs.listdir(
+                    path) if "hdaudio" in n.lower()]
 
-                        chip_name = open(
-                            f"{path}/{dir}/chip_name", "r").read().strip()
+                for dir in dirs:
+                    chip_name = self.sysfs.read(f"{path}/{dir}/chip_name")
 
-                        debugger.log_dbg(color_text(
-                            f"--> [Audio]: Obtained '{chip_name}' codec! — (SYS_FS/SOUND)",
-                            "green"
-                        ))
+                    if chip_name is None:
+                        continue
 
-                        data["Codec"] = chip_name
-                except Exception as e:
                     debugger.log_dbg(color_text(
-                        "--> [Audio]: Failed to obtain HDA codec of device! — (SYS_FS/SOUND)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
+                        f"--> [Audio]: Obtained '{chip_name}' codec! — (SYS_FS/SOUND)",
+                        "green"
                     ))
 
-                    self.logger.warning(
-                        f"Failed to obtain HDA codec of device (SYS_FS/SOUND)\n\t^^^^^^^^^{str(e)}"
-                    )
+                    data["Codec"] = chip_name
+            except Exception as e:
+                debugger.log_dbg(color_text(
+                    "--> [Audio]: Failed to obtain HDA codec of device! — (SYS_FS/SOUND)" +
+                    f"\n\t^^^^^^^{str(e)}",
+                    "red"
+                ))
+
+                self.logger.warning(
+                    f"Failed to obtain HDA codec of device (SYS_FS/SOUND)\n\t^^^^^^^^^{str(e)}"
+                )
 
-                self.info.get("Audio").append({model: data})
+            entry = {"Unknown Sound Device": data}
+
+            self.info.get("Audio").append(entry)
+            self.defer_lookup("Audio", entry, dev[2:], ven[2:], default="Unknown Sound Device")
 
     def mobo_info(self):
 
@@ -887,15 +693,20 @@ class LinuxHardwareManager:
         # So we simply look for `board_name` and
         # `board_vendor` to extract its model name,
         # and its vendor's name.
-        try:
-            debugger.log_dbg(color_text(
-                f"--> [Baseboard]: Attempting to obtain information about baseboard... — (SYS_FS/DMI)",
-                "yellow"
-            ))
+        debugger.log_dbg(color_text(
+            f"--> [Baseboard]: Attempting to obtain information about baseboard... — (SYS_FS/DMI)",
+            "yellow"
+        ))
+
+        model = self.sysfs.read("/sys/devices/virtual/dmi/id/board_name")
+        vendor = self.sysfs.read("/sys/devices/virtual/dmi/id/board_vendor")
+
+        if model is None or vendor is None:
+            e = self.sysfs.error(
+                "/sys/devices/virtual/dmi/id/board_name",
+                "/sys/devices/virtual/dmi/id/board_vendor"
+            )
 
-            model = open(f"/sys/devices/virtual/dmi/id/board_name", "r").read().strip()
-            vendor = open(f"/sys/devices/virtual/dmi/id/board_vendor", "r").read().strip()
-        except Exception as e:
             self.logger.critical(
                 f"Failed to obtain Motherboard details (SYS_FS/DMI)\n\t^^^^^^^^^{str(e)}",
                 __file__,
@@ -922,7 +733,7 @@ class LinuxHardwareManager:
 
     def input_info(self):
 
-        if not os.path.isdir("/proc/bus/input/devices"):
+        if not self.sysfs.isfile("/proc/bus/input/devices"):
             debugger.log_dbg(color_text(
                 "--> [Input]: Input devices not enumerated – critical! — (SYS_FS/INPUT)",
                 "red"
@@ -939,15 +750,17 @@ class LinuxHardwareManager:
         #
         # Out of the things we look for,
         # it contains the device name, and its sysfs path.
-        try:
-            debugger.log_dbg(color_text(
-                "--> [Input]: Attempting to obtain list of input devices... — (SYS_FS/INPUT)",
-                "yellow"
-            ))
+        debugger.log_dbg(color_text(
+            "--> [Input]: Attempting to obtain list of input devices... — (SYS_FS/INPUT)",
+            "yellow"
+        ))
+
+        devices = self.sysfs.read("/proc/bus/input/devices")
+        paths = []
+
+        if devices is None:
+            e = self.sysfs.error("/proc/bus/input/devices")
 
-            devices = open("/proc/bus/input/devices", "r").read().strip()
-            sysfs = []
-        except Exception as e:
             debugger.log_dbg(color_text(
                 "--> [Input]: Failed to obtain input devices – critical! — (SYS_FS/INPUT)" +
                 f"\n\t^^^^^^^{str(e)}",
@@ -964,15 +777,15 @@ class LinuxHardwareManager:
         for device in devices.split("\n\n"):
             for line in device.split("\n"):
                 if "sysfs" in line.lower():
-                    sysfs.append("/sys{}".format(line.split("=")[1]))
+                    paths.append("/sys{}".format(line.split("=")[1]))
 
-        if sysfs:
+        if paths:
             debugger.log_dbg(color_text(
                 "--> [Input]: Successfully obtained sysfs paths of input devices! — (SYS_FS/INPUT)",
                 "green"
             ))
 
-        for path in sysfs:
+        for path in paths:
             # RMI4 devices, probably SMBus
             # TODO: I2C RMI4 devices
             if "rmi4" in path.lower():
@@ -980,9 +793,15 @@ class LinuxHardwareManager:
                 if "fn" in path:
                     continue
 
-                if (not os.path.isfile(f"{path}/name")) or (
-                    not os.path.isfile(f"{path}/id/vendor")
-                ):
+                debugger.log_dbg(color_text(
+                    "--> [Input]: Attempting to obtain product/vendor IDs of device using the RMI4 protocol... — (SYS_FS/INPUT)",
+                    "yellow"
+                ))
+
+                prod_id = self.sysfs.read(f"{path}/name")
+                vendor = self.sysfs.read(f"{path}/id/vendor")
+
+                if prod_id is None or vendor is None:
                     debugger.log_dbg(color_text(
                         "--> [Input]: Failed to identify device using the RMI4 protocol – skipping! — (SYS_FS/INPUT)",
                         "red"
@@ -995,32 +814,10 @@ class LinuxHardwareManager:
 
                     continue
 
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Attempting to obtain product/vendor IDs of device using the RMI4 protocol... — (SYS_FS/INPUT)",
-                        "yellow"
-                    ))
-
-                    prod_id = open(f"{path}/name", "r").read().strip()
-                    vendor = open(f"{path}/id/vendor", "r").read().strip()
-
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Successfully obtained product/vendor IDs! — (SYS_FS/INPUT)",
-                        "green"
-                    ))
-                except Exception as e:
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Failed to obtain product/vendor IDs of device using the RMI4 protocol – skipping! — (SYS_FS/INPUT)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
-
-                    self.logger.error(
-                        f"Failed to obtain product/vendor id of device using the RMI4 protocol (SYS_FS/INPUT) – Skipping",
-                        __file__,
-                    )
-
-                    continue
+                debugger.log_dbg(color_text(
+                    "--> [Input]: Successfully obtained product/vendor IDs! — (SYS_FS/INPUT)",
+                    "green"
+                ))
 
                 self.info["Input"].append(
                     {
@@ -1033,7 +830,14 @@ class LinuxHardwareManager:
 
             # PS2 devices
             if "i8042" in path.lower():
-                if not os.path.isfile(f"{path}/name"):
+                debugger.log_dbg(color_text(
+                    "--> [Input]: Attempting to obtain name of PS2 device... — (SYS_FS/INPUT)",
+                    "yellow"
+                ))
+
+                name = self.sysfs.read(f"{path}/name")
+
+                if name is None:
                     debugger.log_dbg(color_text(
                         "--> [Input]: Failed to identify PS2 device – skipping! — (SYS_FS/INPUT)",
                         "red"
@@ -1046,31 +850,10 @@ class LinuxHardwareManager:
 
                     continue
 
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Attempting to obtain name of PS2 device... — (SYS_FS/INPUT)",
-                        "yellow"
-                    ))
-
-                    name = open(f"{path}/name").read().strip()
-
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Successfully obtained name! — (SYS_FS/INPUT)",
-                        "green"
-                    ))
-                except Exception:
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Failed to obtain name of PS2 device – skipping! — (SYS_FS/INPUT)" +
-                        f"\n\t^^^^^^^{str(e)}",
-                        "red"
-                    ))
-
-                    self.logger.warning(
-                        f"Failed to obtain PS2 device name (SYS_FS/INPUT) – Non-critical, ignoring",
-                        __file__,
-                    )
-
-                    continue
+                debugger.log_dbg(color_text(
+                    "--> [Input]: Successfully obtained name! — (SYS_FS/INPUT)",
+                    "green"
+                ))
 
                 port = re.search("\d+(?=\/input)", path)
 
@@ -1106,7 +889,7 @@ class LinuxHardwareManager:
             if "i2c" in path.lower():
                 _data = {}
 
-                if not os.path.isfile(f"{path}/id"):
+                if not self.sysfs.isfile(f"{path}/id"):
                     debugger.log_dbg(color_text(
                         "--> [Input]: Failed to obtain device/vendor ID of I2C device – ignoring! — (SYS_FS/INPUT)",
                         "red"
@@ -1119,25 +902,17 @@ class LinuxHardwareManager:
 
                     name = {"device": "Ambiguous Input Device (I2C)"}
 
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Attempting to obtain device/vendor ID of I2C device... — (SYS_FS/INPUT)",
-                        "yellow"
-                    ))
+                debugger.log_dbg(color_text(
+                    "--> [Input]: Attempting to obtain device/vendor ID of I2C device... — (SYS_FS/INPUT)",
+                    "yellow"
+                ))
 
-                    ven = open(f"{path}/id/vendor").read().strip()
-                    dev = open(f"{path}/id/device").read().strip()
+                ven = self.sysfs.read(f"{path}/id/vendor")
+                dev = self.sysfs.read(f"{path}/id/device")
 
-                    _data = {
-                        "Device ID": dev,
-                        "Vendor ID": ven,
-                    }
+                if ven is None or dev is None:
+                    e = self.sysfs.error(f"{path}/id/vendor", f"{path}/id/device")
 
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Successfully obtained device/vendor ID of of I2C device! — (SYS_FS/INPUT)",
-                        "green"
-                    ))
-                except Exception as e:
                     debugger.log_dbg(color_text(
                         "--> [Input]: Failed to obtain device/vendor ID of of I2C device... — (SYS_FS/INPUT)" +
                         f"\n\t^^^^^^^{str(e)}",
@@ -1151,6 +926,16 @@ class LinuxHardwareManager:
 
                     continue
 
+                _data = {
+                    "Device ID": dev,
+                    "Vendor ID": ven,
+                }
+
+                debugger.log_dbg(color_text(
+                    "--> [Input]: Successfully obtained device/vendor ID of of I2C device! — (SYS_FS/INPUT)",
+                    "green"
+                ))
+
                 self.info["Input"].append({
                     name.get("device"): _data
                 })
@@ -1164,26 +949,23 @@ class LinuxHardwareManager:
 
                 continue
 
-            if os.path.isfile(f"{path}/id/vendor"):
+            if self.sysfs.isfile(f"{path}/id/vendor"):
                 debugger.log_dbg(color_text(
                     "--> [Input]: Detected ambiguous input device! — (SYS_FS/INPUT)",
                     "cyan"
                 ))
 
-                try:
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Attempting to obtain product/vendor IDs of ambiguous input device... — (SYS_FS/INPUT)",
-                        "yellow"
-                    ))
+                debugger.log_dbg(color_text(
+                    "--> [Input]: Attempting to obtain product/vendor IDs of ambiguous input device... — (SYS_FS/INPUT)",
+                    "yellow"
+                ))
 
-                    dev = "0x" + open(f"{path}/id/product", "r").read().strip()
-                    ven = "0x" + open(f"{path}/id/vendor", "r").read().strip()
+                product = self.sysfs.read(f"{path}/id/product")
+                vendor = self.sysfs.read(f"{path}/id/vendor")
+
+                if product is None or vendor is None:
+                    e = self.sysfs.error(f"{path}/id/product", f"{path}/id/vendor")
 
-                    debugger.log_dbg(color_text(
-                        "--> [Input]: Successfully obtained IDs! — (SYS_FS/INPUT)",
-                        "green"
-                    ))
-                except Exception as e:
                     debugger.log_dbg(color_text(
                         "--> [Input]: Failed to obtain product/vendor IDs of ambiguous input device – skipping! — (SYS_FS/INPUT)" +
                         f"\n\t^^^^^^^{str(e)}",
@@ -1197,54 +979,29 @@ class LinuxHardwareManager:
 
                     continue
 
+                dev = "0x" + product
+                ven = "0x" + vendor
+
+                debugger.log_dbg(color_text(
+                    "--> [Input]: Successfully obtained IDs! — (SYS_FS/INPUT)",
+                    "green"
+                ))
+
                 if ven and dev:
-                    if self.offline:
-                        debugger.log_dbg(color_text(
-                            "--> [Input]: Cannot obtain model of ambiguous input device - machine is offline – ignoring! — (SYS_FS/INPUT)",
-                            "red"
-                        ))
-
-                        name = {"device": "Unknown Input Device"}
-
-                    else:
-                        try:
-                            debugger.log_dbg(color_text(
-                                "--> [Input]: Attempting to obtain model of ambiguous input device... — (SYS_FS/INPUT)",
-                                "yellow"
-                            ))
-
-                            name = self.pci.get_item(
-                                dev[2:], ven[2:], types="usb")
-
-                            debugger.log_dbg(color_text(
-                                "--> [Input]: Successfully obtained model of ambiguous input device! — (SYS_FS/INPUT)",
-                                "green"
-                            ))
-                        except Exception as e:
-                            name = {"device": "Unknown Input Device"}
-
-                            debugger.log_dbg(color_text(
-                                "--> [Input]: Failed to obtain model of ambiguous input device – ignoring! — (SYS_FS/INPUT)" +
-                                f"\n\t^^^^^^^{str(e)}",
-                                "red"
-                            ))
-
-                            self.logger.warning(
-                                f"Failed to obtain model for Input device (SYS_FS/INPUT) – Non-critical, ignoring",
-                                __file__,
-                            )
-
-                    self.info["Input"].append(
-                        {
-                            name.get("device", "Unknown Input Device"): {
-                                "Device ID": dev,
-                                "Vendor": ven,
-                            }
+                    entry = {
+                        "Unknown Input Device": {
+                            "Device ID": dev,
+                            "Vendor": ven,
                         }
+                    }
+
+                    self.info["Input"].append(entry)
+                    self.defer_lookup(
+                        "Input", entry, dev[2:], ven[2:], types="usb", default="Unknown Input Device"
                     )
 
     def block_info(self):
-        if not os.path.isdir("/sys/block"):
+        if not self.sysfs.isdir("/sys/block"):
             debugger.log_dbg(color_text(
                 "--> [Storage]: Storage devices are not enumerated – critical! — (SYS_FS/BLOCK)",
                 "red"
@@ -1253,12 +1010,16 @@ class LinuxHardwareManager:
             return
 
         self.info["Storage"] = []
-        
+
+        # NVMe controllers which aren't backing any block device below,
+        # e.g. as they aren't bound to a driver, are reported on their own.
+        controllers = {function.slot for function in self.pci_scanner.devices("Storage")}
+
         # Block devices are found under /sys/block/
         # For each device, we check its
         # `model`, `rotational`, device file name, and `removable`
         # to report its Model, Type, Connector and Location
-        for folder in os.listdir("/sys/block"):
+        for folder in self.sysfs.listdir("/sys/block"):
             # Enclosing directory of
             # this block device.
             path = f"/sys/block/{folder}"
@@ -1273,69 +1034,66 @@ class LinuxHardwareManager:
                 continue
 
             # Check properties of the block device
-            try:
-                debugger.log_dbg(color_text(
-                    "--> [Storage]: Fetching relevant information of current Storage device... — (SYS_FS/BLOCK)",
-                    "yellow"
-                ))
+            debugger.log_dbg(color_text(
+                "--> [Storage]: Fetching relevant information of current Storage device... — (SYS_FS/BLOCK)",
+                "yellow"
+            ))
+
+            dev = ven = vendor = ""
+            model = self.sysfs.read(f"{path}/device/model")
+            rotational = self.sysfs.read_int(f"{path}/queue/rotational")
+            removable = self.sysfs.read_int(f"{path}/removable")
+
+            # FIXME: USB block devices all report as HDDs?
+            drive_type = (
+                "Solid State Drive (SSD)"
+                if rotational == 0
+                else "Hard Disk Drive (HDD)"
+            )
+            location = "Internal" if removable == 0 else "External"
 
-                model = open(f"{path}/device/model", "r").read().strip()
-                rotational = open(
-                    f"{path}/queue/rotational", "r").read().strip()
-                removable = open(f"{path}/removable", "r").read().strip()
+            if "nvme" in folder:
+                connector = "PCIe"
+                drive_type = "Non-Volatile Memory Express (NVMe)"
 
-                # FIXME: USB block devices all report as HDDs?
-                drive_type = (
-                    "Solid State Drive (SSD)"
-                    if rotational == "0"
-                    else "Hard Disk Drive (HDD)"
+                # Uses PCI vendor & device ids to get a vendor for the NVMe block device;
+                # the controller's function was already identified by the PCI scan.
+                function = self.pci_scanner.function(
+                    os.path.basename(self.sysfs.realpath(f"{path}/device/device"))
                 )
-                location = "Internal" if removable == "0" else "External"
-
-                if "nvme" in folder:
-                    connector = "PCIe"
-                    drive_type = "Non-Volatile Memory Express (NVMe)"
-
-                    # Uses PCI vendor & device ids to get a vendor for the NVMe block device
-                    dev = open(f"{path}/device/device/device",
-                               "r").read().strip()
-                    ven = open(f"{path}/device/device/vendor",
-                               "r").read().strip()
-
-                    if self.offline:
-                        vendor = ""
-
-                    else:
-                        try:
-                            vendor = self.pci.get_item(
-                                dev[2:], ven[2:]).get("vendor", "")
-                        except Exception as e:
-                            vendor = ""
-
-                            debugger.log_dbg(color_text(
-                                "--> [Storage]: Failed to obtain vendor of current Storage device – ignoring! — (SYS_FS/BLOCK)" +
-                                f"\n\t^^^^^^^{str(e)}",
-                                "red"
-                            ))
-
-                            self.logger.warning(
-                                f"Failed to obtain vendor for block device (SYS_FS/BLOCK) – Non-critical, ignoring"
-                            )
-
-                elif "sd" in folder:
-                    # TODO: Choose correct connector type for block devices that use the SCSI subsystem
-                    connector = "SCSI"
-                    vendor = open(f"{path}/device/vendor", "r").read().strip()
 
+                if function:
+                    controllers.discard(function.slot)
+                    dev, ven = function.device_id, function.vendor_id
                 else:
-                    debugger.log_dbg(color_text(
-                        "--> [Storage]: Unknown connector type – ignoring! — (SYS_FS/BLOCK)",
-                        "red"
-                    ))
+                    dev = self.sysfs.read(f"{path}/device/device/device")
+                    ven = self.sysfs.read(f"{path}/device/device/vendor")
 
-                    connector = "Unknown"
+                # The vendor is resolved during the enrichment stage.
+
+            elif "sd" in folder:
+                # TODO: Choose correct connector type for block devices that use the SCSI subsystem
+                connector = "SCSI"
+                vendor = self.sysfs.read(f"{path}/device/vendor")
+
+            else:
+                debugger.log_dbg(color_text(
+                    "--> [Storage]: Unknown connector type – ignoring! — (SYS_FS/BLOCK)",
+                    "red"
+                ))
+
+                connector = "Unknown"
+
+            if None in (model, rotational, removable, dev, ven, vendor):
+                e = self.sysfs.error(
+                    f"{path}/device/model",
+                    f"{path}/queue/rotational",
+                    f"{path}/removable",
+                    f"{path}/device/device/device",
+                    f"{path}/device/device/vendor",
+                    f"{path}/device/vendor",
+                )
 
-            except Exception as e:
                 debugger.log_dbg(color_text(
                     "--> [Storage]: Failed to obtain block device info – critical! — (SYS_FS/BLOCK)" +
                     f"\n\t^^^^^^^{str(e)}",
@@ -1348,12 +1106,89 @@ class LinuxHardwareManager:
                 )
                 return
 
-            self.info["Storage"].append(
-                {
-                    f"{vendor} {model}": {
-                        "Type": drive_type,
-                        "Connector": connector,
-                        "Location": location,
-                    }
+            entry = {
+                f"{vendor} {model}": {
+                    "Type": drive_type,
+                    "Connector": connector,
+                    "Location": location,
                 }
-            )
+            }
+
+            if connector == "PCIe":
+                try:
+                    pcir = pci_from_acpi_linux(f"{path}/device/device", self.logger, self.pci_topology)
+
+                    if pcir:
+                        acpi = pcir.get("ACPI Path")
+                        pcip = pcir.get("PCI Path")
+
+                        if acpi:
+                            entry[f"{vendor} {model}"]["ACPI Path"] = acpi
+
+                        if pcip:
+                            entry[f"{vendor} {model}"]["PCI Path"] = pcip
+                except Exception as e:
+                    debugger.log_dbg(color_text(
+                        "--> [Storage]: Failed during PCI/ACPI path construction – ignoring! — (SYS_FS/BLOCK)" +
+                        f"\n\t^^^^^^^{str(e)}",
+                        "red"
+                    ))
+
+                    self.logger.error(
+                        f"Failed during ACPI/PCI path construction (SYS_FS/BLOCK)\n\t^^^^^^^^^{str(e)}"
+                    )
+
+            self.info["Storage"].append(entry)
+
+            if connector == "PCIe":
+                self.defer_lookup(
+                    "Storage", 
+                    entry, 
+                    dev[2:], 
+                    ven[2:], 
+                    default=f" {model}", 
+                    name=lambda item, model=model: f"{item.get('vendor', '')} {model}"
+                )
+
+        for slot in sorted(controllers):
+            function = self.pci_scanner.function(slot)
+            dev, ven = function.device_id, function.vendor_id
+            data = {
+                "Type": "Non-Volatile Memory Express (NVMe)",
+                "Connector": "PCIe",
+                "Device ID": dev,
+                "Vendor": ven,
+            }
+
+            debugger.log_dbg(color_text(
+                f"--> [Storage]: Found NVMe controller '{ven}:{dev}' at {slot}, without any block device! — (SYS_FS/PCI)",
+                "yellow"
+            ))
+
+            try:
+                pcir = pci_from_acpi_linux(function.path, self.logger, self.pci_topology, slot)
+
+                if pcir:
+                    acpi = pcir.get("ACPI Path")
+                    pcip = pcir.get("PCI Path")
+
+                    if acpi:
+                        data["ACPI Path"] = acpi
+
+                    if pcip:
+                        data["PCI Path"] = pcip
+            except Exception as e:
+                debugger.log_dbg(color_text(
+                    "--> [Storage]: Failed during PCI/ACPI path construction – ignoring! — (SYS_FS/PCI)" +
+                    f"\n\t^^^^^^^{str(e)}",
+                    "red"
+                ))
+
+                self.logger.error(
+                    f"Failed during ACPI/PCI path construction (SYS_FS/PCI)\n\t^^^^^^^^^{str(e)}"
+                )
+
+            entry = {"Unknown NVMe Controller": data}
+
+            self.info["Storage"].append(entry)
+            self.defer_lookup("Storage", entry, dev[2:], ven[2:], default="Unknown NVMe Controller")
@@ -0,0 +1,171 @@
+import struct
+import threading
+
+from src.info import color_text
+from src.util.debugger import Debugger as debugger
+from src.util.sysfs_reader import SysfsReader
+
+PCI_DEVICES = "/sys/bus/pci/devices"
+
+# Only the standard header – the first 64 bytes of the configuration
+# space – is readable without privileges; which is all that's needed.
+HEADER_SIZE = 64
+
+# Vendor ID, device ID, (command, status,) revision ID,
+# programming interface, subclass and (base) class.
+_HEADER = struct.Struct("<HH4xBBBB")
+
+# Subsystem vendor ID and subsystem ID; only present in type 0 (endpoint) headers.
+_SUBSYSTEM = struct.Struct("<HH")
+_SUBSYSTEM_OFFSET = 0x2C
+_HEADER_TYPE_OFFSET = 0x0E
+
+# Category of the functions of each `(class, subclass)`,
+# or `class`, regardless of the subclass.
+#
+# https://pcisig.com/sites/default/files/files/PCI_Code-ID_r_1_11__v24_Jan_2019.pdf
+CATEGORIES = {
+    0x02: "Network",
+    0x03: "GPU",
+    (0x01, 0x08): "Storage",  # Non-Volatile Memory controller (NVMe)
+    (0x04, 0x01): "Audio",  # Multimedia audio controller
+    (0x04, 0x03): "Audio",  # High Definition Audio (HD-A) controller
+}
+
+
+class PCIFunction:
+    """The identity of a PCI function, as decoded from its configuration header."""
+
+    __slots__ = (
+        "slot", "path", "vendor", "device", "subsystem_vendor",
+        "subsystem_device", "class_code", "revision"
+    )
+
+    def __init__(self, slot, header):
+        vendor, device, revision, interface, subclass, base = _HEADER.unpack_from(header)
+
+        self.slot = slot
+        self.path = f"{PCI_DEVICES}/{slot}"
+        self.vendor = vendor
+        self.device = device
+        self.revision = revision
+        self.class_code = (base << 16) | (subclass << 8) | interface
+
+        if header[_HEADER_TYPE_OFFSET] & 0x7F == 0:
+            self.subsystem_vendor, self.subsystem_device = _SUBSYSTEM.unpack_from(header, _SUBSYSTEM_OFFSET)
+        else:
+            self.subsystem_vendor = self.subsystem_device = None
+
+    @property
+    def vendor_id(self):
+        """Vendor ID, formatted as sysfs does; e.g. `0x8086`."""
+
+        return f"0x{self.vendor:04x}"
+
+    @property
+    def device_id(self):
+        return f"0x{self.device:04x}"
+
+    @property
+    def category(self):
+        base, subclass = self.class_code >> 16, (self.class_code >> 8) & 0xFF
+
+        return CATEGORIES.get((base, subclass)) or CATEGORIES.get(base)
+
+
+class PCIScanner:
+    """
+    Every PCI function on Linux, found in a single pass over
+    `/sys/bus/pci/devices`, and sorted into categories by class code.
+
+    Each function is identified by reading its configuration header with
+    a single `preadv`, into a buffer shared by every function – instead of
+    opening its `vendor`, `device`, ... sysfs attributes one by one.
+    Functions which aren't bound to any driver are found as well.
+
+    The scan is done (once) the first time it's needed;
+    and is shared by every collector.
+    """
+
+    def __init__(self, reader=None):
+        self.reader = reader or SysfsReader()
+        self.lock = threading.Lock()
+        self.buffer = bytearray(HEADER_SIZE)
+        self.functions = None
+        self.categories = None
+
+    def scan(self):
+        with self.lock:
+            if self.functions is not None:
+                return
+
+            functions = {}
+            categories = {}
+
+            if not self.reader.isdir(PCI_DEVICES):
+                debugger.log_dbg(color_text(
+                    "--> [PCI]: PCI functions are not enumerated – ignoring! — (SYS_FS/PCI)",
+                    "red"
+                ))
+
+            for slot in sorted(self.reader.listdir(PCI_DEVICES)):
+                function = self._read(slot)
+
+                if not function:
+                    continue
+
+                functions[slot] = function
+
+                if function.category:
+                    categories.setdefault(function.category, []).append(function)
+
+            self.functions = functions
+            self.categories = categories
+
+            debugger.log_dbg(color_text(
+                f"--> [PCI]: Scanned {len(functions)} PCI function(s)! — (SYS_FS/PCI)",
+                "green"
+            ))
+
+    def _read(self, slot):
+        try:
+            size = self.reader.readinto(f"{PCI_DEVICES}/{slot}/config", self.buffer)
+        except OSError as e:
+            debugger.log_dbg(color_text(
+                f"--> [PCI]: Failed to read configuration header of '{slot}' – ignoring! — (SYS_FS/PCI)" +
+                f"\n\t^^^^^^^{str(e)}",
+                "red"
+            ))
+
+            return None
+
+        if size < HEADER_SIZE:
+            return None
+
+        function = PCIFunction(slot, self.buffer)
+
+        # SR-IOV virtual functions read 0xFFFF as their vendor and device IDs,
+        # which the kernel fills in from their physical function's; so does sysfs.
+        if function.vendor == 0xFFFF:
+            function.vendor = self.reader.read_hex(f"{function.path}/vendor")
+            function.device = self.reader.read_hex(f"{function.path}/device")
+
+            # ... or the function isn't present (anymore).
+            if function.vendor is None or function.device is None:
+                return None
+
+        return function
+
+    def devices(self, category):
+        """Every function of `category` (see `CATEGORIES`), in order of their slots."""
+
+        if self.functions is None:
+            self.scan()
+
+        return self.categories.get(category, [])
+
+    def function(self, slot):
+        if self.functions is None:
+            self.scan()
+
+        return self.functions.get(slot)
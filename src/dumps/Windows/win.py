@@ -5,10 +5,11 @@ from .cpuid import CPUID
 from .win_enum import BUS_TYPE, MEDIA_TYPE, MEMORY_TYPE
 from src.info import color_text
 from src.util.codename_manager import CodenameManager
-from src.util.codename import gpu as _gpu
+from src.util.codename import cpu_signature, gpu as _gpu
 from src.util.debugger import Debugger as debugger
 from src.util.driver_type import protocol
 from src.util.pci_root import pci_from_acpi_win
+from src.util.timings import Timings as timings
 from src.error.cpu_err import cpu_err
 from operator import itemgetter
 
@@ -32,42 +33,50 @@ class WindowsHardwareManager:
     def dump(self):
         if not "CPU" in self.off_data and not self.info.get("CPU", []):
             debugger.log_dbg("--> [WINDOWS]: Attempting to fetch CPU information...")
-            self.cpu_info()
+            with timings.span("collector.cpu_info"):
+                self.cpu_info()
             debugger.log_dbg()
 
         if not "Motherboard" in self.off_data and not self.info.get("Motherboard", {}):
             debugger.log_dbg("--> [WINDOWS]: Attempting to fetch Motherboard information...")
-            self.mobo_info()
+            with timings.span("collector.mobo_info"):
+                self.mobo_info()
             debugger.log_dbg()
 
         if not "GPU" in self.off_data and not self.info.get("GPU", []):
             debugger.log_dbg("--> [WINDOWS]: Attempting to fetch GPU information...")
-            self.gpu_info()
+            with timings.span("collector.gpu_info"):
+                self.gpu_info()
             debugger.log_dbg()
 
         if not "Memory" in self.off_data and not self.info.get("Memory", []):
             debugger.log_dbg("--> [WINDOWS]: Attempting to fetch RAM information...")
-            self.mem_info()
+            with timings.span("collector.mem_info"):
+                self.mem_info()
             debugger.log_dbg()
 
         if not "Network" in self.off_data and not self.info.get("Network", []):
             debugger.log_dbg("--> [WINDOWS]: Attempting to fetch NIC information...")
-            self.net_info()
+            with timings.span("collector.net_info"):
+                self.net_info()
             debugger.log_dbg()
 
         if not "Audio" in self.off_data and not self.info.get("Audio", []):
             debugger.log_dbg("--> [WINDOWS]: Attempting to fetch Audio information...")
-            self.audio_info()
+            with timings.span("collector.audio_info"):
+                self.audio_info()
             debugger.log_dbg()
 
         if not "Input" in self.off_data and not self.info.get("Input", []):
             debugger.log_dbg("--> [WINDOWS]: Attempting to fetch Input device information...")
-            self.input_info()
+            with timings.span("collector.input_info"):
+                self.input_info()
             debugger.log_dbg()
 
         if not "Storage" in self.off_data and not self.info.get("Storage", []):
             debugger.log_dbg("--> [WINDOWS]: Attempting to fetch Storage information...")
-            self.storage_info()
+            with timings.span("collector.storage_info"):
+                self.storage_info()
             debugger.log_dbg()
 
     # Credits: https://github.com/flababah/cpuid.py/blob/master/example.py#L25
@@ -165,11 +174,15 @@ class WindowsHardwareManager:
                 "green"
             ))
 
-            if not self.offline:
-                self.cnm = CodenameManager(model, manufacturer)
+            self.cnm = CodenameManager(
+                model,
+                manufacturer,
+                signature=cpu_signature(cpu(1)[0]),
+                offline=self.offline
+            )
 
-                if self.cnm.codename:
-                    data["Codename"] = self.cnm.codename
+            if self.cnm.codename:
+                data["Codename"] = self.cnm.codename
 
             self.info["CPU"].append({model: data})
 
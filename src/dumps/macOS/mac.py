@@ -8,6 +8,7 @@ from src.util.codename import gpu
 from src.util.codename_manager import CodenameManager
 from src.util.debugger import Debugger as debugger
 from src.util.pci_root import construct_pcip_osx
+from src.util.timings import Timings as timings
 
 
 class MacHardwareManager:
@@ -35,51 +36,60 @@ class MacHardwareManager:
     def dump(self):
         if not "CPU" in self.off_data and not self.info.get("CPU", []):
             debugger.log_dbg("--> [OSX]: Attempting to fetch CPU information...")
-            self.cpu_info()
+            with timings.span("collector.cpu_info"):
+                self.cpu_info()
             debugger.log_dbg()
 
         if (
             not "Vendor" in self.off_data or not "Motherboard" in self.off_data
         ) and not self.info.get("Vendor", {}):
             debugger.log_dbg("--> [OSX]: Attempting to fetch Baseboard information...")
-            self.vendor_info()
+            with timings.span("collector.vendor_info"):
+                self.vendor_info()
             debugger.log_dbg()
 
         if not "GPU" in self.off_data and not self.info.get("GPU", []):
             debugger.log_dbg("--> [OSX]: Attempting to fetch GPU information...")
-            self.gpu_info()
+            with timings.span("collector.gpu_info"):
+                self.gpu_info()
             debugger.log_dbg()
 
         if not "Memory" in self.off_data and not self.info.get("Memory", []):
             debugger.log_dbg("--> [OSX]: Attempting to fetch RAM information...")
-            self.mem_info()
+            with timings.span("collector.mem_info"):
+                self.mem_info()
             debugger.log_dbg()
 
         if not "Network" in self.off_data and not self.info.get("Network", []):
             debugger.log_dbg("--> [OSX]: Attempting to fetch NIC information...")
-            self.net_info()
+            with timings.span("collector.net_info"):
+                self.net_info()
             debugger.log_dbg()
 
         if not "Audio" in self.off_data and not self.info.get("Audio", []):
             debugger.log_dbg("--> [OSX]: Attempting to fetch Audio information...")
-            self.audio_info()
+            with timings.span("collector.audio_info"):
+                self.audio_info()
             debugger.log_dbg()
 
         if not "Input" in self.off_data and not self.info.get("Input", []):
             debugger.log_dbg(
                 "--> [OSX]: Attempting to fetch Input device information..."
             )
-            self.input_info()
+            with timings.span("collector.input_info"):
+                self.input_info()
             debugger.log_dbg()
 
         if not "Storage" in self.off_data and not self.info.get("Storage", []):
             debugger.log_dbg("--> [OSX]: Attempting to fetch Storage information...")
-            self.storage_info()
+            with timings.span("collector.storage_info"):
+                self.storage_info()
             debugger.log_dbg()
 
         if not "Display" in self.off_data and not self.info.get("Display", []):
             debugger.log_dbg("--> [OSX]: Attempting to fetch Display information...")
-            self.display_info()
+            with timings.span("collector.display_info"):
+                self.display_info()
             debugger.log_dbg()
 
     def cpu_info(self):
@@ -223,11 +233,10 @@ class MacHardwareManager:
                 "Supported" if features.lower().find("ssse3") > -1 else "Not Available"
             )
 
-        if not self.offline:
-            self.cnm = CodenameManager(model, self.vendor)
+        self.cnm = CodenameManager(model, self.vendor, offline=self.offline)
 
-            if self.cnm.codename:
-                data["Codename"] = self.cnm.codename
+        if self.cnm.codename:
+            data["Codename"] = self.cnm.codename
 
         self.info["CPU"].append({model: data})
 
@@ -1,57 +1,45 @@
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from platform import system
+from src import info
 from src.info import AppInfo
+from src.util.log_backend import BatchedFileHandler, LogBackend as log_backend
 
 class Logger:
     """
     Instance responsible for properly handling,
     formatting and logging information about the
     application's state.
+
+    Records are written to `ocsysinfo.log` in the background (see `LogBackend`),
+    which is rotated once it reaches `info.log_max_bytes`.
     """
 
     def __init__(self, path=AppInfo.root_dir):
         # Basic formats.
-        self.format = "%(asctime)s | {} | %(levelname)s: %(message)s"
+        self.format = "%(asctime)s | %(source)s | %(levelname)s: %(message)s"
         self.date = "%m/%d/%Y %I:%M:%S %p"
 
-        # Adding the base log handlers.
-        self.handler = logging.getLogger()
-        self.rotating = RotatingFileHandler(os.path.join(path, "ocsysinfo.log"), mode="a", maxBytes=2 ** 13)
-
-        # Add the RotatingFileHandler to the default logger.
-        self.handler.addHandler(self.rotating)
-        self.rotating.setFormatter(
-            logging.Formatter(
-                self.format.format(os.path.basename(__file__)), datefmt=self.date
-            )
+        self.rotating = BatchedFileHandler(
+            os.path.join(path, "ocsysinfo.log"),
+            max_bytes=info.log_max_bytes,
+            backups=info.log_backups,
         )
+        self.rotating.setFormatter(logging.Formatter(self.format, datefmt=self.date))
+
+        self.handler = log_backend.attach("ocsysinfo", self.rotating)
+        self.handler.setLevel(logging.INFO)
+
+    def _log(self, level, message, file):
+        self.handler.log(level, message, extra={"source": os.path.basename(file)})
 
     def critical(self, message, file="UNKNOWN"):
-        self.handler.setLevel(logging.CRITICAL)
-        self.rotating.setFormatter(
-            logging.Formatter(self.format.format(os.path.basename(file)))
-        )
-        self.handler.critical(message)
+        self._log(logging.CRITICAL, message, file)
 
     def error(self, message, file="UNKNOWN"):
-        self.handler.setLevel(logging.ERROR)
-        self.rotating.setFormatter(
-            logging.Formatter(self.format.format(os.path.basename(file)))
-        )
-        self.handler.error(message)
+        self._log(logging.ERROR, message, file)
 
     def info(self, message, file="UNKNOWN"):
-        self.handler.setLevel(logging.INFO)
-        self.rotating.setFormatter(
-            logging.Formatter(self.format.format(os.path.basename(file)))
-        )
-        self.handler.info(message)
+        self._log(logging.INFO, message, file)
 
     def warning(self, message, file="UNKNOWN"):
-        self.handler.setLevel(logging.WARNING)
-        self.rotating.setFormatter(
-            logging.Formatter(self.format.format(os.path.basename(file)))
-        )
-        self.handler.warning(message)
+        self._log(logging.WARNING, message, file)
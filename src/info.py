@@ -18,6 +18,7 @@ class AppInfo:
     os_ver = ""
     arch = platform.machine()
     root_dir = ""
+    data_dir = ""
 
     def set_root_dir(new_dir):
         if not os.path.isdir(new_dir):
@@ -73,9 +74,9 @@ def format_text(text, formatting):
 
     return final_string
 
-def clear_ansi(text):
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
+def clear_ansi(text):
     return ansi_escape.sub('', text)
 
 surprise = f"""{cyan}
@@ -109,3 +110,56 @@ useragent_header = {
 }
 
 requests_timeout = 5
+
+# Amount of worker threads used to resolve device names concurrently,
+# and the maximum amount of simultaneous requests made to a single host.
+enrichment_workers = int(os.environ.get("OCSI_ENRICHMENT_WORKERS", 8))
+network_host_limit = int(os.environ.get("OCSI_NETWORK_HOST_LIMIT", 4))
+
+# Total amount of seconds a single run may spend waiting on the network;
+# once it's used up, every remaining lookup is skipped.
+network_budget = float(os.environ.get("OCSI_NETWORK_BUDGET", 10))
+
+# Hosts which time out or refuse connections are skipped for the rest
+# of the run. If non-zero, a single request is let through again after
+# this many seconds ("half-open"), which closes the circuit if it succeeds.
+network_circuit_retry = float(os.environ.get("OCSI_NETWORK_CIRCUIT_RETRY", 0))
+
+# Lookups which more than one source can answer (devicehunt and pci-ids.ucw.cz,
+# ARK's English and French pages) start with the source that's been the fastest,
+# and also ask the next one if there's no answer after this many seconds;
+# whichever answers first wins. `0` asks every source at once, and a negative
+# delay only asks the next source once the previous one didn't answer.
+hedge_delay = float(os.environ.get("OCSI_HEDGE_DELAY", 0.5))
+
+# With `--deadline`, how many seconds before it every lookup is given up on,
+# so that whatever was discovered is still dumped in time.
+deadline_reserve = float(os.environ.get("OCSI_DEADLINE_RESERVE", 1))
+
+# Time-to-live, in seconds, of cached network lookups
+# for each source. Lookups that found nothing (unknown IDs,
+# missing ARK/WikiChip pages) expire after `lookup_cache_negative_ttl`.
+lookup_cache_ttl = {
+    "devicehunt": 60 * 60 * 24 * 30,
+    "pci-ids": 60 * 60 * 24 * 30,
+    "ark": 60 * 60 * 24 * 90,
+    "wikichip": 60 * 60 * 24 * 90,
+}
+lookup_cache_negative_ttl = 60 * 60 * 24
+
+# Maximum amount of entries kept in the lookup cache;
+# the least recently used ones are evicted first.
+lookup_cache_size = 4096
+
+# Where privileged runs store the raw data that needs root to read
+# (e.g. the SMBIOS table), so that unprivileged runs during the same boot
+# can use it without prompting for sudo. Only written to if enabled,
+# either through this or with `--cache-privileged`.
+privileged_cache_dir = os.environ.get("OCSI_PRIVILEGED_CACHE_DIR", "/var/cache/ocsysinfo")
+privileged_cache = os.environ.get("OCSI_PRIVILEGED_CACHE", "0") == "1"
+
+# Size, in bytes, at which the log (`ocsysinfo.log`) and the debug log
+# (`ocsi_dbg_log.txt`) are rotated, and how many rotated files are kept of each.
+log_max_bytes = int(os.environ.get("OCSI_LOG_MAX_BYTES", 2 ** 20))
+debug_log_max_bytes = int(os.environ.get("OCSI_DEBUG_LOG_MAX_BYTES", 2 ** 24))
+log_backups = int(os.environ.get("OCSI_LOG_BACKUPS", 3))
@@ -1,8 +1,6 @@
 def main():
     from sys import argv, exit, version, version_info
 
-    from src.util.missing_dep import Requirements
-
     if version_info < (3, 9, 0):
         print(
             "OCSysInfo requires Python 3.9, while Python "
@@ -11,17 +9,13 @@ def main():
         )
         exit(1)
 
-    reqs = Requirements()
-
-    missing = reqs.test_req()
-
-    if missing:
-        reqs.install_reqs(missing)
-
-
     import os
+    from src.util.deadline import Deadline as deadline
     from src.util.debugger import Debugger as debugger
 
+    # `--deadline` counts from here.
+    deadline.start()
+
     args_lower = [x.lower() for x in argv]
 
     # Whether or not to run the application
@@ -36,9 +30,64 @@ def main():
 
         print("=" * 25 + " BEGIN OF DEBUG " + "=" * 25)
 
-    from update.updater import OCSIUpdater
+    import atexit
+    from src.util.log_backend import LogBackend as log_backend
+    from src.util.timings import Timings as timings
+
+    # Logs are written until the very end; after every
+    # exit handler registered from here on (which may still log).
+    log_backend.stop_at_exit()
 
-    OCSIUpdater().run()
+    # Profile (almost) the whole run; the stats are
+    # written next to the log once it's known where that is.
+    if "--profile" in args_lower:
+        timings.start_profile()
+
+    # Print a summary of the collected timings on exit,
+    # which happens right after dumping.
+    if "--timings" in args_lower:
+        timings.enable()
+        atexit.register(timings.report)
+
+    # Same goes for the amount of work done.
+    if "--stats" in args_lower:
+        from src.util.accounting import Accounting as accounting
+
+        accounting.enable()
+        atexit.register(accounting.report)
+
+    # As well as whatever was left unresolved to meet the deadline.
+    if "--deadline" in args_lower:
+        atexit.register(deadline.report)
+
+    from src.info import AppInfo
+    from src.util.create_log import create_log
+    from src.util.missing_dep import Requirements
+
+    # Hopefully fix path-related issues in app bundles.
+    log_tmp = create_log(True)
+
+    AppInfo.root_dir = log_tmp[1] or AppInfo.sanitise_dir(__file__)
+
+    # `create_log` only reports directories which already existed,
+    # so ask again if they had to be created just now.
+    AppInfo.data_dir = log_tmp[1] or create_log(True)[1]
+
+    if timings.profiler:
+        def stop_profile():
+            path = timings.stop_profile(log_tmp[0] or AppInfo.root_dir)
+
+            if path:
+                print(f"--> Profile written to {path}")
+
+        atexit.register(stop_profile)
+
+    reqs = Requirements(AppInfo.data_dir)
+
+    missing = reqs.test_req()
+
+    if missing:
+        reqs.install_reqs(missing)
 
     # Fix ANSI escape codes not being registered
     # in Windows's Command Prompt.
@@ -46,45 +95,29 @@ def main():
     # Massive thank you to CorpNewt for pointing this out.
     import platform
 
-    import requests
-
     from src.cli.ui import clear as clear_screen
-    from src.info import (
-        AppInfo,
-        color_text,
-        format_text,
-        requests_timeout,
-        useragent_header,
-    )
-    from src.util.create_log import create_log
+    from src.info import color_text, format_text
+    from src.util.network import Network as network
 
     if platform.system() == "windows":
         os.system("color")
 
-    # Preliminary check for internet availability.
-    if "--offline" not in argv:
-        try:
-            debugger.log_dbg("--> [INTERNET]: Testing connection...")
+    from update.updater import OCSIUpdater
 
-            requests.get(
-                "https://www.google.com",
-                timeout=requests_timeout,
-                headers=useragent_header,
-            )
+    # Check for internet availability, and for updates, in the background,
+    # while the hardware is being discovered – lookups which need the network
+    # wait for the connectivity check themselves; the update prompt, if any,
+    # is shown once the dump is finished.
+    offline = "--offline" in argv
 
-            offline = False
+    if not offline:
+        network.start_probe()
 
-            debugger.log_dbg("--> [INTERNET]: Available!\n")
-        except Exception:
-            offline = True
-            debugger.log_dbg("--> [INTERNET]: Not available!\n")
+        # Runs under a deadline are unattended; there'd be no one to prompt.
+        updater = OCSIUpdater().start() if "--deadline" not in args_lower else OCSIUpdater()
     else:
-        offline = True
-
-    # Hopefully fix path-related issues in app bundles.
-    log_tmp = create_log(True)
-
-    AppInfo.root_dir = log_tmp[1] or AppInfo.sanitise_dir(__file__)
+        network.set_offline()
+        updater = OCSIUpdater()
 
     try:
         from src.cli.flags import FlagParser
@@ -102,9 +135,11 @@ def main():
 
         try:
             debugger.log_dbg(color_text("--> [FlagParser]: Initialising...", "yellow"))
-            flag_parser = FlagParser(logger, None, offline=offline)
+            flag_parser = FlagParser(logger, None, offline=offline, updater=updater)
             debugger.log_dbg(color_text("--> [FlagParser]: Success!\n", "green"))
 
+            updater.finish()
+
             debugger.log_dbg(color_text("--> [UI]: Initialising...", "yellow"))
             ui = UI(flag_parser.dm, logger, log_tmp[1] or AppInfo.root_dir)
             debugger.log_dbg(
@@ -1,18 +1,31 @@
 import platform
 from src.managers.pciids import PCIIDs
 from src.info import color_text
+from src.util.deadline import Deadline
 from src.util.debugger import Debugger as debugger
+from src.util.hedging import Latency as latency
+from src.util.lookup_cache import LookupCache as lookup_cache
+from src.util.network import Network as network
+from src.util.snapshot_cache import SnapshotCache as snapshot_cache
+from src.util.sysroot import Sysroot as sysroot
 
 class DeviceManager:
     """Instance responsible for exposing all important information about the current system's hardware."""
 
-    def __init__(self, logger, off_data=[], offline=False):
+    def __init__(self, logger, off_data=[], offline=False, serial=False, refresh=False, deadline=None):
         self.info = {}
-        self.pci = PCIIDs()
-        self.platform = platform.system().lower()
+        self.pci = PCIIDs(offline=offline)
+        # Only Linux layouts can be replayed.
+        self.platform = "linux" if sysroot.root else platform.system().lower()
         self.logger = logger
         self.offline = offline
         self.off_data = off_data
+        self.serial = serial
+        self.refresh = refresh
+
+        # Every collector, and every lookup they make, has to finish within it.
+        if deadline is not None:
+            Deadline.set(deadline)
 
         debugger.log_dbg(color_text(
             f"--> [DeviceManager]: Instantiating device manager for {platform.system()}...",
@@ -36,4 +49,32 @@ class DeviceManager:
             "green"
         ))
 
+        # Categories which haven't changed since the last run are served from
+        # the snapshot cache; managers skip collecting those already present.
+        #
+        # Replays, and captures (which need every collector to run), bypass it.
+        cacheable = not sysroot.root and not sysroot.recording
+        snapshot = snapshot_cache.load(self.platform, offline) if cacheable and not refresh else {}
+
+        self.info.update({k: v for (k, v) in snapshot.items() if k not in off_data})
+
         self.manager.dump()
+
+        # Online runs which couldn't make every lookup (e.g. without a working
+        # connection) aren't cached either – they may be missing device names.
+        if cacheable and not offline and not network.complete():
+            debugger.log_dbg(color_text(
+                "--> [DeviceManager]: Not every network lookup could be made – not caching this snapshot!",
+                "yellow"
+            ))
+        elif cacheable:
+            # Categories the deadline left partly unresolved are collected again next time.
+            snapshot_cache.store(
+                self.platform,
+                {k: v for (k, v) in {**snapshot, **self.info}.items() if k not in Deadline.degraded},
+                offline
+            )
+
+        lookup_cache.flush()
+        lookup_cache.log_stats()
+        latency.flush()
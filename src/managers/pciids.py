@@ -1,27 +1,165 @@
-import requests
+import re
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from src import info
 from src.info import color_text
+from src.util.deadline import Deadline as deadline, DeadlineExceeded
 from src.util.debugger import Debugger as debugger
+from src.util.hedging import hedge
+from src.util.lookup_cache import MISS, LookupCache as lookup_cache
+from src.util.network import Network as network
+from src.util.pci_ids_db import pci_db, usb_db
+from src.util.scraper import Field, scrape
+from src.util.timings import Timings as timings
+
+# The device's name, and then its vendor's, are on the line after their
+# (devicehunt) headings; e.g. `<h3 class="details__heading --type-device">`.
+DH_FIELDS = [
+    Field("device", re.compile(r"--type-device", re.I), following=True),
+    Field("vendor", re.compile(r"--type-vendor", re.I), following=True, after=("device",)),
+]
+
+# E.g. `<p class="itemname">Name: I210 Gigabit Network Connection`.
+PI_FIELDS = [
+    Field("device", re.compile(r"itemname.*>name|>name.*itemname", re.I)),
+]
+
 
 class PCIIDs:
     """
-    Abstraction for scraping the https://devicehunt.com website.
-    If data is unavailable from the aforementioned website, it will attempt to scrape https://pci-ids.ucw.cz.
+    Abstraction for resolving PCI/USB IDs into device names.
+
+    The local `pci.ids`/`usb.ids` database is consulted first; only IDs it doesn't know
+    are looked up by scraping the https://devicehunt.com website.
+    PCI IDs are looked up on https://pci-ids.ucw.cz as well, if the former doesn't answer
+    in time (see `info.hedge_delay`), or doesn't know them; whichever answers first wins –
+    though the latter only names devices, so it only does if their vendor is known locally.
 
     Thank you to @[CorpNewt](https://github.com/CorpNewt) for allowing us to copy over their own
     implementation of scraping a website's response.
     """
 
+    def __init__(self, offline=False):
+        self.offline = offline
+
+    @timings.timed("pciids.get_item")
     def get_item(self, dev: str, ven: str = "any", types="pci") -> dict or None:
-        data = self.get_item_dh(dev, ven, types)
+        data = self.get_item_local(dev, ven, types)
+
+        if data.get("device") or self.offline or not network.online():
+            return data
+
+        local = data
+        attempts = [("devicehunt", _dh_key(dev, ven, types), lambda: self.get_item_dh(dev, ven, types))]
+
+        # pci-ids.ucw.cz only knows PCI devices.
+        if ven != "any" and types == "pci":
+            attempts.append(("pci-ids", _pi_key(dev, ven), lambda: self.get_item_pi(dev, ven)))
+
+        # pci-ids.ucw.cz only names the device; its answer only wins if the
+        # vendor is known locally – otherwise, devicehunt's is waited for,
+        # and it's only used if devicehunt doesn't have one.
+        def valid(answer):
+            return bool(answer) and bool(local.get("vendor") or answer.get("vendor"))
+
+        # Either source's answer, from a previous run, is good enough.
+        for source, key, _ in attempts:
+            cached = lookup_cache.peek(source, key)
+
+            if cached is not MISS and valid(cached):
+                return {**local, **lookup_cache.get(source, key)}
+
+        if deadline.expired():
+            raise DeadlineExceeded(f"Deadline reached – not looking up '{ven}:{dev}'")
+
+        data = hedge([(source, lookup) for source, _, lookup in attempts], valid=valid)
+
+        return {**local, **data} if data else local
+
+    @timings.timed("pciids.get_items")
+    def get_items(self, keys, workers=None) -> dict:
+        """
+        Resolves many `(dev, ven, types)` keys at once.
+
+        Keys are deduplicated, the local ID database is tried first, and
+        whatever's left is looked up concurrently on a bounded thread pool;
+        so the whole batch takes about as long as its slowest lookup.
+
+        Returns a dictionary mapping each key to either its data,
+        or the exception raised while resolving it – `DeadlineExceeded`
+        for those which weren't resolved before the run's deadline.
+        """
+
+        results = {}
+        remote = []
+
+        for key in dict.fromkeys(keys):
+            results[key] = self.get_item_local(*key)
+
+            if not results[key].get("device") and not self.offline:
+                remote.append(key)
+
+        # Only now that it's actually needed, wait for the connectivity check.
+        if not remote or not network.online():
+            return results
+
+        debugger.log_dbg(color_text(
+            f"--> [DH/PID]: Resolving {len(remote)} device(s) concurrently...",
+            "yellow"
+        ))
+
+        def resolve(key):
+            try:
+                return self.get_item(*key)
+            except Exception as e:
+                # Gave up on because of the deadline, rather than failed.
+                if deadline.expired() and not isinstance(e, DeadlineExceeded):
+                    return DeadlineExceeded(str(e))
+
+                return e
 
-        if not data and ven != "any":
-            data = self.get_item_pi(dev, ven)
+        pool = ThreadPoolExecutor(
+            max_workers=max(min(workers or info.enrichment_workers, len(remote)), 1)
+        )
+        futures = {pool.submit(resolve, key): key for key in remote}
+
+        # Lookups still running at the deadline are left behind.
+        done, _ = wait(futures, timeout=deadline.timeout())
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        for future, key in futures.items():
+            results[key] = future.result() if future in done else DeadlineExceeded(
+                f"Deadline reached while looking up '{key[1]}:{key[0]}'"
+            )
+
+        return results
+
+    @timings.timed("pciids.get_item_local")
+    def get_item_local(self, dev: str, ven: str = "any", types="pci") -> dict:
+        if ven == "any":
+            return {}
+
+        data = (usb_db if types == "usb" else pci_db).lookup(dev, ven)
+
+        if data.get("device"):
+            debugger.log_dbg(color_text(
+                f"--> [DH/PID]: Obtained device '{data.get('device')}' from the local ID database:" +
+                f"\n\t* Device ID: {dev}" +
+                f"\n\t* Vendor ID: {ven}" +
+                f"\n\t* Type: {types}\n",
+                "green"
+            ))
 
-        return data or {}
+        return data
 
+    @timings.timed("pciids.get_item_dh")
     def get_item_dh(self, dev: str, ven: str = "any", types="pci") -> dict or None:
+        key = _dh_key(dev, ven, types)
+        cached = lookup_cache.get("devicehunt", key)
+
+        if cached is not MISS:
+            return cached
+
         debugger.log_dbg(color_text(
             f"--> [DH/PID]: Attempting to find a match for:" +
             f"\n\t* Device ID: {dev}" +
@@ -29,31 +167,24 @@ class PCIIDs:
             "yellow"
         ))
 
-        content = requests.get(
+        status, values = scrape(
             "https://devicehunt.com/search/type/{}/vendor/{}/device/{}".format(
                 types, ven.upper(), dev.upper()
-            ), timeout=info.requests_timeout, headers=info.useragent_header
+            ), DH_FIELDS, timeout=info.requests_timeout, headers=info.useragent_header
         )
 
-        if content.status_code != 200:
+        if status != 200:
             debugger.log_dbg(color_text(
                 "--> [DH/PID]: Failed to fetch device with provided data – ignoring!\n",
                 "red"
             ))
 
-            return None
+            if status == 404:
+                lookup_cache.set("devicehunt", key, None)
 
-        lines = content.text.split("\n")
-        device = {}
-        caught = None
+            return None
 
-        for line in lines:
-            cond = "--type-device" in line.lower()
-            if cond or ("--type-vendor" in line.lower() and caught):
-                device["device" if cond else "vendor"] = lines[
-                    lines.index(line.lower()) + 1
-                ].split("<")[0]
-                caught = device
+        device = {name: value.split("<")[0] for name, value in values.items()}
 
         if device:
             debugger.log_dbg(color_text(
@@ -64,9 +195,16 @@ class PCIIDs:
                 "green"
             ))
 
-            return device
+        return lookup_cache.set("devicehunt", key, device or None)
 
+    @timings.timed("pciids.get_item_pi")
     def get_item_pi(self, dev: str, ven: str = "any") -> dict or None:
+        key = _pi_key(dev, ven)
+        cached = lookup_cache.get("pci-ids", key)
+
+        if cached is not MISS:
+            return cached
+
         debugger.log_dbg(color_text(
             f"--> [DH/PID]: Attempting to find a match for:" +
             f"\n\t* Device ID: {dev}" +
@@ -74,25 +212,25 @@ class PCIIDs:
             "yellow"
         ))
 
-        content = requests.get(
+        status, values = scrape(
             "https://pci-ids.ucw.cz/read/PC/{}/{}".format(ven, dev),
+            PI_FIELDS,
             timeout=info.requests_timeout,
             headers=info.useragent_header
         )
 
-        if content.status_code != 200:
+        if status != 200:
             debugger.log_dbg(color_text(
                 "--> [DH/PID]: Failed to fetch device with provided data – ignoring!\n",
                 "red"
             ))
 
-            return None
+            if status == 404:
+                lookup_cache.set("pci-ids", key, None)
 
-        device = ""
+            return None
 
-        for line in content.text.split("\n"):
-            if "itemname" in line.lower() and ">name" in line.lower():
-                device = line.split("Name: ")[1]
+        device = values["device"].split("Name: ")[1] if "device" in values else ""
 
         if device:
             debugger.log_dbg(color_text(
@@ -103,4 +241,12 @@ class PCIIDs:
                 "green"
             ))
 
-            return { "device": device }
+        return lookup_cache.set("pci-ids", key, { "device": device } if device else None)
+
+
+def _dh_key(dev, ven, types):
+    return f"{types}/{ven}/{dev}".lower()
+
+
+def _pi_key(dev, ven):
+    return f"{ven}/{dev}".lower()
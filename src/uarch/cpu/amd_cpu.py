@@ -0,0 +1,55 @@
+# AMD CPU codenames, keyed by their CPUID family, and a range of models –
+# with the extended family/model already folded in, the way `/proc/cpuinfo`
+# reports them.
+#
+# (Family, First model, Last model): (Codename, Microarchitecture)
+amd = {
+    # K10 and derivatives
+    (0x10, 0x00, 0xFF): ("K10", "K10"),
+    (0x11, 0x00, 0xFF): ("Griffin", "K10"),
+    (0x12, 0x00, 0xFF): ("Llano", "K10"),
+    (0x14, 0x00, 0xFF): ("Bobcat", "Bobcat"),
+
+    # Bulldozer family
+    (0x15, 0x00, 0x01): ("Zambezi", "Bulldozer"),
+    (0x15, 0x02, 0x02): ("Vishera", "Piledriver"),
+    (0x15, 0x10, 0x1F): ("Trinity", "Piledriver"),
+    (0x15, 0x30, 0x3F): ("Kaveri", "Steamroller"),
+    (0x15, 0x60, 0x6F): ("Carrizo", "Excavator"),
+    (0x15, 0x70, 0x7F): ("Stoney Ridge", "Excavator"),
+
+    # Jaguar / Puma
+    (0x16, 0x00, 0x0F): ("Kabini", "Jaguar"),
+    (0x16, 0x30, 0x3F): ("Beema", "Puma"),
+
+    # Zen / Zen+ / Zen 2
+    (0x17, 0x00, 0x07): ("Summit Ridge", "Zen"),
+    (0x17, 0x08, 0x0F): ("Pinnacle Ridge", "Zen+"),
+    (0x17, 0x10, 0x17): ("Raven Ridge", "Zen"),
+    (0x17, 0x18, 0x1F): ("Picasso", "Zen+"),
+    (0x17, 0x20, 0x2F): ("Dali", "Zen"),
+    (0x17, 0x30, 0x3F): ("Rome", "Zen 2"),
+    (0x17, 0x60, 0x67): ("Renoir", "Zen 2"),
+    (0x17, 0x68, 0x6F): ("Lucienne", "Zen 2"),
+    (0x17, 0x70, 0x7F): ("Matisse", "Zen 2"),
+    (0x17, 0x90, 0x9F): ("Van Gogh", "Zen 2"),
+    (0x17, 0xA0, 0xAF): ("Mendocino", "Zen 2"),
+
+    # Zen 3 / Zen 3+ / Zen 4
+    (0x19, 0x00, 0x07): ("Milan", "Zen 3"),
+    (0x19, 0x08, 0x0F): ("Chagall", "Zen 3"),
+    (0x19, 0x10, 0x1F): ("Genoa", "Zen 4"),
+    (0x19, 0x20, 0x2F): ("Vermeer", "Zen 3"),
+    (0x19, 0x40, 0x4F): ("Rembrandt", "Zen 3+"),
+    (0x19, 0x50, 0x5F): ("Cezanne", "Zen 3"),
+    (0x19, 0x60, 0x6F): ("Raphael", "Zen 4"),
+    (0x19, 0x70, 0x7F): ("Phoenix", "Zen 4"),
+    (0x19, 0xA0, 0xAF): ("Bergamo", "Zen 4c"),
+
+    # Zen 5
+    (0x1A, 0x00, 0x1F): ("Turin", "Zen 5"),
+    (0x1A, 0x20, 0x2F): ("Strix Point", "Zen 5"),
+    (0x1A, 0x40, 0x4F): ("Granite Ridge", "Zen 5"),
+    (0x1A, 0x60, 0x6F): ("Krackan Point", "Zen 5"),
+    (0x1A, 0x70, 0x7F): ("Strix Halo", "Zen 5"),
+}
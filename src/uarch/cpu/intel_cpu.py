@@ -0,0 +1,110 @@
+# Intel CPU codenames, keyed by their CPUID `(Family, Model)` signature –
+# with the extended family/model already folded in, the way `/proc/cpuinfo`
+# reports them.
+#
+# Where a single model is shared by multiple generations, the value is a
+# dictionary of `{Stepping: Codename}`, where each codename applies from
+# its stepping onwards.
+intel = {
+    # NetBurst
+    (0xF, 0x00): "Willamette",
+    (0xF, 0x01): "Willamette",
+    (0xF, 0x02): "Northwood",
+    (0xF, 0x03): "Prescott",
+    (0xF, 0x04): "Prescott",
+    (0xF, 0x06): "Cedar Mill",
+
+    # P6 / Pentium M
+    (0x6, 0x09): "Banias",
+    (0x6, 0x0D): "Dothan",
+    (0x6, 0x0E): "Yonah",
+
+    # Core
+    (0x6, 0x0F): "Merom",
+    (0x6, 0x16): "Merom",
+    (0x6, 0x17): "Penryn",
+    (0x6, 0x1D): "Dunnington",
+
+    # Nehalem / Westmere
+    (0x6, 0x1A): "Nehalem",
+    (0x6, 0x1E): "Nehalem",
+    (0x6, 0x1F): "Nehalem",
+    (0x6, 0x2E): "Nehalem",
+    (0x6, 0x25): "Westmere",
+    (0x6, 0x2C): "Westmere",
+    (0x6, 0x2F): "Westmere",
+
+    # Sandy Bridge / Ivy Bridge
+    (0x6, 0x2A): "Sandy Bridge",
+    (0x6, 0x2D): "Sandy Bridge",
+    (0x6, 0x3A): "Ivy Bridge",
+    (0x6, 0x3E): "Ivy Bridge",
+
+    # Haswell / Broadwell
+    (0x6, 0x3C): "Haswell",
+    (0x6, 0x3F): "Haswell",
+    (0x6, 0x45): "Haswell",
+    (0x6, 0x46): "Haswell",
+    (0x6, 0x3D): "Broadwell",
+    (0x6, 0x47): "Broadwell",
+    (0x6, 0x4F): "Broadwell",
+    (0x6, 0x56): "Broadwell",
+
+    # Skylake and its derivatives
+    (0x6, 0x4E): "Skylake",
+    (0x6, 0x5E): "Skylake",
+    (0x6, 0x55): {0x0: "Skylake", 0x5: "Cascade Lake", 0xA: "Cooper Lake"},
+    (0x6, 0x8E): {0x0: "Kaby Lake", 0xA: "Kaby Lake R", 0xB: "Whiskey Lake", 0xC: "Comet Lake"},
+    (0x6, 0x9E): {0x0: "Kaby Lake", 0xA: "Coffee Lake"},
+    (0x6, 0xA5): "Comet Lake",
+    (0x6, 0xA6): "Comet Lake",
+    (0x6, 0x66): "Cannon Lake",
+
+    # Sunny Cove / Willow Cove / Cypress Cove
+    (0x6, 0x7D): "Ice Lake",
+    (0x6, 0x7E): "Ice Lake",
+    (0x6, 0x6A): "Ice Lake",
+    (0x6, 0x6C): "Ice Lake",
+    (0x6, 0x8C): "Tiger Lake",
+    (0x6, 0x8D): "Tiger Lake",
+    (0x6, 0xA7): "Rocket Lake",
+
+    # Hybrid
+    (0x6, 0x8A): "Lakefield",
+    (0x6, 0x97): "Alder Lake",
+    (0x6, 0x9A): "Alder Lake",
+    (0x6, 0xBE): "Alder Lake",
+    (0x6, 0xB7): "Raptor Lake",
+    (0x6, 0xBA): "Raptor Lake",
+    (0x6, 0xBF): "Raptor Lake",
+    (0x6, 0xAA): "Meteor Lake",
+    (0x6, 0xAC): "Meteor Lake",
+    (0x6, 0xBD): "Lunar Lake",
+    (0x6, 0xC5): "Arrow Lake",
+    (0x6, 0xC6): "Arrow Lake",
+
+    # Xeon Scalable
+    (0x6, 0x8F): "Sapphire Rapids",
+    (0x6, 0xCF): "Emerald Rapids",
+    (0x6, 0xAD): "Granite Rapids",
+    (0x6, 0xAE): "Granite Rapids",
+    (0x6, 0xAF): "Sierra Forest",
+
+    # Atom
+    (0x6, 0x1C): "Bonnell",
+    (0x6, 0x26): "Lincroft",
+    (0x6, 0x36): "Cedarview",
+    (0x6, 0x37): "Bay Trail",
+    (0x6, 0x4D): "Avoton",
+    (0x6, 0x4C): "Braswell",
+    (0x6, 0x5C): "Apollo Lake",
+    (0x6, 0x5F): "Denverton",
+    (0x6, 0x7A): "Gemini Lake",
+    (0x6, 0x86): "Snow Ridge",
+    (0x6, 0x96): "Elkhart Lake",
+    (0x6, 0x9C): "Jasper Lake",
+
+    # Xeon Phi
+    (0x6, 0x57): "Knights Landing",
+    (0x6, 0x85): "Knights Mill",
+}
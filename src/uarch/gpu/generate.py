@@ -0,0 +1,88 @@
+"""
+Generates `gpu_index.py`, the compact form of the `amd_gpu.py`
+and `nvidia_gpu.py` tables which `src.util.codename.gpu` looks codenames up in.
+
+Re-run this after editing either table:
+
+    python -m src.uarch.gpu.generate
+"""
+import os
+from array import array
+
+from src.uarch.gpu.amd_gpu import amd
+from src.uarch.gpu.nvidia_gpu import nvidia
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gpu_index.py")
+
+TEMPLATE = '''"""
+GPU codenames, keyed by their vendor and device IDs.
+
+Generated by `python -m src.uarch.gpu.generate` from
+`amd_gpu.py` and `nvidia_gpu.py` – do not edit by hand.
+"""
+
+CODENAMES = (
+{codenames}
+)
+
+# Sorted `(vendor << 16) | device` keys, as little-endian 32-bit unsigned integers.
+KEYS = bytes.fromhex(
+{keys}
+)
+
+# Index into `CODENAMES` of each key, as 8-bit unsigned integers.
+ORDINALS = bytes.fromhex(
+{ordinals}
+)
+'''
+
+
+def _hex_lines(data, width=64):
+    data = data.hex()
+
+    return "\n".join(
+        f'    "{data[i:i + width]}"' for i in range(0, len(data), width)
+    )
+
+
+def generate():
+    codenames = []
+    rows = {}
+
+    for uarch in amd + nvidia:
+        codename = uarch.get("Codename")
+
+        if codename not in codenames:
+            codenames.append(codename)
+
+        for id in uarch.get("IDs", []):
+            key = (int(id.get("Vendor"), 16) << 16) | int(id.get("Device"), 16)
+
+            # First match wins, same as a linear scan over the tables would.
+            rows.setdefault(key, codenames.index(codename))
+
+    if len(codenames) > 0xFF:
+        raise ValueError("Too many codenames to store as 8-bit ordinals!")
+
+    keys = array("I", sorted(rows))
+    ordinals = bytes(rows[key] for key in keys)
+
+    if keys.itemsize != 4:
+        raise ValueError("Unsupported platform: `array('I')` isn't 32 bits wide!")
+
+    # Always stored as little-endian.
+    if array("I", [1]).tobytes()[0] != 1:
+        keys.byteswap()
+
+    return TEMPLATE.format(
+        codenames="\n".join(f'    "{codename}",' for codename in codenames),
+        keys=_hex_lines(keys.tobytes()),
+        ordinals=_hex_lines(ordinals),
+    )
+
+
+if __name__ == "__main__":
+    with open(OUTPUT, "w") as file:
+        file.write(generate())
+
+    print(f"Successfully generated '{OUTPUT}'!")
@@ -0,0 +1,203 @@
+"""
+GPU codenames, keyed by their vendor and device IDs.
+
+Generated by `python -m src.uarch.gpu.generate` from
+`amd_gpu.py` and `nvidia_gpu.py` – do not edit by hand.
+"""
+
+CODENAMES = (
+    "Tahiti",
+    "Pitcairn",
+    "Oland",
+    "Verde",
+    "Hainan",
+    "Kaveri",
+    "Bonaire",
+    "Hawaii",
+    "Kabini",
+    "Mullins",
+    "Topaz",
+    "Tonga",
+    "Fiji",
+    "Carrizo",
+    "Stoney",
+    "Polaris 11",
+    "Polaris 10",
+    "Polaris 12",
+    "Vegam",
+    "Vega 10",
+    "Vega 12",
+    "Vega 20",
+    "Raven",
+    "Arcturus",
+    "Navi 10",
+    "Navi 14",
+    "Renoir",
+    "Navi 12",
+    "Sienna Cichlid",
+    "Vangogh",
+    "Yellow Carp",
+    "Navy Flounder",
+    "Dimgrey Cavefish",
+    "Aldebaran",
+    "Cyan Skillfish",
+    "Beige Goby",
+    "Curie",
+    "Tesla",
+    "Fermi",
+    "Kepler",
+    "Maxwell",
+    "Pascal",
+    "Turing",
+    "Ampere",
+)
+
+# Sorted `(vendor << 16) | device` keys, as little-endian 32-bit unsigned integers.
+KEYS = bytes.fromhex(
+    "04130210051302100613021007130210091302100a1302100b1302100c130210"
+    "0d1302100e1302100f1302101013021011130210121302101313021015130210"
+    "1613021017130210181302101b1302101c1302101d130210fe130210d8150210"
+    "dd150210e715021036160210381602103f1602104c1602104d16021081160210"
+    "0066021001660210026602100366021004660210056602100666021007660210"
+    "0866021010660210116602101366021017660210206602102166021023660210"
+    "3166021040660210416602104666021047660210496602105066021051660210"
+    "586602105c6602105d6602105f66021060660210636602106466021065660210"
+    "676602106f660210a0660210a1660210a2660210a3660210a4660210a7660210"
+    "af6602108067021084670210886702108a670210906702109167021092670210"
+    "98670210996702109a6702109b6702109e6702109f670210a0670210a1670210"
+    "a2670210a8670210a9670210aa670210b0670210b1670210b8670210b9670210"
+    "ba670210be670210c0670210c1670210c2670210c4670210c7670210c8670210"
+    "c9670210ca670210cc670210cf670210d0670210df670210e0670210e1670210"
+    "e3670210e7670210e8670210e9670210eb670210ef670210ff67021000680210"
+    "0168021002680210066802100868021009680210106802101168021016680210"
+    "1768021018680210196802102068021021680210226802102368021024680210"
+    "25680210266802102768021028680210296802102a6802102b6802102c680210"
+    "2d6802102f680210306802103168021035680210376802103868021039680210"
+    "3b6802103d6802103f6802106068021061680210626802106368021064680210"
+    "6768021068680210696802106a6802106b6802106c6802106d6802106e680210"
+    "6f6802107f680210006902100169021002690210036902100769021020690210"
+    "2169021028690210296902102b6902102f690210306902103869021039690210"
+    "4c6902104e6902104f6902108069021081690210856902108669021087690210"
+    "95690210976902109f690210a0690210a1690210a2690210a3690210af690210"
+    "df6f0210007302100f730210107302101273021018730210197302101a730210"
+    "1b7302101e7302101f7302104073021041730210477302104f73021060730210"
+    "62730210887302108c7302108e73021090730210a0730210a1730210a2730210"
+    "a3730210a5730210a8730210a9730210ab730210ac730210ad730210ae730210"
+    "af730210bf730210c0730210c1730210c3730210da730210db730210dc730210"
+    "dd730210de730210df730210e0730210e1730210e2730210e3730210e8730210"
+    "e9730210ea730210eb730210ec730210ed730210ef730210ff73021008740210"
+    "0c7402100f74021010740210207402102174021022740210237402103f740210"
+    "3098021031980210329802103398021034980210359802103698021037980210"
+    "38980210399802103a9802103b9802103c9802103d9802103e9802103f980210"
+    "5098021051980210529802105398021054980210559802105698021057980210"
+    "58980210599802105a9802105b9802105c9802105d9802105e9802105f980210"
+    "7098021074980210759802107698021077980210e49802104000de109000de10"
+    "f000de104001de106001de109001de109101de109301de109401de109d01de10"
+    "9e01de10d001de102002de109002de109003de100004de100104de100204de10"
+    "0304de100404de100504de100604de100704de100804de100904de100a04de10"
+    "0b04de100c04de100d04de100e04de100f04de101004de102004de102104de10"
+    "2204de102304de102404de102504de102604de102704de102804de102904de10"
+    "2a04de102b04de102c04de102d04de102e04de102f04de10e005de10e105de10"
+    "e205de10e305de10e605de10e705de10e905de10ea05de10eb05de10ed05de10"
+    "ee05de10ef05de10fd05de10fe05de10ff05de100006de100106de100206de10"
+    "0306de100406de100506de100606de100706de100806de100906de100a06de10"
+    "0b06de100c06de100f06de101006de101106de101206de101306de101406de10"
+    "1506de101706de101806de101906de101a06de101b06de101c06de101d06de10"
+    "1e06de101f06de102106de102206de102306de102406de102506de102606de10"
+    "2706de102806de102a06de102b06de102c06de102d06de102e06de102f06de10"
+    "3106de103506de103706de103806de103a06de104006de104106de104306de10"
+    "4406de104506de104606de104706de104806de104906de104a06de104b06de10"
+    "4c06de105106de105206de105306de105406de105506de105606de105806de10"
+    "5906de105a06de105b06de105c06de105f06de10c006de10c406de10ca06de10"
+    "cb06de10cd06de10d106de10d206de10d806de10d906de10da06de10dc06de10"
+    "dd06de10de06de10df06de10e006de10e106de10e206de10e306de10e406de10"
+    "e506de10e606de10e706de10e806de10e906de10ea06de10eb06de10ec06de10"
+    "ed06de10ef06de10f106de10f806de10f906de10fa06de10fb06de10fd06de10"
+    "ff06de104008de104408de104508de104608de104708de104808de104908de10"
+    "4a08de104b08de104c08de104d08de104f08de106008de106108de106208de10"
+    "6308de106408de106508de106608de106708de106808de106908de106a08de10"
+    "6c08de106d08de106e08de106f08de107008de107108de107208de107308de10"
+    "7408de107608de107a08de107d08de107e08de107f08de10a008de10a208de10"
+    "a308de10a408de10200ade10220ade10230ade10260ade10270ade10280ade10"
+    "290ade102a0ade102b0ade102c0ade102d0ade10320ade10340ade10350ade10"
+    "380ade103c0ade10600ade10620ade10630ade10640ade10650ade10660ade10"
+    "670ade10680ade10690ade106a0ade106c0ade106e0ade106f0ade10700ade10"
+    "710ade10720ade10730ade10740ade10750ade10760ade10780ade107a0ade10"
+    "7c0ade10a00cde10a20cde10a30cde10a40cde10a50cde10a70cde10a90cde10"
+    "ac0cde10af0cde10b00cde10b10cde10bc0cde10c00dde10c40dde10c50dde10"
+    "c60dde10cd0dde10ce0dde10d10dde10d20dde10d30dde10d60dde10d80dde10"
+    "da0dde10e00dde10e10dde10e20dde10e30dde10e40dde10e50dde10e80dde10"
+    "e90dde10ea0dde10eb0dde10ec0dde10ed0dde10ee0dde10ef0dde10f00dde10"
+    "f10dde10f20dde10f30dde10f40dde10f50dde10f60dde10f70dde10f80dde10"
+    "f90dde10fa0dde10fc0dde10220ede10230ede10240ede10300ede10310ede10"
+    "3a0ede103b0ede10000fde10010fde10020fde10c00fde10c10fde10c20fde10"
+    "c60fde10c80fde10cd0fde10d10fde10d20fde10d30fde10d40fde10d50fde10"
+    "d80fde10d90fde10df0fde10e00fde10e10fde10e30fde10e40fde10e90fde10"
+    "ea0fde10ee0fde10f20fde10f30fde10f60fde10f90fde10fa0fde10fb0fde10"
+    "fc0fde10fd0fde10fe0fde10ff0fde100110de100310de100410de100510de10"
+    "0710de100a10de100c10de101f10de102010de102110de102210de102310de10"
+    "2410de102610de102810de102d10de103c10de104010de104210de104810de10"
+    "4910de104a10de104b10de104c10de105010de105110de105210de105410de10"
+    "5510de105610de105710de105810de105910de105a10de105b10de107c10de10"
+    "7d10de108010de108110de108210de108410de108610de108710de108810de10"
+    "8910de108b10de109110de109610de109a10de109b10de10c010de10c310de10"
+    "c510de10d810de104011de108011de108311de108411de108511de108611de10"
+    "8711de108811de108911de108e11de108f11de109811de109911de109a11de10"
+    "9d11de109e11de109f11de10a011de10a111de10a211de10a311de10a711de10"
+    "a911de10b411de10b611de10b711de10b811de10ba11de10bc11de10bd11de10"
+    "be11de10bf11de10c011de10c211de10c611de10e011de10e111de10e211de10"
+    "fa11de10fc11de100012de100112de100212de100312de100512de100612de10"
+    "0712de100812de101012de101112de101212de101312de104112de104312de10"
+    "4412de104512de104612de104712de104812de104912de104b12de104d12de10"
+    "5112de108012de108112de108212de108412de108612de108712de108812de10"
+    "8912de108b12de109012de109112de109212de109312de109412de109512de10"
+    "9612de109812de109912de109a12de10b912de10ba12de108013de108113de10"
+    "8213de109d13de10b913de10ba13de10bc13de10c013de10c213de10f013de10"
+    "f113de100114de100214de100614de100714de103014de10f015de10c217de10"
+    "c817de10f017de10f117de10001bde10021bde10061bde10301bde10801bde10"
+    "811bde10821bde10831bde10841bde10871bde10b01bde10b11bde10b61bde10"
+    "b81bde10c71bde10021cde10031cde10041cde10061cde10071cde10091cde10"
+    "301cde10311cde10811cde10821cde10831cde10b11cde10b21cde10b31cde10"
+    "b61cde10011dde10021dde10021ede10041ede10071ede10091ede10301ede10"
+    "781ede10811ede10821ede10841ede10871ede10891ede10b01ede10b11ede10"
+    "c21ede10c71ede10021fde10061fde10071fde10081fde100a1fde100b1fde10"
+    "361fde10421fde10471fde10821fde10b01fde10b11fde10b21fde10b020de10"
+    "b220de10b320de10b520de10b620de10b720de10f120de108221de108421de10"
+    "8721de108821de108921de10c421de100422de100622de100822de100d22de10"
+    "1622de103022de103122de103522de103622de103722de108224de108424de10"
+    "8624de108824de108924de108a24de10b024de100325de100425de103125de10"
+    "b625de10"
+)
+
+# Index into `CODENAMES` of each key, as 8-bit unsigned integers.
+ORDINALS = bytes.fromhex(
+    "050505050505050505050505050505050505050505052216161a1a1a1d1a1e1e"
+    "0202020202020202020202020202020202060606060606060606060604040404"
+    "0404151515151515150000000000000000000000000007070707070707070707"
+    "07071010101010101010101010100f0f0f0f0f0f0f0f0f010101010101010101"
+    "0101010303030303030303030303030303030303030303030303031313131313"
+    "131313131313131313130a0a0a0a0a0b0b0b0b0b0b0b0b0b1212121111111111"
+    "1111111414141414100c0c1818181818181818191919191b1b171717171c1c1c"
+    "1c1c1c1c1c1c1c1c1c1c1f1f1f1f1f1f1f1f1f20202020202020202020202021"
+    "2121212323232323080808080808080808080808080808080909090909090909"
+    "09090909090909090d0d0d0d0d0e242424242425252525252524242424252525"
+    "2525252525252525252525252525252525252525252525252525252525252525"
+    "2525252525252525252525252525252525252525252525252525252525252525"
+    "2525252525252525252525252525252525252525252525252525252525252525"
+    "2525252525252525252525252525252525252525252626262626262626262626"
+    "2626262525252525252525252525252525252525252525252525252525252525"
+    "2525252525252525252525252525252525252525252525252525252525252525"
+    "2525252525252525252525252525252525252525252525252525252525252525"
+    "2525252525252525252525252525252525252525252626262626262626262626"
+    "2626262626262626262626262626262626262626262626262626262626262626"
+    "2626262626272727272727272727272727272727272727272727272727272727"
+    "2727272727272727272727272727272727272727272626262626262626262626"
+    "2626262626262626262626262626262626262626262625252525262727272727"
+    "2727272727272727272727272727272727272727272727272727272727272727"
+    "2727262626262626262626262626262626262626262626262627272727272727"
+    "2727272727272727272727272727282828282828282828282828282828282928"
+    "2828282929292929292929292929292929292929292929292929292929292929"
+    "2929292a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2a2b"
+    "2b2b2b2b2b2b2a2a2a2a2a2a2b2b2b2b2b2b2b2b2b2b2b2b2b2b2b2b2b2b2b2b"
+    "2b"
+)
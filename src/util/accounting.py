@@ -0,0 +1,203 @@
+import sys
+import threading
+
+from src.info import color_text
+
+
+class _CountingFile:
+    """Wraps a file object, accounting for the bytes read from it."""
+
+    __slots__ = ("file", "accounting")
+
+    def __init__(self, file, accounting):
+        self.file = file
+        self.accounting = accounting
+
+    def read(self, *args):
+        data = self.file.read(*args)
+        self.accounting.read(len(data))
+
+        return data
+
+    def readline(self, *args):
+        data = self.file.readline(*args)
+        self.accounting.read(len(data))
+
+        return data
+
+    def __iter__(self):
+        for line in self.file:
+            self.accounting.read(len(line))
+            yield line
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return self.file.__exit__(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+class AccountingInst:
+    """
+    Counts the work a run does: sysfs/procfs files opened (and how many
+    times each), bytes read, directories listed, subprocesses spawned,
+    and HTTP requests made, and bytes downloaded, per host.
+
+    Files are accounted for by `Sysroot`, HTTP requests by `Network`,
+    and subprocesses through an audit hook (see `enable`); so every
+    collector, `pci_root`, `PCIIDs`, the ARK/WikiChip scrapers and the
+    updater are covered without reporting anything themselves.
+
+    Disabled by default (see `--stats`).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.files = {}
+        self.bytes_read = 0
+        self.listings = 0
+        self.hits = 0
+        self.subprocesses = {}
+        self.hosts = {}
+
+    def enable(self):
+        if self.enabled:
+            return
+
+        self.enabled = True
+
+        # Audit hooks can't be removed, but are
+        # only ever installed once accounting is on.
+        sys.addaudithook(self._audit)
+
+    def _audit(self, event, args):
+        if not self.enabled:
+            return
+
+        if event == "subprocess.Popen":
+            executable, command = args[0], args[1]
+
+            if not isinstance(command, (list, tuple)):
+                command = str(command or executable).split()
+        elif event == "os.system":
+            command = str(args[0]).split()
+        else:
+            return
+
+        self.subprocess(command)
+
+    def open(self, path, file):
+        """Accounts for `path` being opened; returns `file`, wrapped if needed."""
+
+        if not self.enabled:
+            return file
+
+        with self.lock:
+            self.files[path] = self.files.get(path, 0) + 1
+
+        return _CountingFile(file, self)
+
+    def opened(self, path, size):
+        """Accounts for `path` being opened, and `size` bytes read from it directly."""
+
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.files[path] = self.files.get(path, 0) + 1
+            self.bytes_read += size
+
+    def read(self, size):
+        with self.lock:
+            self.bytes_read += size
+
+    def hit(self):
+        """Accounts for an attribute being served by `SysfsReader`, instead of read again."""
+
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.hits += 1
+
+    def listing(self):
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.listings += 1
+
+    def subprocess(self, command):
+        name = str(command[0]) if command else "?"
+
+        # `sudo <command>` is accounted for as the command itself.
+        if name == "sudo" and len(command) > 1:
+            name = f"sudo {command[1]}"
+
+        with self.lock:
+            self.subprocesses[name] = self.subprocesses.get(name, 0) + 1
+
+    def http(self, host, size):
+        if not self.enabled:
+            return
+
+        with self.lock:
+            requests, downloaded = self.hosts.get(host, (0, 0))
+            self.hosts[host] = (requests + 1, downloaded + size)
+
+    def summary(self):
+        with self.lock:
+            return {
+                "Files Opened": sum(self.files.values()),
+                "Unique Files": len(self.files),
+                "Opened More Than Once": {
+                    path: count for path, count
+                    in sorted(self.files.items())
+                    if count > 1
+                },
+                "Bytes Read": self.bytes_read,
+                "Cached Reads": self.hits,
+                "Directory Listings": self.listings,
+                "Subprocesses": dict(sorted(self.subprocesses.items())),
+                "HTTP Requests": {
+                    host: {"Requests": requests, "Bytes": downloaded}
+                    for host, (requests, downloaded) in sorted(self.hosts.items())
+                },
+                "Bytes Downloaded": sum(x[1] for x in self.hosts.values()),
+            }
+
+    def with_meta(self, info):
+        """
+        `info`, with the accounted work added to its `_meta`,
+        if enabled; otherwise, `info` itself.
+        """
+
+        if not self.enabled:
+            return info
+
+        return {**info, "_meta": {**info.get("_meta", {}), "stats": self.summary()}}
+
+    def report(self):
+        summary = self.summary()
+
+        print(color_text("\n--> Stats:", "cyan"))
+
+        for key, value in summary.items():
+            if not isinstance(value, dict):
+                print(f"    {key}: {value}")
+                continue
+
+            print(f"    {key}: {len(value) if value else 'none'}")
+
+            for name, count in value.items():
+                if isinstance(count, dict):
+                    count = ", ".join(f"{k.lower()}: {v}" for k, v in count.items())
+
+                print(f"        {name}: {count}")
+
+
+Accounting = AccountingInst()
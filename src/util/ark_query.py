@@ -13,12 +13,23 @@
 #   limitations under the License.
 #
 
+import re
+
 import requests
 import xmltodict
 
 from src import info
 from src.info import color_text
 from src.util.debugger import Debugger as debugger
+from src.util.hedging import hedge
+from src.util.lookup_cache import MISS, LookupCache as lookup_cache
+from src.util.network import Network as network
+from src.util.scraper import Field, scrape
+
+# The codename is on the line after its label; e.g.
+#   <span class="value" data-key="CodeNameText">
+#       <a href="...">Products formerly Coffee Lake</a>
+CODENAME_FIELDS = [Field("codename", re.compile(r'data-key="CodeNameText"'), following=True)]
 
 
 def get_full_ark_url(prod_url):
@@ -44,39 +55,72 @@ def quick_search(
     )
 ):
 
+    cached = lookup_cache.get("ark", url.format(search_term))
+
+    if cached is not MISS:
+        return cached
+
+    # The French locale is asked as well – in case the English one
+    # is slow to answer, or doesn't return any results.
+    french = url.replace('en_us', 'fr_fr').replace('%2Fus', '%2Ffr').replace('%2Fen', '%2Ffr')
+
+    try:
+        r = hedge(
+            [
+                ("ark-search/en_us", lambda: _search(url.format(search_term))),
+                ("ark-search/fr_fr", lambda: _search(french.format(search_term))),
+            ],
+            valid=lambda results: results is not None
+        )
+    except Exception:
+        return
+
+    # Whichever locale answered, it's remembered for the
+    # original query, so it isn't retried on every run.
+    if r is not None:
+        lookup_cache.set("ark", url.format(search_term), r)
+
+    return r
+
+
+def _search(url):
+    """Results of the quick search at `url`; or `None`, if it didn't return any."""
+
     try:
-        r = requests.get(
-            url.format(search_term), 
-            headers=info.useragent_header, 
+        return network.get(
+            url,
+            headers=info.useragent_header,
             timeout=info.requests_timeout
         ).json()
-
-        return r
-    except Exception as e:
-        if isinstance(e, requests.ConnectionError):
-            return
-        elif (
-            isinstance(e, requests.exceptions.JSONDecodeError) and
-            "fr_fr" not in url
-        ):
-            return quick_search(search_term, url.replace('en_us', 'fr_fr').replace('%2Fus', '%2Ffr').replace('%2Fen', '%2Ffr'))
-        else:
-            return
+    except requests.exceptions.JSONDecodeError:
+        return None
 
 
-def get_codename(ark_url, tried=False):
+def get_codename(ark_url):
     """
     We get the ARK URL from the quick search results,
     and obtain the HTML data.
     Parsing it, we can get the codename.
+
+    The French page is asked as well, in case
+    the English one is slow, or lacks it.
     """
 
+    cached = lookup_cache.get("ark", ark_url)
+
+    if cached is not MISS:
+        return cached
+
+    french = ark_url.replace('/us', '/fr').replace('/en', '/fr')
+
     try:
-        text_thing = requests.get(
-            ark_url, 
-            headers=info.useragent_header, 
-            timeout=info.requests_timeout
-        ).content.decode("utf8")
+        actual_line = hedge(
+            [
+                ("ark/en", lambda: _codename_line(ark_url)),
+                ("ark/fr", lambda: _codename_line(french)),
+            ],
+            valid=lambda line: line is not None
+        )
     except Exception as e:
         if isinstance(e, requests.ConnectionError):
             return
@@ -89,26 +133,30 @@ def get_codename(ark_url, tried=False):
             return
         else:
             raise e
-            
-    lines = text_thing.split("\n")
-    actual_line = {"a":{}}
-
-    for line_index in range(len(lines)):
-        if 'data-key="CodeNameText"' in lines[line_index]:
-            actual_line = lines[line_index + 1].strip()
 
-    if type(actual_line) != str and not tried:
-        return get_codename(ark_url.replace('/us', '/fr').replace('/en', '/fr'), True)
-    elif type(actual_line) != str and tried:
-        return ""
+    if actual_line is None:
+        return lookup_cache.set("ark", ark_url, "")
 
     # We only need to parse the one line.
-    line_json = xmltodict.parse(actual_line)
+    line_json = xmltodict.parse(actual_line.strip())
 
     # The codename is wrapped in an <a> tag.
     codename = line_json.get("a").get("#text")
 
-    return codename if codename else ""
+    return lookup_cache.set("ark", ark_url, codename if codename else "")
+
+
+def _codename_line(ark_url):
+    """The line of the ARK page at `ark_url` holding the codename; or `None`, if there's none."""
+
+    _, values = scrape(
+        ark_url,
+        CODENAME_FIELDS,
+        headers=info.useragent_header,
+        timeout=info.requests_timeout
+    )
+
+    return values.get("codename")
 
 
 def iark_search(search_term):
@@ -1,6 +1,42 @@
+import sys
+from array import array
+
 from src.info import color_text
 from src.util.debugger import Debugger as debugger
+from src.util.timings import Timings as timings
+
+# `(vendor << 16) | device` -> codename, built on first use.
+_index = None
+
+# `(vendor, family, model)` -> codename, built on first use.
+_cpu_index = None
+
+
+def _gpu_index():
+    global _index
+
+    if _index is None:
+        from src.uarch.gpu.gpu_index import CODENAMES, KEYS, ORDINALS
+
+        keys = array("I")
+        keys.frombytes(KEYS)
+
+        if sys.byteorder == "big":
+            keys.byteswap()
+
+        _index = {key: CODENAMES[ordinal] for key, ordinal in zip(keys, ORDINALS)}
+
+    return _index
+
+
+def _id(value):
+    try:
+        return int(value.strip(), 16)
+    except (AttributeError, ValueError):
+        return None
+
 
+@timings.timed("codename.gpu")
 def gpu(dev, ven):
     """
     Extracts µarches matching the provided data,
@@ -16,18 +52,12 @@ def gpu(dev, ven):
         return
 
     elif "1002" in ven:
-        from src.uarch.gpu.amd_gpu import amd
-        items = amd
-
         debugger.log_dbg(color_text(
             "--> [GpuCodenameManager]: AMD vendor detected!",
             "green"
         ))
 
     elif "10de" in ven:
-        from src.uarch.gpu.nvidia_gpu import nvidia
-        items = nvidia
-
         debugger.log_dbg(color_text(
             "--> [GpuCodenameManager]: NVIDIA vendor detected!",
             "green"
@@ -47,17 +77,8 @@ def gpu(dev, ven):
 
     found = ""
 
-    for uarch in items:
-        if found:
-            break
-
-        for id in uarch.get("IDs", []):
-            if (
-                id.get("Vendor", "").lower() == ven.lower()
-                and id.get("Device", "").lower() == dev.lower()
-            ):
-                found = uarch.get("Codename")
-                break
+    if _id(dev) is not None and _id(ven) is not None:
+        found = _gpu_index().get((_id(ven) << 16) | _id(dev), "")
 
     if found:
         debugger.log_dbg(color_text(
@@ -66,3 +87,83 @@ def gpu(dev, ven):
         ))
 
     return found
+
+
+def _cpu_table():
+    global _cpu_index
+
+    if _cpu_index is None:
+        from src.uarch.cpu.amd_cpu import amd
+        from src.uarch.cpu.intel_cpu import intel
+
+        index = {("intel", family, model): codename for (family, model), codename in intel.items()}
+
+        for (family, first, last), (codename, _) in amd.items():
+            for model in range(first, last + 1):
+                index[("amd", family, model)] = codename
+
+        _cpu_index = index
+
+    return _cpu_index
+
+
+def cpu_signature(eax):
+    """
+    Decodes the `EAX` register of CPUID leaf 1 into
+    the CPU's `(family, model, stepping)`.
+    """
+
+    stepping = eax & 0xF
+    model = (eax >> 4) & 0xF
+    family = (eax >> 8) & 0xF
+
+    if family == 0xF:
+        family += (eax >> 20) & 0xFF
+
+    if family >= 0x6:
+        model |= ((eax >> 16) & 0xF) << 4
+
+    return family, model, stepping
+
+
+def cpu(ven, family, model, stepping=None):
+    """
+    Looks up the codename of an Intel or AMD CPU,
+    by its CPUID family, model and stepping; if possible.
+    """
+
+    ven = (ven or "").lower()
+
+    if "intel" in ven:
+        vendor = "intel"
+    elif "amd" in ven:
+        vendor = "amd"
+    else:
+        return None
+
+    try:
+        key = (vendor, int(family), int(model))
+    except (TypeError, ValueError):
+        return None
+
+    found = _cpu_table().get(key)
+
+    # Codenames differing by stepping.
+    if isinstance(found, dict):
+        steppings = sorted(found)
+        pick = steppings[0]
+
+        if stepping is not None:
+            for value in steppings:
+                if value <= int(stepping):
+                    pick = value
+
+        found = found[pick]
+
+    if found:
+        debugger.log_dbg(color_text(
+            f"--> [CpuCodenameManager]: Located codename '{found}' for family {hex(key[1])}, model {hex(key[2])} locally!",
+            "green"
+        ))
+
+    return found
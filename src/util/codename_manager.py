@@ -1,7 +1,8 @@
-import src.util.ark_query as ark_query
-from src.util.wc_amd_query import parse_codename
 from src.info import color_text
+from src.util.codename import cpu, cpu_signature
+from src.util.deadline import Deadline as deadline
 from src.util.debugger import Debugger as debugger
+from src.util.timings import Timings as timings
 
 
 class CodenameManager:
@@ -9,32 +10,84 @@ class CodenameManager:
     A WIP manager to obtain the codename value of the current CPU.
 
     Currently, this is only for Intel and AMD CPUs.
+
+    Codenames are looked up locally by the CPU's `(family, model, stepping)`
+    signature – either the one provided, or the one reported by the CPUID
+    instruction. Scraping Intel ARK/WikiChip is only a fallback, for
+    CPUs the local table doesn't know, and is skipped when `offline`,
+    or past the deadline (see `Deadline`).
     """
 
-    def __init__(self, name, vendor):
+    def __init__(self, name, vendor, signature=None, offline=False):
         self.name = name
         self.vendor = vendor or ""
+        self.signature = signature
+        self.offline = offline
         self.codename = None
         self.codename_init()
 
+    @timings.timed("codename.cpu")
     def codename_init(self):
         # 'Unified' function, determing which codename function to call.
 
-        if "intel" in self.vendor.lower():
-            self.codename_intel()
-        elif "amd" in self.vendor.lower():
-            self.codename_amd()
-        elif "apple" in self.vendor.lower():
-            self.codename_apple_arm()
-        else:
+        if "intel" in self.vendor.lower() or "amd" in self.vendor.lower():
+            self.codename_local()
+
+            if self.codename or self.offline:
+                return
+
+            if deadline.expired():
+                deadline.degrade("CPU", self.name, "Codename")
+                return
+
+        try:
+            if "intel" in self.vendor.lower():
+                self.codename_intel()
+            elif "amd" in self.vendor.lower():
+                self.codename_amd()
+            elif "apple" in self.vendor.lower():
+                self.codename_apple_arm()
+            else:
+                debugger.log_dbg(color_text(
+                    f"--> [CpuCodenameManager]: Failed to match against supported CPU vendors – aborting!\n",
+                    "red"
+                ))
+
+                return
+        except Exception as e:
+            # Only lookups cut short by the deadline are expected to fail.
+            if not deadline.expired():
+                raise e
+
             debugger.log_dbg(color_text(
-                f"--> [CpuCodenameManager]: Failed to match against supported CPU vendors – aborting!\n",
-                "red"
+                f"--> [CpuCodenameManager]: Deadline reached while looking up '{self.name}' – skipping!\n\t^^^^^^^{str(e)}",
+                "yellow"
             ))
 
-            return
+        if not self.codename and deadline.expired():
+            deadline.degrade("CPU", self.name, "Codename")
+
+    def codename_local(self):
+        if not self.signature:
+            try:
+                from src.dumps.Windows.cpuid import CPUID
+
+                self.signature = cpu_signature(CPUID()(1)[0])
+            except Exception as e:
+                debugger.log_dbg(color_text(
+                    f"--> [CpuCodenameManager]: Failed to obtain CPUID signature – ignoring!\n\t^^^^^^^{str(e)}",
+                    "red"
+                ))
+
+                return None
+
+        self.codename = cpu(self.vendor, *self.signature)
+
+        return self.codename
 
     def codename_intel(self):
+        import src.util.ark_query as ark_query
+
         search_term = ark_query.simplified_name(self.name)
         found_term = ark_query.iark_search(search_term)
 
@@ -44,7 +97,13 @@ class CodenameManager:
         ark_url = ark_query.get_full_ark_url(
             found_term.get("prodUrl")
         )
-        value = ark_query.get_codename(ark_url).replace("Products formerly", "").replace("Produits anciennement", "").strip()
+        value = ark_query.get_codename(ark_url)
+
+        # Unreachable, or gave up on.
+        if value is None:
+            return None
+
+        value = value.replace("Products formerly", "").replace("Produits anciennement", "").strip()
 
         debugger.log_dbg(color_text(
             f"--> [CpuCodenameManager]: Successfully located codename '{value}' for provided '{self.name}'!\n",
@@ -56,6 +115,8 @@ class CodenameManager:
         return value
 
     def codename_amd(self):
+        from src.util.wc_amd_query import parse_codename
+
         data = parse_codename(self.name)
 
         if data:
@@ -0,0 +1,112 @@
+import threading
+import time
+
+from src import info
+from src.info import color_text
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised by lookups which weren't made, or finished, before the deadline."""
+
+
+class DeadlineInst:
+    """
+    Wall-clock limit of the whole run (see `--deadline`), counted from
+    when OCSysInfo was launched (see `start`).
+
+    Discovery always runs to completion; everything that only enriches it –
+    ID and codename lookups – is bounded by the deadline, less a reserve for
+    dumping (see `info.deadline_reserve`): requests are given up on, or
+    not made at all, once it's reached (see `Network.request`). Whatever
+    was left unresolved because of it is recorded (see `degrade`), and
+    listed under `_meta` in the dumps.
+
+    Inactive by default; in which case `expired` is always `False`,
+    and `timeout` is `None`.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.seconds = None
+        self.degraded = {}
+
+    def start(self):
+        self.started = time.monotonic()
+
+    def set(self, seconds):
+        self.seconds = seconds
+
+    @property
+    def active(self):
+        return self.seconds is not None
+
+    def remaining(self):
+        """
+        Seconds left for lookups, before the reserve kept for dumping;
+        negative once it's reached, and infinite if inactive.
+        """
+
+        if not self.active:
+            return float("inf")
+
+        reserve = min(info.deadline_reserve, self.seconds / 2)
+
+        return self.seconds - reserve - (time.monotonic() - self.started)
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def timeout(self):
+        """`remaining`, as a timeout: never negative, and `None` if inactive."""
+
+        if not self.active:
+            return None
+
+        return max(self.remaining(), 0)
+
+    def degrade(self, category, device, field, status="Unresolved"):
+        """Records `field` of `device` (in `category`) as left `status` because of the deadline."""
+
+        with self.lock:
+            self.degraded.setdefault(category, []).append({
+                "Device": device,
+                "Field": field,
+                "Status": status,
+            })
+
+    def summary(self):
+        with self.lock:
+            return {
+                "Seconds": self.seconds,
+                "Elapsed (s)": round(time.monotonic() - self.started, 3),
+                "Reached": self.expired(),
+                "Degraded": {category: list(fields) for category, fields in self.degraded.items()},
+            }
+
+    def with_meta(self, info):
+        """
+        `info`, with what was degraded because of the deadline added to its
+        `_meta`, if active; otherwise, `info` itself.
+        """
+
+        if not self.active:
+            return info
+
+        return {**info, "_meta": {**info.get("_meta", {}), "deadline": self.summary()}}
+
+    def report(self):
+        if not self.degraded:
+            return
+
+        print(color_text(
+            f"\n--> Deadline of {self.seconds}s reached – left unresolved:",
+            "yellow"
+        ))
+
+        for category, fields in self.summary()["Degraded"].items():
+            for field in fields:
+                print(f"    {category}: {field['Field']} of '{field['Device']}' ({field['Status'].lower()})")
+
+
+Deadline = DeadlineInst()
@@ -1,11 +1,19 @@
+import logging
 import os
 
+from src import info
 from src.info import AppInfo, clear_ansi
 
 
+class _PlainFormatter(logging.Formatter):
+    def format(self, record):
+        return clear_ansi(record.getMessage())
+
+
 class DebuggerInst():
     def __init__(self):
         self.debug = None
+        self.logger = None
         self.file  = os.path.join(
             AppInfo.root_dir,
             'ocsi_dbg_log.txt'
@@ -14,15 +22,31 @@ class DebuggerInst():
     def log_dbg(self, contents = "\n"):
         if not self.debug:
             return
-        
+
         if self.file:
-            with open(self.file, 'a') as file:
-                file.write(clear_ansi(contents) + "\n")
-                file.close()
+            if not self.logger:
+                self.logger = self._attach()
+
+            self.logger.debug(contents)
 
         print(contents)
 
     def toggle(self, value: bool):
         self.debug = value
 
-Debugger = DebuggerInst()
\ No newline at end of file
+    def _attach(self):
+        from src.util.log_backend import BatchedFileHandler, LogBackend as log_backend
+
+        handler = BatchedFileHandler(
+            self.file,
+            max_bytes=info.debug_log_max_bytes,
+            backups=info.log_backups,
+        )
+        handler.setFormatter(_PlainFormatter())
+
+        logger = log_backend.attach("ocsysinfo.debug", handler)
+        logger.setLevel(logging.DEBUG)
+
+        return logger
+
+Debugger = DebuggerInst()
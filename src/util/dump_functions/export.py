@@ -0,0 +1,158 @@
+import json
+import logging
+import os
+import plistlib
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+
+from src.error.logger import Logger
+from src.util.accounting import Accounting as accounting
+from src.util.deadline import Deadline as deadline
+from src.util.timings import Timings as timings
+from src.util.tree import render
+
+FILES = {
+    "txt": "info_dump.txt",
+    "json": "info_dump.json",
+    "xml": "info_dump.xml",
+    "plist": "info_dump.plist",
+}
+
+NAMES = {
+    "txt": "TXT",
+    "json": "JSON",
+    "xml": "XML",
+    "plist": "Plist",
+}
+
+
+def _txt(info, file):
+    # `_meta` is left out; it's only added to the structured formats.
+    for key in info:
+        if key != "_meta":
+            render(key, info[key], file, color=False)
+            file.write("\n")
+
+
+def _json(info, file):
+    json.dump(info, file, indent=4, sort_keys=False)
+
+
+def _xml(info, file):
+    import dicttoxml
+
+    # Disables debug prints from `dicttoxml`
+    dicttoxml.LOG.setLevel(logging.ERROR)
+    file.write(dicttoxml.dicttoxml(info, root=True))
+
+
+def _plist(info, file):
+    plistlib.dump(info, file, sort_keys=False)
+
+
+# Each format's serializer, and the mode its file is opened in.
+SERIALIZERS = {
+    "txt": (_txt, "w"),
+    "json": (_json, "w"),
+    "xml": (_xml, "wb"),
+    "plist": (_plist, "wb"),
+}
+
+
+def _write(format, directory, info):
+    """
+    Writes `info` in `format` to a temporary file in `directory`, which,
+    once synced to disk, replaces the dump – so it's never seen half-written.
+
+    Returns the path of the dump.
+    """
+
+    path = os.path.join(directory, FILES[format])
+    tmp = os.path.join(directory, f".{FILES[format]}.{secrets.token_hex(4)}")
+    serialize, mode = SERIALIZERS[format]
+
+    # Created like `open` would, so the user's umask applies.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+
+    try:
+        with os.fdopen(fd, mode, encoding="utf-8" if mode == "w" else None) as file:
+            with timings.span(f"dump.{format}"):
+                serialize(info, file)
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+        raise
+
+    return path
+
+
+@timings.timed("dump.export")
+def export(dm, targets, logger):
+    """
+    Dumps the information of `dm` in every `(format, directory)` of `targets`.
+
+    The information – with `_meta` – is put together once, and shared by
+    every format, each written with its own serializer (see `_write`).
+    Formats are written in a thread each; as serializing holds the GIL,
+    it's mostly syncing them to disk which overlaps.
+
+    Returns, for each target, the path of its dump – or the exception
+    which kept it from being written.
+    """
+
+    # `_meta` is only added to the structured formats.
+    info = deadline.with_meta(accounting.with_meta(timings.with_meta(dm.info)))
+
+    def write(target):
+        try:
+            return _write(*target, info)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(len(targets), 1), thread_name_prefix="ocsi-dump") as pool:
+        outputs = list(pool.map(write, targets))
+
+    results = []
+
+    for (format, directory), output in zip(targets, outputs):
+        if isinstance(output, Exception):
+            logger.error(
+                f"Failed to dump to {NAMES[format]}!\n\t^^^^^^^^^{str(output)}", __file__)
+        else:
+            logger.info(
+                f'Successfully dumped "{FILES[format]}" into "{directory}"', __file__)
+
+        results.append(output)
+
+    return results
+
+
+def dump(format, dm, dir, logger):
+    """
+    Dumps the information of `dm` in a single `format`; returns
+    a message saying so, or `None` if it couldn't be written.
+    """
+
+    from src.managers.devicemanager import DeviceManager
+
+    if not isinstance(dm, DeviceManager):
+        raise TypeError("Parameter 'dm' is not of type 'DeviceManager'!")
+
+    if not os.path.isdir(dir):
+        raise ValueError("Parameter 'dir' is not a valid directory!")
+
+    if not isinstance(logger, Logger):
+        raise TypeError("Parameter 'logger' is not of type 'Logger'!")
+
+    if isinstance(export(dm, [(format, dir)], logger)[0], Exception):
+        return None
+
+    return f'Successfully dumped "{FILES[format]}" into "{dir}"\n'
@@ -0,0 +1,325 @@
+import atexit
+import bisect
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from src import info
+from src.info import AppInfo, color_text
+from src.util.debugger import Debugger as debugger
+from src.util.network import Network as network
+
+# Upper bounds, in milliseconds, of the buckets of each latency histogram;
+# the last bucket holds everything slower.
+BUCKETS = [25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Sources are only ranked by their latency once
+# they've all answered at least this many times...
+MIN_SAMPLES = 5
+
+# ... and past this many answers, their counts are halved,
+# so that recent runs outweigh older ones.
+MAX_SAMPLES = 1000
+
+
+class LatencyInst:
+    """
+    Latency histograms of the sources of hedged lookups (see `hedge`): how long
+    each took to answer, and how often it didn't. Stored in OCSysInfo's data
+    directory, so the fastest source can be asked first on later runs.
+    """
+
+    def __init__(self):
+        self.name = "source_latency.json"
+        self.sources = {}
+        self.lock = threading.RLock()
+        self.path = ""
+        self.loaded = False
+        self.dirty = False
+
+    def record(self, source, seconds):
+        """Records `source` answering after `seconds`; or not answering, if `None`."""
+
+        with self.lock:
+            self.load()
+
+            entry = self.sources.setdefault(
+                source, {"histogram": [0] * (len(BUCKETS) + 1), "misses": 0}
+            )
+
+            if seconds is None:
+                entry["misses"] += 1
+            else:
+                entry["histogram"][bisect.bisect_left(BUCKETS, seconds * 1e3)] += 1
+
+                if sum(entry["histogram"]) > MAX_SAMPLES:
+                    entry["histogram"] = [count // 2 for count in entry["histogram"]]
+                    entry["misses"] //= 2
+
+            self.dirty = True
+
+    def median(self, source):
+        """
+        Median latency of `source`'s answers, in milliseconds (the upper
+        bound of its bucket); or `None`, if it hasn't answered often enough.
+        """
+
+        with self.lock:
+            self.load()
+
+            entry = self.sources.get(source)
+
+            if not entry or sum(entry["histogram"]) < MIN_SAMPLES:
+                return None
+
+            total = sum(entry["histogram"])
+            seen = 0
+
+            for bound, count in zip(BUCKETS + [float("inf")], entry["histogram"]):
+                seen += count
+
+                if seen * 2 >= total:
+                    return bound
+
+    def expected(self, source):
+        """
+        How long `source` is expected to take to answer, in milliseconds: its
+        median latency, scaled up by how often it doesn't answer at all (as
+        it's then waited on for nothing); or `None`, if it isn't known yet.
+        """
+
+        median = self.median(source)
+
+        if median is None:
+            return None
+
+        with self.lock:
+            entry = self.sources[source]
+            answered = sum(entry["histogram"])
+            rate = answered / (answered + entry["misses"])
+
+        return median / max(rate, 0.05)
+
+    def rank(self, sources):
+        """`sources`, fastest first (see `expected`); or as they are, unless every one of them is known."""
+
+        expected = [self.expected(source) for source in sources]
+
+        if None in expected:
+            return list(sources)
+
+        return [source for _, source in sorted(zip(expected, sources), key=lambda pair: pair[0])]
+
+    def load(self):
+        if self.loaded:
+            return
+
+        self.loaded = True
+
+        if not AppInfo.data_dir or not os.path.isdir(AppInfo.data_dir):
+            return
+
+        self.path = os.path.join(AppInfo.data_dir, self.name)
+
+        if not os.path.isfile(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                sources = json.load(file).get("sources", {})
+
+            for source, entry in sources.items():
+                if len(entry.get("histogram", [])) == len(BUCKETS) + 1:
+                    self.sources[source] = {
+                        "histogram": [int(count) for count in entry["histogram"]],
+                        "misses": int(entry.get("misses", 0)),
+                    }
+        except Exception as e:
+            # Corrupt histograms are simply discarded.
+            self.sources.clear()
+
+            debugger.log_dbg(color_text(
+                f"--> [Latency]: Failed to read '{self.path}' – ignoring!\n\t^^^^^^^{str(e)}",
+                "red"
+            ))
+
+    def flush(self):
+        """Atomically writes the histograms to disk (see `LookupCache.flush`)."""
+
+        with self.lock:
+            if not self.dirty or not self.path:
+                return
+
+            data = {"version": 1, "buckets": BUCKETS, "sources": self.sources}
+
+            try:
+                fd, tmp = tempfile.mkstemp(
+                    prefix=f".{self.name}.", dir=os.path.dirname(self.path)
+                )
+
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as file:
+                        json.dump(data, file)
+                        file.flush()
+                        os.fsync(file.fileno())
+
+                    os.replace(tmp, self.path)
+                except Exception:
+                    os.unlink(tmp)
+                    raise
+
+                self.dirty = False
+            except Exception as e:
+                debugger.log_dbg(color_text(
+                    f"--> [Latency]: Failed to write '{self.path}' – ignoring!\n\t^^^^^^^{str(e)}",
+                    "red"
+                ))
+
+
+Latency = LatencyInst()
+
+atexit.register(Latency.flush)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _executor():
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # Every enrichment worker may be hedging two sources at once.
+                _pool = ThreadPoolExecutor(
+                    max_workers=max(info.enrichment_workers, 1) * 2,
+                    thread_name_prefix="ocsi-hedge"
+                )
+
+    return _pool
+
+
+def _attempt(function, cancel):
+    previous = network.cancellable(cancel)
+    start = time.monotonic()
+
+    try:
+        return function(), time.monotonic() - start
+    finally:
+        network.cancellable(previous)
+
+
+def hedge(attempts, valid=bool, delay=None):
+    """
+    Asks several sources the same question, and returns the first answer
+    which is `valid`; or `None`, if none is. `attempts` are `(source, function)`
+    pairs, in order of preference – unless their latencies say otherwise
+    (see `Latency.rank`).
+
+    The first source is asked right away, and the next one once the previous
+    one hasn't answered for `delay` seconds (`info.hedge_delay`), or as soon as
+    it fails, or its answer isn't valid. A negative delay asks them one after
+    another instead. Once there's an answer, the others are cancelled: those
+    which haven't started yet won't, and those which have raise `Cancelled`
+    as soon as they make another request, or read more of one (see `scrape`).
+
+    If none is valid, the first answer which is at least truthy is returned
+    instead; or, if there's none, and any source raised, the first exception is.
+    """
+
+    delay = info.hedge_delay if delay is None else delay
+    functions = dict(attempts)
+    pending = Latency.rank(list(functions))
+    errors = []
+    fallback = []
+
+    def settle():
+        if fallback:
+            return fallback[0]
+
+        if errors:
+            raise errors[0]
+
+        return None
+
+    if delay < 0:
+        for source in pending:
+            try:
+                answer, seconds = _attempt(functions[source], None)
+            except Exception as e:
+                errors.append(e)
+                Latency.record(source, None)
+                continue
+
+            if valid(answer):
+                Latency.record(source, seconds)
+                return answer
+
+            if answer:
+                fallback.append(answer)
+
+            Latency.record(source, None)
+
+        return settle()
+
+    cancel = threading.Event()
+    running = {}
+
+    def start():
+        source = pending.pop(0)
+        running[_executor().submit(_attempt, functions[source], cancel)] = source
+
+    start()
+
+    try:
+        while running:
+            done, _ = wait(running, timeout=delay if pending else None, return_when=FIRST_COMPLETED)
+
+            if not done:
+                debugger.log_dbg(color_text(
+                    f"--> [Hedge]: No answer from '{', '.join(running.values())}' after {delay}s" +
+                    f" – asking '{pending[0]}' as well...",
+                    "yellow"
+                ))
+
+                start()
+                continue
+
+            for future in done:
+                source = running.pop(future)
+
+                try:
+                    answer, seconds = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    Latency.record(source, None)
+                else:
+                    if valid(answer):
+                        Latency.record(source, seconds)
+
+                        if running:
+                            debugger.log_dbg(color_text(
+                                f"--> [Hedge]: '{source}' answered first – cancelling " +
+                                f"'{', '.join(running.values())}'!",
+                                "cyan"
+                            ))
+
+                        return answer
+
+                    if answer:
+                        fallback.append(answer)
+
+                    Latency.record(source, None)
+
+                if pending:
+                    start()
+    finally:
+        cancel.set()
+
+        for future in running:
+            future.cancel()
+
+    return settle()
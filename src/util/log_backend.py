@@ -0,0 +1,154 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, RotatingFileHandler
+
+# Maximum amount of records written before the files are flushed.
+BATCH = 512
+
+_STOP = object()
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record):
+        # Formatting is left to the background thread.
+        return record
+
+
+class BatchedFileHandler(RotatingFileHandler):
+    """
+    `RotatingFileHandler` which leaves flushing to the end of each batch
+    (see `LogBackendInst`), and keeps track of the file's size itself,
+    instead of asking the (buffered) stream for it on every record.
+    """
+
+    def __init__(self, filename, max_bytes=0, backups=0, encoding="utf-8"):
+        super().__init__(filename, mode="a", maxBytes=max_bytes, backupCount=backups, encoding=encoding, delay=True)
+
+        try:
+            self.size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self.size = 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+
+            if self.maxBytes > 0 and self.size and self.size + len(msg) > self.maxBytes:
+                self.doRollover()
+
+            if self.stream is None:
+                self.stream = self._open()
+
+            self.stream.write(msg)
+            self.size += len(msg)
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.size = 0
+
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+
+class LogBackendInst:
+    """
+    Writes the records of every `logging.Logger` attached to it
+    (see `attach`) from a single background thread.
+
+    Loggers only enqueue their records, which are then formatted,
+    and written in batches, with a single flush per batch. Whatever's
+    left in the queue is written when the application exits.
+    """
+
+    def __init__(self):
+        self.queue = queue.SimpleQueue()
+        self.handlers = []
+        self.lock = threading.Lock()
+        self.thread = None
+        self.registered = False
+
+    def stop_at_exit(self):
+        """
+        Has `stop` called at exit, once. Exit handlers run in reverse order; so
+        this has to be called before registering any that may still log (see `main`).
+        """
+
+        if not self.registered:
+            self.registered = True
+            atexit.register(self.stop)
+
+    def attach(self, name, handler):
+        """
+        Returns the `logging.Logger` named `name`, whose
+        records are written through `handler`, in the background.
+        """
+
+        handler.addFilter(lambda record: record.name == name)
+
+        logger = logging.getLogger(name)
+        logger.propagate = False
+
+        with self.lock:
+            self.handlers.append(handler)
+
+            if not any(isinstance(h, _QueueHandler) for h in logger.handlers):
+                logger.addHandler(_QueueHandler(self.queue))
+
+            if not self.thread:
+                self.thread = threading.Thread(target=self._run, name="ocsi-logging", daemon=True)
+                self.thread.start()
+
+                self.stop_at_exit()
+
+        return logger
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+
+            while len(batch) < BATCH:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+
+            for record in batch:
+                if record is _STOP:
+                    stop = True
+                    continue
+
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+
+            for handler in self.handlers:
+                handler.flush_batch()
+
+            if stop:
+                return
+
+    def stop(self):
+        """Writes whatever's left in the queue, and closes every file."""
+
+        if not self.thread:
+            return
+
+        self.queue.put(_STOP)
+        self.thread.join(timeout=5)
+        self.thread = None
+
+        for handler in self.handlers:
+            handler.close()
+
+
+LogBackend = LogBackendInst()
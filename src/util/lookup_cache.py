@@ -0,0 +1,189 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from src import info
+from src.info import AppInfo, color_text
+from src.util.debugger import Debugger as debugger
+
+# Returned by `get` when nothing (valid) is cached,
+# since `None` is a legitimate, cached, negative result.
+MISS = object()
+
+
+class LookupCacheInst:
+    """
+    Persistent, size-bounded LRU cache for the results of network lookups
+    (PCI IDs, Intel ARK, WikiChip), stored in OCSysInfo's data directory.
+
+    Entries expire per source (see `info.lookup_cache_ttl`); empty results
+    are cached as well, but expire after `info.lookup_cache_negative_ttl`.
+    """
+
+    def __init__(self):
+        self.name = "lookup_cache.json"
+        self.entries = OrderedDict()
+        self.lock = threading.RLock()
+        self.path = ""
+        self.loaded = False
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, source, key):
+        with self.lock:
+            self.load()
+
+            entry = self.entries.get((source, key))
+
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self.entries[(source, key)]
+                    self.dirty = True
+
+                self.misses += 1
+
+                return MISS
+
+            self.entries.move_to_end((source, key))
+            self.hits += 1
+
+            return entry[1]
+
+    def peek(self, source, key):
+        """Like `get`, without counting as a lookup, nor as a use of the entry."""
+
+        with self.lock:
+            self.load()
+
+            entry = self.entries.get((source, key))
+
+            if entry is None or entry[0] < time.time():
+                return MISS
+
+            return entry[1]
+
+    def set(self, source, key, value):
+        ttl = (
+            info.lookup_cache_ttl.get(source, info.lookup_cache_negative_ttl)
+            if value
+            else info.lookup_cache_negative_ttl
+        )
+
+        with self.lock:
+            self.load()
+
+            self.entries[(source, key)] = (time.time() + ttl, value)
+            self.entries.move_to_end((source, key))
+            self.dirty = True
+
+            while len(self.entries) > info.lookup_cache_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def load(self):
+        if self.loaded:
+            return
+
+        self.loaded = True
+
+        if not AppInfo.data_dir or not os.path.isdir(AppInfo.data_dir):
+            return
+
+        self.path = os.path.join(AppInfo.data_dir, self.name)
+
+        if not os.path.isfile(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                entries = json.load(file).get("entries", [])
+
+            now = time.time()
+
+            # Stored in LRU order, least recently used first.
+            for source, key, expires, value in entries:
+                if expires >= now:
+                    self.entries[(source, key)] = (expires, value)
+        except Exception as e:
+            # A corrupt cache is simply discarded.
+            self.entries.clear()
+
+            debugger.log_dbg(color_text(
+                f"--> [LookupCache]: Failed to read '{self.path}' – ignoring!\n\t^^^^^^^{str(e)}",
+                "red"
+            ))
+
+    def flush(self):
+        """
+        Atomically writes the cache to disk: the data goes into a temporary
+        file in the same directory, which is fsync'd and renamed over the old
+        cache, so an interrupted write never leaves a truncated file behind.
+        """
+
+        with self.lock:
+            if not self.dirty or not self.path:
+                return
+
+            data = {
+                "version": 1,
+                "entries": [
+                    [source, key, expires, value]
+                    for (source, key), (expires, value) in self.entries.items()
+                ],
+            }
+
+            try:
+                fd, tmp = tempfile.mkstemp(
+                    prefix=f".{self.name}.", dir=os.path.dirname(self.path)
+                )
+
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as file:
+                        json.dump(data, file)
+                        file.flush()
+                        os.fsync(file.fileno())
+
+                    os.replace(tmp, self.path)
+                except Exception:
+                    os.unlink(tmp)
+                    raise
+
+                self.dirty = False
+            except Exception as e:
+                debugger.log_dbg(color_text(
+                    f"--> [LookupCache]: Failed to write '{self.path}' – ignoring!\n\t^^^^^^^{str(e)}",
+                    "red"
+                ))
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+
+        debugger.log_dbg(color_text(
+            "--> [LookupCache]: "
+            + f"{stats['hits']} hit(s), "
+            + f"{stats['misses']} miss(es), "
+            + f"{stats['evictions']} eviction(s), "
+            + f"{stats['entries']} entries\n",
+            "cyan"
+        ))
+
+
+LookupCache = LookupCacheInst()
+
+atexit.register(LookupCache.flush)
@@ -1,9 +1,13 @@
+import hashlib
+import json
 import os.path
-from unittest import TestCase
-from pkg_resources import require, DistributionNotFound
+import platform as _platform
+import re
+import tempfile
+from importlib.util import find_spec
 from platform import system
 from subprocess import call
-from sys import platform, executable, exit
+from sys import platform, executable, exit, version, version_info
 
 dir_delim = "\\" if system().lower() == "windows" else "/"
 
@@ -12,7 +16,7 @@ try:
         os.path.join(
             dir_delim.join(
                 os.path.dirname(__file__).split(dir_delim)[:-2]
-            ), 
+            ),
             "requirements.txt"
         )
     ).read()
@@ -21,28 +25,105 @@ except Exception as e:
         f"Failed to locate requirements file. Maybe it was deleted?\n\n{str(e)}"
     )
 
-
-class Requirements(TestCase):
+# Packages whose distribution name doesn't match
+# the module they're imported as.
+MODULES = {
+    "pywin32": "win32api",
+    "pyobjc": "objc",
+}
+
+# Environment markers (PEP 508) which may
+# be used inside of `requirements.txt`.
+MARKERS = {
+    "python_version": "{}.{}".format(*version_info[:2]),
+    "python_full_version": "{}.{}.{}".format(*version_info[:3]),
+    "sys_platform": platform,
+    "platform_system": system(),
+    "platform_machine": _platform.machine(),
+    "os_name": os.name,
+    "implementation_name": _platform.python_implementation().lower(),
+}
+
+_TOKEN = re.compile(r"\s*(\(|\)|==|!=|<=|>=|<|>|'[^']*'|\"[^\"]*\"|[A-Za-z_][A-Za-z0-9_.]*)")
+
+
+class Requirements:
     """
     Instance, solely here to ensure that all necessary
     dependencies are installed.
+
+    Once every requirement is found, the verdict is stored in `cache_dir`
+    (keyed by the interpreter and the contents of `requirements.txt`),
+    so later launches don't have to check again.
     """
 
+    def __init__(self, cache_dir=""):
+        self.cache = os.path.join(cache_dir, "requirements.json") if cache_dir else ""
+        self.key = hashlib.sha256(
+            "\0".join([executable, version, REQUIRED]).encode("utf-8")
+        ).hexdigest()
+
     def test_req(self):
+        if self.cached():
+            return []
+
         missing = []
         requirements = self.extract_req(REQUIRED)
 
         for _requirement in requirements:
-            _req = str(_requirement[0]).strip()
+            if not self.installed(_requirement[0].strip()):
+                missing.append(_requirement)
 
-            with self.subTest(requirement=_req):
-                try:
-                    require(_req)
-                except DistributionNotFound:
-                    missing.append(_requirement)
+        if not missing:
+            self.store()
 
         return missing
 
+    def installed(self, name):
+        # Imported here, as it's fairly expensive to import,
+        # and not needed at all when the verdict is cached.
+        from importlib import metadata
+
+        try:
+            metadata.distribution(name)
+
+            return True
+        except metadata.PackageNotFoundError:
+            pass
+
+        try:
+            return find_spec(MODULES.get(name.lower(), name.lower())) is not None
+        except (ImportError, ValueError):
+            return False
+
+    def cached(self):
+        if not self.cache or not os.path.isfile(self.cache):
+            return False
+
+        try:
+            with open(self.cache, "r") as file:
+                return json.load(file).get("key") == self.key
+        except Exception:
+            return False
+
+    def store(self):
+        if not self.cache or not os.path.isdir(os.path.dirname(self.cache)):
+            return
+
+        try:
+            fd, tmp = tempfile.mkstemp(
+                prefix=".requirements.json.", dir=os.path.dirname(self.cache)
+            )
+
+            with os.fdopen(fd, "w") as file:
+                json.dump({"key": self.key}, file)
+
+            os.replace(tmp, self.cache)
+        except Exception:
+            # Not being able to cache this is harmless;
+            # the check simply runs again next time.
+            pass
+
     def install_reqs(self, missing):
         acceptable = {"y", "n", "yes", "no"}
         answer = input(
@@ -96,19 +177,76 @@ class Requirements(TestCase):
             r for r in requirements.split("\n") if r and r != " " and not "#" in r
         ]:
             # Requirement, conditions
-            r, c = requirement.split(";")
+            r, _, c = requirement.partition(";")
+            r = r.strip()
             name = r
-            sys_platform = ""
 
             if "git+" in r.lower():
                 name = r.split("/")[-1].split("-")[0]
-                
-            if "sys_platform" in c.lower():
-                sys_platform = c.split("sys_platform == ")[1][:-1].split("'")[1]
 
-            if sys_platform and not platform.lower() == sys_platform:
+            if c.strip() and not self.evaluate(c):
                 continue
 
             deps.append(( name, r ))
 
         return deps
+
+    def evaluate(self, markers):
+        """
+        Evaluates a requirement's environment markers, e.g.
+        `python_version >= '3.9' and sys_platform == 'linux'`,
+        against the running interpreter.
+        """
+
+        tokens = _TOKEN.findall(markers)
+
+        def expr(i):
+            value, i = conjunction(i)
+
+            while i < len(tokens) and tokens[i] == "or":
+                other, i = conjunction(i + 1)
+                value = value or other
+
+            return value, i
+
+        def conjunction(i):
+            value, i = atom(i)
+
+            while i < len(tokens) and tokens[i] == "and":
+                other, i = atom(i + 1)
+                value = value and other
+
+            return value, i
+
+        def atom(i):
+            if tokens[i] == "(":
+                value, i = expr(i + 1)
+
+                return value, i + 1
+
+            return self.compare(tokens[i], tokens[i + 1], tokens[i + 2]), i + 3
+
+        return expr(0)[0]
+
+    def compare(self, left, op, right):
+        def resolve(token):
+            if token[0] in "'\"":
+                return token[1:-1]
+
+            return MARKERS.get(token, "")
+
+        left, right = resolve(left), resolve(right)
+
+        # Versions are compared numerically, everything else as-is.
+        if all(re.fullmatch(r"\d+(\.\d+)*", x) for x in (left, right)):
+            left = tuple(int(x) for x in left.split("."))
+            right = tuple(int(x) for x in right.split("."))
+
+        return {
+            "==": left == right,
+            "!=": left != right,
+            "<": left < right,
+            "<=": left <= right,
+            ">": left > right,
+            ">=": left >= right,
+        }.get(op, False)
@@ -0,0 +1,316 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src import info
+from src.info import color_text
+from src.util.accounting import Accounting as accounting
+from src.util.deadline import Deadline as deadline
+from src.util.debugger import Debugger as debugger
+
+
+class NetworkUnavailable(requests.ConnectionError):
+    """
+    Raised, instead of making a request, when its host's circuit is open
+    or the run's network budget is used up.
+
+    Subclasses `requests.ConnectionError`, so callers already
+    handling connection errors treat it the same way.
+    """
+
+
+class Cancelled(NetworkUnavailable):
+    """
+    Raised by requests which were cancelled, as another source
+    answered first (see `hedging.hedge`); before they're made,
+    or while their body is being read.
+    """
+
+
+class NetworkInst:
+    """
+    Shared HTTP layer for every network lookup OCSysInfo makes.
+
+    All requests go through a single keep-alive `requests.Session`,
+    so connections to the same host are reused across lookups and threads,
+    and the amount of simultaneous requests to any one host is capped
+    at `info.network_host_limit`.
+
+    Connectivity is probed in the background (see `start_probe`), and requests
+    only wait for its result when they're actually about to be made.
+
+    Hosts that time out or refuse a connection have their circuit opened,
+    and are skipped for the rest of the run (see `info.network_circuit_retry`).
+    The total time spent waiting on the network is capped at `info.network_budget`,
+    and no request outlasts the run's deadline, if any (see `Deadline`).
+
+    Requests made by a thread running a hedged attempt can be cancelled
+    (see `cancellable`); they raise `Cancelled` once they are.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hosts = {}
+        self.circuits = {}
+        self.inflight = 0
+        self.busy_since = 0.0
+        self.spent = 0.0
+        self.probe = None
+        self.connected = None
+        self.failures = 0
+        self.local = threading.local()
+        self._session = None
+
+    def session(self):
+        if self._session is None:
+            with self.lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=info.network_host_limit,
+                        pool_maxsize=max(info.enrichment_workers, info.network_host_limit),
+                    )
+
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update(info.useragent_header)
+
+                    self._session = session
+
+        return self._session
+
+    def start_probe(self, url="https://www.google.com"):
+        """
+        Starts checking for internet connectivity in the background.
+        """
+
+        if self.probe or self.connected is not None:
+            return
+
+        def probe():
+            try:
+                debugger.log_dbg("--> [INTERNET]: Testing connection...")
+
+                self.request(url)
+                self.connected = True
+
+                debugger.log_dbg("--> [INTERNET]: Available!\n")
+            except Exception:
+                self.connected = False
+
+                debugger.log_dbg("--> [INTERNET]: Not available!\n")
+
+        self.probe = threading.Thread(target=probe, name="ocsi-connectivity", daemon=True)
+        self.probe.start()
+
+    def set_offline(self):
+        self.connected = False
+
+    def online(self):
+        """
+        Whether or not the internet is reachable; waits for
+        the connectivity probe to finish, if it's still running.
+        """
+
+        if self.connected is None and self.probe:
+            self.probe.join()
+
+        return self.connected is not False
+
+    def cancellable(self, event):
+        """
+        Cancels the requests this thread makes from now on, once `event`
+        is set (or none, if `None`); returns the previous one.
+        """
+
+        previous = getattr(self.local, "cancel", None)
+        self.local.cancel = event
+
+        return previous
+
+    def cancelled(self):
+        event = getattr(self.local, "cancel", None)
+
+        return event is not None and event.is_set()
+
+    def get(self, url, **kwargs):
+        if not self.online():
+            self.failed()
+            raise NetworkUnavailable(f"No internet connection – skipping '{url}'")
+
+        return self.request(url, **kwargs)
+
+    def failed(self):
+        """Records a lookup which couldn't be made, or failed (see `complete`)."""
+
+        with self.lock:
+            self.failures += 1
+
+    def complete(self):
+        """
+        Whether or not every network lookup of this run could be made;
+        `False` if any failed, or the internet wasn't reachable at all.
+        Cancelled requests (see `Cancelled`) don't count.
+        """
+
+        return self.connected is not False and not self.failures
+
+    def request(self, url, **kwargs):
+        try:
+            return self._request(url, **kwargs)
+        except Cancelled:
+            raise
+        except Exception:
+            self.failed()
+            raise
+
+    def _request(self, url, **kwargs):
+        host = urlsplit(url).hostname or ""
+
+        if self.cancelled():
+            raise Cancelled(f"Request to '{host}' was cancelled")
+
+        kwargs.setdefault("timeout", info.requests_timeout)
+        kwargs.setdefault("headers", info.useragent_header)
+
+        with self.host_slot(host):
+            remaining = self.remaining()
+
+            if remaining <= 0:
+                raise NetworkUnavailable(
+                    f"Network budget of {info.network_budget}s exhausted – skipping '{host}'"
+                )
+
+            if deadline.expired():
+                raise NetworkUnavailable(
+                    f"Deadline of {deadline.seconds}s reached – skipping '{host}'"
+                )
+
+            # Whichever runs out first.
+            remaining = min(remaining, deadline.remaining())
+
+            self.acquire(host)
+
+            if not isinstance(kwargs["timeout"], tuple) and (
+                kwargs["timeout"] is None or kwargs["timeout"] > remaining
+            ):
+                kwargs["timeout"] = remaining
+
+            self.begin()
+
+            try:
+                response = self.session().get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.release(host, e)
+                raise
+            except BaseException:
+                # Anything else (e.g. too many redirects) doesn't mean the host
+                # is unreachable; but a half-open trial still has to end.
+                self.rearm(host)
+                raise
+            finally:
+                self.end()
+
+            self.release(host, None)
+
+            # Streamed bodies haven't been downloaded yet; they're
+            # accounted for by whoever reads them (see `scraper.scrape`).
+            if accounting.enabled and not kwargs.get("stream"):
+                accounting.http(host, len(response.content or b""))
+
+            return response
+
+    def host_slot(self, host):
+        with self.lock:
+            if host not in self.hosts:
+                self.hosts[host] = threading.BoundedSemaphore(
+                    max(info.network_host_limit, 1)
+                )
+
+            return self.hosts[host]
+
+    def acquire(self, host):
+        """
+        Checks whether or not a request to `host` may be made,
+        raising `NetworkUnavailable` if its circuit is open.
+        """
+
+        with self.lock:
+            circuit = self.circuits.get(host)
+
+            if not circuit:
+                return
+
+            if (
+                info.network_circuit_retry > 0 and
+                not circuit["trial"] and
+                time.monotonic() >= circuit["opened"] + info.network_circuit_retry
+            ):
+                # Half-open: let a single request through.
+                circuit["trial"] = True
+                return
+
+            raise NetworkUnavailable(f"'{host}' is unreachable – skipping")
+
+    def release(self, host, error):
+        with self.lock:
+            circuit = self.circuits.get(host)
+
+            if error is None:
+                if circuit and circuit["trial"]:
+                    del self.circuits[host]
+
+                return
+
+            if not circuit:
+                debugger.log_dbg(color_text(
+                    f"--> [Network]: '{host}' is unreachable – skipping it for the rest of this run!" +
+                    f"\n\t^^^^^^^{str(error)}",
+                    "red"
+                ))
+
+            self.circuits[host] = {"opened": time.monotonic(), "trial": False}
+
+    def rearm(self, host):
+        """Ends the half-open trial of `host`'s circuit, if any, without closing it."""
+
+        with self.lock:
+            circuit = self.circuits.get(host)
+
+            if circuit and circuit["trial"]:
+                circuit["opened"] = time.monotonic()
+                circuit["trial"] = False
+
+    def begin(self):
+        with self.lock:
+            if not self.inflight:
+                self.busy_since = time.monotonic()
+
+            self.inflight += 1
+
+    def end(self):
+        with self.lock:
+            self.inflight -= 1
+
+            if not self.inflight:
+                self.spent += time.monotonic() - self.busy_since
+
+    def remaining(self):
+        """
+        Seconds left of the network budget. Concurrent requests
+        only count once, as the budget is measured in wall-clock time.
+        """
+
+        with self.lock:
+            spent = self.spent
+
+            if self.inflight:
+                spent += time.monotonic() - self.busy_since
+
+        return info.network_budget - spent
+
+
+Network = NetworkInst()
@@ -0,0 +1,261 @@
+import bisect
+import mmap
+import os
+import re
+import threading
+from array import array
+
+from src.info import color_text
+from src.util.debugger import Debugger as debugger
+
+_RESOURCES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "resources",
+)
+
+PCI_IDS_PATHS = [
+    "/usr/share/hwdata/pci.ids",
+    "/usr/share/misc/pci.ids",
+    "/usr/share/pci.ids",
+    "/usr/local/share/pci.ids",
+    os.path.join(_RESOURCES, "pci.ids"),
+]
+
+USB_IDS_PATHS = [
+    "/usr/share/hwdata/usb.ids",
+    "/usr/share/misc/usb.ids",
+    "/usr/share/usb.ids",
+    "/usr/local/share/usb.ids",
+    os.path.join(_RESOURCES, "usb.ids"),
+]
+
+# Vendor lines are not indented, device lines are indented
+# with a single tab, and subsystem lines with two tabs.
+#
+# E.g:
+#   8086  Intel Corporation
+#   \t1533  I210 Gigabit Network Connection
+#   \t\t8086 0001  Ethernet Server Adapter I210-T1
+_VENDOR = re.compile(rb"^([0-9a-fA-F]{4})  ", re.M)
+_DEVICE = re.compile(rb"^\t([0-9a-fA-F]{4})  ", re.M)
+_SUBSYS = re.compile(rb"^\t\t([0-9a-fA-F]{4}) ([0-9a-fA-F]{4})  ", re.M)
+
+# Everything after the vendor list (device classes in `pci.ids`,
+# languages/HID usages/etc. in `usb.ids`) starts with a
+# non-hexadecimal section marker, e.g. `C 00  Unclassified device`.
+_SECTION = re.compile(rb"^[A-Z]{1,3} ", re.M)
+
+
+class IDDatabase:
+    """
+    Lazily built, memory-mapped index over a `pci.ids`/`usb.ids` style database.
+
+    Nothing is parsed until the first lookup. The vendor index is a pair
+    of sorted `array`s (IDs, file offsets), and each vendor's device index
+    is only built the first time that vendor is queried. Names are read
+    straight out of the memory map, so the parsed database is never
+    held in memory as Python strings.
+    """
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.path = None
+        self._lock = threading.Lock()
+        self._mm = None
+        self._loaded = False
+        self._vendors = None
+        self._devices = {}
+
+    def available(self):
+        self._load()
+
+        return self._mm is not None
+
+    def vendor(self, ven):
+        entry = self._vendor_entry(ven)
+
+        if not entry:
+            return None
+
+        return self._name(entry[0])
+
+    def device(self, dev, ven):
+        idx = self._device_index(ven)
+
+        if not idx:
+            return None
+
+        found = self._find(idx, dev)
+
+        return self._name(idx[1][found]) if found is not None else None
+
+    def subsystem(self, dev, ven, subven, subdev):
+        idx = self._device_index(ven)
+
+        if not idx:
+            return None
+
+        found = self._find(idx, dev)
+
+        if found is None:
+            return None
+
+        start, end = idx[1][found], idx[2][found]
+        key = f"{_hex(subven):04x} {_hex(subdev):04x}".encode()
+
+        for match in _SUBSYS.finditer(self._mm, start, end):
+            if match.group(0)[2:-2].lower() == key:
+                return self._name(match.start())
+
+        return None
+
+    def lookup(self, dev, ven, subven=None, subdev=None):
+        """
+        Resolves the given IDs into a dictionary in the same shape
+        `PCIIDs.get_item` returns; missing values are omitted.
+        """
+
+        data = {}
+
+        try:
+            device = self.device(dev, ven)
+            vendor = self.vendor(ven)
+
+            if device:
+                data["device"] = device
+
+            if vendor:
+                data["vendor"] = vendor
+
+            if device and subven and subdev:
+                subsystem = self.subsystem(dev, ven, subven, subdev)
+
+                if subsystem:
+                    data["subsystem"] = subsystem
+        except ValueError:
+            return {}
+
+        return data
+
+    def _load(self):
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+
+            for path in self.paths:
+                if not os.path.isfile(path):
+                    continue
+
+                try:
+                    with open(path, "rb") as file:
+                        self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+                    self.path = path
+                    break
+                except (OSError, ValueError):
+                    continue
+
+            if self._mm is not None:
+                debugger.log_dbg(color_text(
+                    f"--> [IDDatabase]: Using local ID database at '{self.path}'.",
+                    "cyan"
+                ))
+
+                self._vendors = self._index(_VENDOR, 0, self._section_end())
+
+            self._loaded = True
+
+    def _section_end(self):
+        match = _SECTION.search(self._mm)
+
+        return match.start() if match else len(self._mm)
+
+    def _index(self, pattern, start, end):
+        """
+        Builds a sorted (IDs, line offsets, block ends) index of every line
+        in `[start, end)` matching `pattern`. The block end of an entry is the
+        offset of the next matching line in file order.
+        """
+
+        rows = []
+        prev = None
+
+        for match in pattern.finditer(self._mm, start, end):
+            if prev is not None:
+                rows.append((prev[0], prev[1], match.start()))
+
+            prev = (int(match.group(1), 16), match.start())
+
+        if prev is not None:
+            rows.append((prev[0], prev[1], end))
+
+        rows.sort()
+
+        ids, offsets, ends = array("I"), array("Q"), array("Q")
+
+        for row in rows:
+            ids.append(row[0])
+            offsets.append(row[1])
+            ends.append(row[2])
+
+        return ids, offsets, ends
+
+    def _vendor_entry(self, ven):
+        self._load()
+
+        if not self._vendors:
+            return None
+
+        found = self._find(self._vendors, ven)
+
+        if found is None:
+            return None
+
+        return self._vendors[1][found], self._vendors[2][found]
+
+    def _device_index(self, ven):
+        entry = self._vendor_entry(ven)
+
+        if not entry:
+            return None
+
+        key = _hex(ven)
+        idx = self._devices.get(key)
+
+        if idx is None:
+            start = self._mm.find(b"\n", entry[0], entry[1]) + 1
+            idx = self._index(_DEVICE, start, entry[1])
+            self._devices[key] = idx
+
+        return idx
+
+    def _find(self, idx, value):
+        value = _hex(value)
+        pos = bisect.bisect_left(idx[0], value)
+
+        if pos < len(idx[0]) and idx[0][pos] == value:
+            return pos
+
+        return None
+
+    def _name(self, offset):
+        end = self._mm.find(b"\n", offset)
+        line = self._mm[offset: end if end != -1 else len(self._mm)]
+
+        return line.lstrip(b"\t").split(b"  ", 1)[-1].strip().decode("utf-8", "replace")
+
+
+def _hex(value):
+    if isinstance(value, int):
+        return value
+
+    value = value.strip().lower()
+
+    return int(value[2:] if value.startswith("0x") else value, 16)
+
+
+pci_db = IDDatabase(PCI_IDS_PATHS)
+usb_db = IDDatabase(USB_IDS_PATHS)
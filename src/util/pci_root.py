@@ -1,12 +1,19 @@
 import os
 import platform
+import re
+import threading
 from src.info import color_text
 from src.util.debugger import Debugger as debugger
+from src.util.sysfs_reader import SysfsReader
 
 if platform.system().lower() == "darwin":
     from src.dumps.macOS.ioreg import *
 
 
+# <domain>:<bus>:<slot>.<function>, e.g. 0000:00:1f.3
+_BDF = re.compile(r"[0-9a-fA-F]{4}:[0-9a-fA-F]{2}:[0-9a-fA-F]{2}\.[0-7]")
+
+
 def _get_valid(slot):
     try:
         return tuple([
@@ -202,29 +209,126 @@ def pci_from_acpi_win(wmi, instance_id, logger):
 
     return data
 
-def pci_from_acpi_linux(device_path, logger):
+class PCITopology:
+    """
+    Index of the PCI hierarchy on Linux, mapping each PCI function
+    to its parent bridge.
+
+    The index is built in a single pass over `/sys/bus/pci/devices`, the first
+    time it's needed, by reading each function's sysfs symlink; whose target
+    (e.g. `/sys/devices/pci0000:00/0000:00:01.0/0000:01:00.0`) already lists
+    every bridge between the function and its root.
+
+    Looking up a PCI path is then O(depth), and paths of shared bridges are memoized.
+    """
+
+    def __init__(self, sysfs="/sys", reader=None):
+        self.sysfs = sysfs
+        self.reader = reader or SysfsReader()
+        self.lock = threading.Lock()
+        self.parents = None
+        self.paths = {}
+
+    def build(self):
+        with self.lock:
+            if self.parents is not None:
+                return
+
+            parents = {}
+            devices = os.path.join(self.sysfs, "bus", "pci", "devices")
+
+            for slot in self.reader.listdir(devices):
+                parents[slot] = self._resolve(os.path.join(devices, slot))
+
+            self.parents = parents
+
+            debugger.log_dbg(color_text(
+                f"--> [PCI/ACPI]: Indexed {len(parents)} PCI function(s)! — (SYS_FS)",
+                "green"
+            ))
+
+    def parent(self, slot):
+        if self.parents is None:
+            self.build()
+
+        if slot not in self.parents:
+            self.parents[slot] = self._resolve(
+                os.path.join(self.sysfs, "bus", "pci", "devices", slot)
+            )
+
+        return self.parents[slot]
+
+    def pci_path(self, slot):
+        """
+        Constructs the PCI path of the given function,
+        e.g. `PciRoot(0x0)/Pci(0x1,0x0)/Pci(0x0,0x0)`.
+        """
+
+        path = self.paths.get(slot)
+
+        if path:
+            return path
+
+        parent = self.parent(slot)
+
+        if parent:
+            path = self.pci_path(parent)
+        else:
+            # Domain
+            path = f"PciRoot({hex(int(slot.split(':')[0], 16))})"
+
+        path += f"/Pci({','.join(_get_valid(slot))})"
+
+        self.paths[slot] = path
+
+        return path
+
+    def _resolve(self, path):
+        # The link's target alone lists the whole chain,
+        # e.g. `../../../devices/pci0000:00/0000:00:01.0/0000:01:00.0`.
+        target = self.reader.readlink(path) or self.reader.realpath(path)
+
+        chain = [
+            component for component
+            in target.split(os.sep)
+            if _BDF.fullmatch(component)
+        ]
+
+        return chain[-2] if len(chain) > 1 else None
+
+
+def pci_from_acpi_linux(device_path, logger, topology=None, slot="", reader=None):
+    """
+    ACPI and PCI paths of the PCI function at `device_path`; whose
+    slot is read from its `uevent`, unless it's already known.
+
+    Read through `reader`, or that of `topology`.
+    """
+
+    topology = topology or _topology
+    reader = reader or topology.reader
+
     data = {}
-    acpi = ""
-    pci = ""
+    acpi = reader.read(f"{device_path}/firmware_node/path")
+    pci = "" if slot else reader.read(f"{device_path}/uevent")
 
-    try:
-        acpi = open(f"{device_path}/firmware_node/path", "r").read().strip()
-        pci = open(f"{device_path}/uevent", "r").read().strip()
+    if acpi is None or pci is None:
+        error = reader.error(f"{device_path}/firmware_node/path", f"{device_path}/uevent")
 
-        data["ACPI Path"] = acpi
-    except Exception as e:
         debugger.log_dbg(color_text(
             "--> [PCI/ACPI]: Failed to construct paths of anonymous device! — (SYS_FS)",
             "red"
         ))
 
         logger.error(
-            f"Failed to construct ACPI/PATH of anonymous device (SYS_FS)\n\t^^^^^^^^^{str(e)}"
+            f"Failed to construct ACPI/PATH of anonymous device (SYS_FS)\n\t^^^^^^^^^{str(error)}"
         )
 
         return ""
 
-    if not acpi or not pci:
+    data["ACPI Path"] = acpi
+
+    if not acpi or not (pci or slot):
         return ""
 
     # Path to be yielded in the end.
@@ -234,28 +338,13 @@ def pci_from_acpi_linux(device_path, logger):
     # Parent PCI description
     #
     # <domain>:<bus>:<slot>.<function>
-    slot = ""
-
     for line in pci.split("\n"):
         if "pci_slot_name" in line.lower():
             slot = line.split("=")[1]
             break
 
     if slot:
-        # Domain
-        pcip += f"PciRoot({hex(int(slot.split(':')[0], 16))})"
-        children = []
-        paths = [",".join(_get_valid(slot))]
-
-        for path in os.listdir("/sys/bus/pci/devices"):
-            if slot in os.listdir(f"/sys/bus/pci/devices/{path}"):
-                children.append(path)
-
-        for child in children:
-            paths.append(",".join(_get_valid(child)))
-
-        for comp in sorted(paths, reverse=True):
-            pcip += f"/Pci({comp})"
+        pcip = topology.pci_path(slot)
 
     if pcip:
         data["PCI Path"] = pcip
@@ -266,3 +355,7 @@ def pci_from_acpi_linux(device_path, logger):
     ))
     
     return data
+
+
+# Shared by every caller which doesn't provide its own.
+_topology = PCITopology()
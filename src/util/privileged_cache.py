@@ -0,0 +1,184 @@
+import os
+import re
+import shutil
+import stat
+import tempfile
+
+from src import info
+from src.info import color_text
+from src.util.debugger import Debugger as debugger
+
+BOOT_ID = "/proc/sys/kernel/random/boot_id"
+
+# Left in the cache directory when it's created, so that
+# a directory which wasn't is never written to, nor cleaned up.
+MARKER = ".ocsysinfo-privileged-cache"
+
+# Entries of the cache directory are named after the boot they're of.
+BOOT_DIR = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+
+class PrivilegedCacheInst:
+    """
+    Boot-scoped cache for raw data which can only be read as root
+    (e.g. the SMBIOS table), so that unprivileged runs don't have to prompt
+    for sudo, as long as a privileged run has already happened during the same boot.
+
+    Entries are stored under `info.privileged_cache_dir/<boot_id>/`, so they're
+    invalidated by a reboot; a privileged run removes those of previous boots.
+    Only privileged runs with the cache enabled write to it, and entries are
+    only trusted if they, and their directories, are owned by root and aren't
+    writable by anyone else.
+
+    The cache directory is only written to if it was created by OCSysInfo
+    (see `MARKER`); and only the boot directories it created are ever removed.
+
+    Linux-only; elsewhere, `get` always misses and `store` does nothing.
+    """
+
+    def __init__(self):
+        self.enabled = info.privileged_cache
+        self._boot_id = None
+
+    def enable(self):
+        self.enabled = True
+
+    def boot_id(self):
+        if self._boot_id is None:
+            try:
+                with open(BOOT_ID, "r") as file:
+                    self._boot_id = file.read().strip()
+            except OSError:
+                self._boot_id = ""
+
+        return self._boot_id
+
+    def path(self, name=""):
+        return os.path.join(info.privileged_cache_dir, self.boot_id(), name)
+
+    def get(self, name):
+        """
+        The cached contents of `name` for the current boot,
+        or `None` if there aren't any (trusted ones).
+        """
+
+        if not self.boot_id():
+            return None
+
+        path = self.path(name)
+
+        try:
+            for entry in (info.privileged_cache_dir, self.path(), path):
+                if not self._trusted(os.lstat(entry)):
+                    debugger.log_dbg(color_text(
+                        f"--> [PrivilegedCache]: '{entry}' isn't owned by root, or is writable by others – ignoring!",
+                        "red"
+                    ))
+
+                    return None
+
+            with open(path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        debugger.log_dbg(color_text(
+            f"--> [PrivilegedCache]: Using cached '{name}' from this boot.",
+            "cyan"
+        ))
+
+        return data
+
+    def store(self, name, data):
+        """
+        Caches `data` as `name` for the current boot – only if
+        enabled, and only if this is a privileged run.
+        """
+
+        if not self.enabled or not self.boot_id() or not hasattr(os, "geteuid") or os.geteuid() != 0:
+            return
+
+        try:
+            if not self._claim(info.privileged_cache_dir):
+                debugger.log_dbg(color_text(
+                    f"--> [PrivilegedCache]: '{info.privileged_cache_dir}' wasn't created by OCSysInfo – refusing to use it!",
+                    "red"
+                ))
+
+                return
+
+            # Entries of previous boots are stale.
+            for entry in os.scandir(info.privileged_cache_dir):
+                if entry.name != self.boot_id() and BOOT_DIR.match(entry.name) and self._ours(entry):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+            if not os.path.isdir(self.path()):
+                os.mkdir(self.path(), 0o755)
+                os.chmod(self.path(), 0o755)
+
+            fd, tmp = tempfile.mkstemp(prefix=f".{name}.", dir=self.path())
+
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+
+                os.chmod(tmp, 0o644)
+                os.replace(tmp, self.path(name))
+            except Exception:
+                os.unlink(tmp)
+                raise
+
+            debugger.log_dbg(color_text(
+                f"--> [PrivilegedCache]: Cached '{name}' for unprivileged runs during this boot.",
+                "green"
+            ))
+        except Exception as e:
+            debugger.log_dbg(color_text(
+                f"--> [PrivilegedCache]: Failed to cache '{name}' – ignoring!\n\t^^^^^^^{str(e)}",
+                "red"
+            ))
+
+    def _claim(self, directory):
+        """
+        Creates `directory`, marked as OCSysInfo's, if it doesn't exist; returns
+        whether or not it's OCSysInfo's – if it already existed, whether it's marked.
+        """
+
+        marker = os.path.join(directory, MARKER)
+
+        try:
+            os.makedirs(directory, mode=0o755)
+        except FileExistsError:
+            try:
+                return (
+                    self._trusted(os.lstat(directory)) and
+                    stat.S_ISDIR(os.lstat(directory).st_mode) and
+                    self._trusted(os.lstat(marker)) and
+                    stat.S_ISREG(os.lstat(marker).st_mode)
+                )
+            except OSError:
+                return False
+
+        os.chmod(directory, 0o755)
+        os.close(os.open(marker, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0), 0o644))
+
+        return True
+
+    def _ours(self, entry):
+        """Whether the boot directory `entry` is as OCSysInfo creates them."""
+
+        st = entry.stat(follow_symlinks=False)
+
+        return stat.S_ISDIR(st.st_mode) and self._trusted(st) and stat.S_IMODE(st.st_mode) == 0o755
+
+    def _trusted(self, st):
+        return (
+            st.st_uid == 0 and
+            not stat.S_ISLNK(st.st_mode) and
+            not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        )
+
+
+PrivilegedCache = PrivilegedCacheInst()
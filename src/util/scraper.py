@@ -0,0 +1,131 @@
+from urllib.parse import urlsplit
+
+from src.info import color_text
+from src.util.accounting import Accounting as accounting
+from src.util.deadline import Deadline as deadline
+from src.util.debugger import Debugger as debugger
+from src.util.network import Cancelled, Network as network, NetworkUnavailable
+
+# Lines are split out of chunks of this size, as they arrive;
+# and it's also as far as is read past the last field needed.
+CHUNK_SIZE = 16 * 1024
+
+
+class Field:
+    """
+    A value to capture from a page: the first line matching `pattern` (a compiled
+    regex) – or only its first group, if it has any – or the line after it,
+    if `following`. Lines are only matched once every field named in `after`
+    was captured.
+
+    Pages are read until every field which is `required` was captured.
+    """
+
+    __slots__ = ("name", "pattern", "following", "after", "required")
+
+    def __init__(self, name, pattern, following=False, after=(), required=True):
+        self.name = name
+        self.pattern = pattern
+        self.following = following
+        self.after = after
+        self.required = required
+
+
+def _lines(response, read):
+    pending = b""
+
+    for chunk in response.iter_content(CHUNK_SIZE):
+        if network.cancelled():
+            raise Cancelled(f"Reading '{response.url}' was cancelled")
+
+        # Timeouts only apply to each read; a page trickling in would outlast it.
+        if deadline.expired():
+            raise NetworkUnavailable(f"Deadline reached while reading '{response.url}'")
+
+        read[0] += len(chunk)
+
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+
+        for line in lines:
+            yield line.decode("utf-8", "replace").rstrip("\r")
+
+    if pending:
+        yield pending.decode("utf-8", "replace").rstrip("\r")
+
+
+def scrape(url, fields, **kwargs):
+    """
+    Streams the page at `url`, line by line, capturing `fields` (see `Field`)
+    as they show up; and closes the connection as soon as every required
+    one was – instead of downloading, and searching, the whole page.
+
+    Returns the response's status code, and the values captured, by name;
+    pages which aren't found (anything but a `200`) aren't read at all.
+    Raises `Cancelled` if the request is cancelled while it's being read,
+    and `NetworkUnavailable` if the run's deadline is reached.
+    """
+
+    host = urlsplit(url).hostname or ""
+    response = network.get(url, stream=True, **kwargs)
+    values = {}
+    read = [0]
+
+    if response.status_code != 200:
+        response.close()
+        accounting.http(host, 0)
+
+        return response.status_code, values
+
+    pending = list(fields)
+    required = {field.name for field in fields if field.required}
+    following = []
+    finished = False
+
+    # Reading the body counts towards the network budget as well.
+    network.begin()
+
+    try:
+        for line in _lines(response, read):
+            for field in following:
+                values[field.name] = line
+
+            following = []
+
+            for field in list(pending):
+                if field.after and not all(name in values for name in field.after):
+                    continue
+
+                match = field.pattern.search(line)
+
+                if not match:
+                    continue
+
+                pending.remove(field)
+
+                if field.following:
+                    following.append(field)
+                else:
+                    values[field.name] = match.group(1) if field.pattern.groups else line
+
+            if not following and required.issubset(values):
+                finished = True
+                break
+    except Cancelled:
+        raise
+    except Exception:
+        network.failed()
+        raise
+    finally:
+        network.end()
+        response.close()
+
+        accounting.http(host, read[0])
+
+    if finished:
+        debugger.log_dbg(color_text(
+            f"--> [Network]: Found everything needed after {read[0]} byte(s) of '{url}' – stopped reading!",
+            "cyan"
+        ))
+
+    return response.status_code, values
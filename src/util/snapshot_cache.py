@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import tempfile
+
+from src.info import AppInfo, color_text
+from src.util.debugger import Debugger as debugger
+from src.util.privileged_cache import PrivilegedCache as privileged_cache
+from src.util.timings import Timings as timings
+
+
+def _read(path):
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except OSError:
+        return b""
+
+
+def _tree(path):
+    """Entries of `path`, alongside their (and its) modification times."""
+
+    try:
+        parts = [str(os.stat(path).st_mtime_ns)]
+
+        for entry in sorted(os.scandir(path), key=lambda x: x.name):
+            parts.append(f"{entry.name}:{entry.stat(follow_symlinks=False).st_mtime_ns}")
+    except OSError:
+        return ""
+
+    return "\n".join(parts)
+
+
+def _static():
+    # `product_uuid` is only readable by root; `modalias`
+    # (BIOS/board/product names and versions) is readable by everyone.
+    return (
+        _read("/sys/class/dmi/id/product_uuid") or
+        _read("/sys/class/dmi/id/modalias")
+    ).decode("latin-1")
+
+
+# Cheap signals of whether each category may have changed since it was collected;
+# static ones only change across reboots (or firmware updates), whereas
+# hot-pluggable ones are checked against the relevant sysfs/procfs entries
+# (PCI devices are found by scanning `/sys/bus/pci/devices`).
+SIGNALS = {
+    "linux": {
+        "CPU": _static,
+        "Motherboard": _static,
+        "Memory": _static,
+        "GPU": lambda: _tree("/sys/bus/pci/devices"),
+        "Network": lambda: _tree("/sys/bus/pci/devices"),
+        "Audio": lambda: _tree("/sys/bus/pci/devices"),
+        "Input": lambda: _read("/proc/bus/input/devices").decode("latin-1"),
+        "Storage": lambda: _tree("/sys/block") + _tree("/sys/bus/pci/devices"),
+    },
+}
+
+
+class SnapshotCacheInst:
+    """
+    Cache of the last collected hardware information, per category,
+    stored in OCSysInfo's data directory.
+
+    Each category is stored alongside a signal (see `SIGNALS`) computed when it
+    was collected, and the boot ID; categories whose signal no longer matches
+    are left out when loading the snapshot, so only they are collected again.
+    """
+
+    def __init__(self):
+        self.name = "snapshot.json"
+
+    def path(self):
+        if not AppInfo.data_dir or not os.path.isdir(AppInfo.data_dir):
+            return ""
+
+        return os.path.join(AppInfo.data_dir, self.name)
+
+    def signals(self, platform, offline):
+        signals = SIGNALS.get(platform)
+
+        if not signals:
+            return {}
+
+        # Anything collected in a different boot, by a different version,
+        # or in a different mode (offline runs don't resolve device names) is stale.
+        prefix = "\0".join([privileged_cache.boot_id(), AppInfo.version, str(bool(offline))])
+
+        return {
+            category: hashlib.sha256(
+                (prefix + "\0" + signal()).encode("utf-8", "replace")
+            ).hexdigest()
+            for category, signal in signals.items()
+        }
+
+    @timings.timed("snapshot.load")
+    def load(self, platform, offline=False):
+        """
+        The categories of the last snapshot which are still valid;
+        an empty dictionary if there are none.
+        """
+
+        path = self.path()
+
+        if not path or not os.path.isfile(path) or not privileged_cache.boot_id():
+            return {}
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                snapshot = json.load(file)
+        except Exception as e:
+            debugger.log_dbg(color_text(
+                f"--> [SnapshotCache]: Failed to read '{path}' – ignoring!\n\t^^^^^^^{str(e)}",
+                "red"
+            ))
+
+            return {}
+
+        if snapshot.get("version") != 1 or snapshot.get("platform") != platform:
+            return {}
+
+        signals = self.signals(platform, offline)
+        valid = {}
+
+        for category, entry in snapshot.get("categories", {}).items():
+            if signals.get(category) and entry.get("signal") == signals[category]:
+                valid[category] = entry.get("data")
+
+        debugger.log_dbg(color_text(
+            f"--> [SnapshotCache]: Serving {len(valid)} unchanged categories from cache: {', '.join(valid) or 'none'}",
+            "cyan"
+        ))
+
+        return valid
+
+    @timings.timed("snapshot.store")
+    def store(self, platform, info, offline=False):
+        """Atomically writes the collected `info` as the new snapshot."""
+
+        path = self.path()
+        signals = self.signals(platform, offline)
+
+        if not path or not signals or not privileged_cache.boot_id():
+            return
+
+        data = {
+            "version": 1,
+            "platform": platform,
+            "categories": {
+                category: {"signal": signals[category], "data": value}
+                for category, value in info.items()
+                if value and category in signals
+            },
+        }
+
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=f".{self.name}.", dir=os.path.dirname(path))
+
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(data, file)
+                    file.flush()
+                    os.fsync(file.fileno())
+
+                os.replace(tmp, path)
+            except Exception:
+                os.unlink(tmp)
+                raise
+        except Exception as e:
+            debugger.log_dbg(color_text(
+                f"--> [SnapshotCache]: Failed to write '{path}' – ignoring!\n\t^^^^^^^{str(e)}",
+                "red"
+            ))
+
+
+SnapshotCache = SnapshotCacheInst()
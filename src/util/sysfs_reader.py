@@ -0,0 +1,221 @@
+import os
+import stat
+
+from src.util.accounting import Accounting as accounting
+from src.util.sysroot import Sysroot, SysrootInst
+
+# Entry of a directory which was scanned, and didn't contain it.
+_ABSENT = object()
+
+
+class SysfsReader:
+    """
+    sysfs/procfs access of the Linux collectors, memoized for the lifetime
+    of the reader – a single run (see `LinuxHardwareManager.dump`); so an
+    attribute, directory or link used by several collectors is only read once.
+
+    Attributes are read as text, and converted to `int` on request; files are
+    closed as soon as they're read. Whatever is missing, or unreadable, yields
+    the given default instead of raising – and its error is kept (see `error`).
+
+    Directories are scanned with `os.scandir`, keeping each `DirEntry`; whose
+    cached type answers `isfile`/`isdir` for anything within, without another
+    `stat`. Anything else is `stat`ed once.
+
+    Paths are absolute (e.g. `/sys/class/drm`), and resolved by `Sysroot` –
+    which records them for `--capture` and accounts for them with `--stats` –
+    or against `root`, if given (a directory, or capture).
+
+    The collectors share a reader while running concurrently: at worst,
+    two of them read the same attribute, for the first time, at once.
+    """
+
+    def __init__(self, root=None):
+        if root is None:
+            self.sysroot = Sysroot
+        else:
+            self.sysroot = SysrootInst()
+            self.sysroot.set(root)
+
+        self.texts = {}
+        self.dirs = {}
+        self.stats = {}
+        self.links = {}
+
+    @property
+    def root(self):
+        return self.sysroot.root
+
+    def machine(self):
+        return self.sysroot.machine()
+
+    def path(self, path):
+        """The location of the absolute `path` under the root."""
+
+        return self.sysroot.path(path)
+
+    def _text(self, path):
+        text = self.texts.get(path)
+
+        if text is not None:
+            accounting.hit()
+            return text
+
+        try:
+            with self.sysroot.open(path, "r") as file:
+                text = file.read()
+        except (OSError, UnicodeDecodeError) as e:
+            text = e
+
+        self.texts[path] = text
+
+        return text
+
+    def read(self, path, default=None, strip=True):
+        """Contents of `path`, stripped unless told otherwise; or `default`."""
+
+        text = self._text(path)
+
+        if isinstance(text, Exception):
+            return default
+
+        return text.strip() if strip else text
+
+    def read_int(self, path, default=None, base=10):
+        text = self.read(path)
+
+        if text is None:
+            return default
+
+        try:
+            return int(text, base)
+        except ValueError:
+            return default
+
+    def read_hex(self, path, default=None):
+        """Contents of `path` as a hexadecimal number (e.g. `0x8086`, or `8086`); or `default`."""
+
+        return self.read_int(path, default, 16)
+
+    def read_bytes(self, path):
+        """Contents of `path`, as is; which aren't memoized, nor defaulted."""
+
+        with self.sysroot.open(path, "rb") as file:
+            return file.read()
+
+    def readinto(self, path, buffer):
+        """See `Sysroot.readinto`; not memoized either."""
+
+        return self.sysroot.readinto(path, buffer)
+
+    def error(self, *paths):
+        """Why the first of `paths` which couldn't be read, failed; if any."""
+
+        for path in paths:
+            text = self.texts.get(path)
+
+            if isinstance(text, Exception):
+                return text
+
+        return None
+
+    def _scan(self, path):
+        entries = self.dirs.get(path)
+
+        if entries is None:
+            try:
+                entries = {entry.name: entry for entry in self.sysroot.scandir(path)}
+            except OSError:
+                entries = {}
+
+            self.dirs[path] = entries
+
+        return entries
+
+    def scandir(self, path):
+        """Entries (`os.DirEntry`) of the directory `path`; none, if it doesn't exist."""
+
+        return list(self._scan(path).values())
+
+    def listdir(self, path):
+        return list(self._scan(path))
+
+    def _stat(self, path):
+        if path not in self.stats:
+            try:
+                self.stats[path] = os.stat(self.sysroot.path(path)).st_mode
+            except OSError:
+                self.stats[path] = None
+
+        return self.stats[path]
+
+    def _entry(self, path):
+        parent, name = os.path.split(path)
+        entries = self.dirs.get(parent)
+
+        if entries is None:
+            return None
+
+        # Still kept track of, so that a capture holds it.
+        if self.sysroot.recording:
+            self.sysroot.path(path)
+
+        return entries.get(name, _ABSENT)
+
+    def exists(self, path):
+        entry = self._entry(path)
+
+        if entry is not None:
+            return entry is not _ABSENT
+
+        return self._stat(path) is not None
+
+    def isfile(self, path):
+        entry = self._entry(path)
+
+        if entry is _ABSENT:
+            return False
+        elif entry is not None:
+            return entry.is_file()
+
+        mode = self._stat(path)
+
+        return mode is not None and stat.S_ISREG(mode)
+
+    def isdir(self, path):
+        entry = self._entry(path)
+
+        if entry is _ABSENT:
+            return False
+        elif entry is not None:
+            return entry.is_dir()
+
+        mode = self._stat(path)
+
+        return mode is not None and stat.S_ISDIR(mode)
+
+    def access(self, path, mode):
+        return self.sysroot.access(path, mode)
+
+    def readlink(self, path, default=None):
+        """Target of the symlink `path`; or `default`, if it isn't one."""
+
+        key = ("link", path)
+
+        if key not in self.links:
+            try:
+                self.links[key] = self.sysroot.readlink(path)
+            except OSError:
+                self.links[key] = None
+
+        return self.links[key] if self.links[key] is not None else default
+
+    def realpath(self, path):
+        """`os.path.realpath`, relative to the root."""
+
+        key = ("real", path)
+
+        if key not in self.links:
+            self.links[key] = self.sysroot.realpath(path)
+
+        return self.links[key]
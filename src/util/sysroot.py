@@ -0,0 +1,306 @@
+import atexit
+import io
+import json
+import os
+import platform
+import shutil
+import stat
+import tarfile
+import tempfile
+import time
+
+from src.info import color_text
+from src.util.accounting import Accounting as accounting
+from src.util.debugger import Debugger as debugger
+
+# Stored alongside the captured files; describes the captured machine.
+META = ".ocsysinfo-capture.json"
+
+
+class SysrootInst:
+    """
+    Filesystem access of the Linux collectors, relative to a configurable root.
+
+    Collectors keep using absolute paths (e.g. `/sys/class/drm`), which are
+    resolved against `root`; by default `/`, the live system. Pointing it at
+    a directory, or a capture made with `capture` (see `--sysroot`), replays
+    another machine's sysfs/procfs layout.
+
+    While recording, every path accessed is kept track of, so that `capture`
+    can write exactly the files, directories and symlinks the collectors
+    touched into a compressed tarball.
+    """
+
+    def __init__(self):
+        self.root = ""
+        self.meta = {}
+        self.recording = False
+        self.touched = set()
+        self.listed = set()
+
+    def set(self, root):
+        """
+        Resolves paths against `root`: a directory,
+        or a capture tarball, which is extracted first.
+        """
+
+        root = os.path.abspath(os.path.expanduser(root))
+
+        if os.path.isfile(root):
+            root = self._extract(root)
+
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"'{root}' is neither a directory nor a capture")
+
+        self.root = root
+
+        try:
+            with open(os.path.join(root, META), "r") as file:
+                self.meta = json.load(file)
+        except (OSError, ValueError):
+            self.meta = {}
+
+        debugger.log_dbg(color_text(
+            f"--> [Sysroot]: Resolving sysfs/procfs paths against '{root}'",
+            "cyan"
+        ))
+
+    def record(self):
+        self.recording = True
+
+    def path(self, path):
+        """The location of the absolute `path` under the root."""
+
+        if self.recording:
+            self.touched.add(path)
+
+        if not self.root:
+            return path
+
+        return os.path.join(self.root, path.lstrip("/"))
+
+    def open(self, path, mode="r", **kwargs):
+        return accounting.open(path, open(self.path(path), mode, **kwargs))
+
+    def read(self, path):
+        """Contents of `path`, stripped."""
+
+        with self.open(path, "r") as file:
+            return file.read().strip()
+
+    def readinto(self, path, buffer):
+        """
+        Reads (up to) `len(buffer)` bytes from the start of `path`
+        into `buffer`, with a single `preadv`; returning how many.
+        """
+
+        fd = os.open(self.path(path), os.O_RDONLY)
+
+        try:
+            size = os.preadv(fd, [buffer], 0)
+        finally:
+            os.close(fd)
+
+        accounting.opened(path, size)
+
+        return size
+
+    def listdir(self, path):
+        if self.recording:
+            self.listed.add(path)
+
+        accounting.listing()
+
+        return os.listdir(self.path(path))
+
+    def scandir(self, path):
+        """Entries (`os.DirEntry`) of the directory `path`, as a list."""
+
+        if self.recording:
+            self.listed.add(path)
+
+        accounting.listing()
+
+        with os.scandir(self.path(path)) as entries:
+            return list(entries)
+
+    def exists(self, path):
+        return os.path.exists(self.path(path))
+
+    def isdir(self, path):
+        return os.path.isdir(self.path(path))
+
+    def isfile(self, path):
+        return os.path.isfile(self.path(path))
+
+    def access(self, path, mode):
+        return os.access(self.path(path), mode)
+
+    def readlink(self, path):
+        return os.readlink(self.path(path))
+
+    def realpath(self, path):
+        """`os.path.realpath`, relative to the root."""
+
+        real = os.path.realpath(self.path(path))
+
+        if self.root:
+            real = "/" + os.path.relpath(real, self.root)
+
+        return real
+
+    def machine(self):
+        return self.meta.get("machine") if self.root else platform.machine()
+
+    def capture(self, dest):
+        """
+        Writes everything touched while recording into the `dest` tarball
+        (compressed according to its extension – gzip by default), such that
+        it can be replayed with `set`.
+
+        Symlinks are stored as such, along with whatever they point to;
+        listed directories keep their subdirectories and symlinks, but not
+        the files in them which weren't read.
+        """
+
+        dest = os.path.abspath(os.path.expanduser(dest))
+        mode = "w:xz" if dest.endswith((".xz", ".txz")) else "w:gz"
+        members = {}
+
+        def add(path):
+            # Each component is stored as it is on disk,
+            # following symlinks to what they point to.
+            current = "/"
+
+            for component in path.strip("/").split("/"):
+                current = os.path.join(current, component)
+
+                if current in members:
+                    if members[current] == "link":
+                        current = os.path.normpath(os.path.join(
+                            os.path.dirname(current), os.readlink(current)
+                        ))
+                        add(current)
+
+                    continue
+
+                try:
+                    st = os.lstat(current)
+                except OSError:
+                    return
+
+                if stat.S_ISLNK(st.st_mode):
+                    members[current] = "link"
+                    current = os.path.normpath(os.path.join(
+                        os.path.dirname(current), os.readlink(current)
+                    ))
+                    add(current)
+                else:
+                    members[current] = "dir" if stat.S_ISDIR(st.st_mode) else "file"
+
+        for path in sorted(self.touched | self.listed):
+            add(path)
+
+        for path in sorted(self.listed):
+            try:
+                for entry in os.scandir(os.path.realpath(path)):
+                    if entry.is_symlink() or entry.is_dir():
+                        add(os.path.join(path, entry.name))
+            except OSError:
+                continue
+
+        with tarfile.open(dest, mode) as tar:
+            for path, kind in sorted(members.items()):
+                info = tarfile.TarInfo(path.lstrip("/"))
+                info.mtime = int(time.time())
+
+                if kind == "link":
+                    info.type = tarfile.SYMTYPE
+                    info.linkname = os.readlink(path)
+                    tar.addfile(info)
+                elif kind == "dir":
+                    info.type = tarfile.DIRTYPE
+                    info.mode = 0o755
+                    tar.addfile(info)
+                else:
+                    # sysfs reports every attribute as being 4096 bytes,
+                    # so the size is only known after reading it.
+                    try:
+                        with open(path, "rb") as file:
+                            data = file.read()
+                    except OSError:
+                        continue
+
+                    info.size = len(data)
+                    info.mode = 0o644
+                    tar.addfile(info, io.BytesIO(data))
+
+            meta = json.dumps({
+                "machine": platform.machine(),
+                "kernel": platform.release(),
+                "created": int(time.time()),
+            }).encode("utf-8")
+
+            info = tarfile.TarInfo(META)
+            info.size = len(meta)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(meta))
+
+        debugger.log_dbg(color_text(
+            f"--> [Sysroot]: Captured {len(members)} path(s) into '{dest}'",
+            "green"
+        ))
+
+        return dest
+
+    def _extract(self, capture):
+        root = tempfile.mkdtemp(prefix="ocsysinfo-sysroot-")
+        atexit.register(shutil.rmtree, root, True)
+
+        with tarfile.open(capture, "r:*") as tar:
+            # Don't let a capture write outside of its directory.
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(root, filter="data")
+            else:
+                # As the "data" filter does: every member is checked right before
+                # it's extracted, so that links extracted before it are followed.
+                for member in tar.getmembers():
+                    _check_member(root, member)
+                    tar.extract(member, root)
+
+        return root
+
+
+def _check_member(root, member):
+    """
+    Raises `ValueError` if extracting `member` into `root` would write outside
+    of it, or create a link to anything outside of it, or a device/FIFO.
+    """
+
+    root = os.path.realpath(root)
+
+    def inside(path):
+        path = os.path.realpath(path)
+
+        return path == root or path.startswith(root + os.sep)
+
+    if member.ischr() or member.isblk() or member.isfifo():
+        raise ValueError(f"Refusing to extract special file '{member.name}' from the capture")
+
+    if os.path.isabs(member.name) or not inside(os.path.join(root, member.name)):
+        raise ValueError(f"Refusing to extract '{member.name}' outside of the capture")
+
+    if member.issym():
+        target = os.path.join(root, os.path.dirname(member.name), member.linkname)
+    elif member.islnk():
+        target = os.path.join(root, member.linkname)
+    else:
+        return
+
+    if os.path.isabs(member.linkname) or not inside(target):
+        raise ValueError(
+            f"Refusing to extract '{member.name}', linking to '{member.linkname}' outside of the capture"
+        )
+
+
+Sysroot = SysrootInst()
@@ -0,0 +1,195 @@
+import functools
+import os
+import sys
+import threading
+import time
+
+from src.info import color_text
+
+
+class _Span:
+    __slots__ = ("timings", "name", "start")
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        self.timings.record(self.name, time.perf_counter() - self.start)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class TimingsInst:
+    """
+    Lightweight span timings, aggregated by name, of the collectors,
+    ID/codename lookups and dump writers.
+
+    Disabled by default (see `--timings`); in which case `span` returns
+    a shared no-op, and `timed` functions only check `enabled` before being called.
+    Times are measured with `time.perf_counter`, a monotonic clock.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.spans = {}
+        self.profiler = None
+        self.thread_profilers = []
+
+    def enable(self):
+        self.enabled = True
+
+    def span(self, name):
+        """Context manager timing its body as (another occurrence of) `name`."""
+
+        if not self.enabled:
+            return _NO_SPAN
+
+        return _Span(self, name)
+
+    def timed(self, name):
+        """Decorator timing every call to the decorated function as `name`."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                start = time.perf_counter()
+
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    def record(self, name, seconds):
+        with self.lock:
+            span = self.spans.get(name)
+
+            if span is None:
+                self.spans[name] = [1, seconds, seconds]
+            else:
+                span[0] += 1
+                span[1] += seconds
+                span[2] = max(span[2], seconds)
+
+    def summary(self):
+        """
+        Every span, slowest (in total) first, as
+        `{name: {"Count", "Total (ms)", "Max (ms)"}}`.
+        """
+
+        with self.lock:
+            spans = sorted(self.spans.items(), key=lambda x: x[1][1], reverse=True)
+
+        return {
+            name: {
+                "Count": count,
+                "Total (ms)": round(total * 1e3, 3),
+                "Max (ms)": round(peak * 1e3, 3),
+            }
+            for name, (count, total, peak) in spans
+        }
+
+    def with_meta(self, info):
+        """
+        `info`, with the timings recorded so far under `_meta`,
+        if enabled; otherwise, `info` itself.
+        """
+
+        if not self.enabled:
+            return info
+
+        return {**info, "_meta": {"timings": self.summary()}}
+
+    def report(self):
+        summary = self.summary()
+
+        if not summary:
+            return
+
+        longest = max(len(name) for name in summary)
+
+        print(color_text("\n--> Timings (slowest first):", "cyan"))
+
+        for name, span in summary.items():
+            print(
+                f"    {name.ljust(longest)}  {span['Total (ms)']:>10.3f}ms total" +
+                f"  {span['Count']:>5}x  {span['Max (ms)']:>10.3f}ms max"
+            )
+
+    def start_profile(self):
+        import cProfile
+
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+        # Before 3.12, a profiler only sees the thread which enabled it; so every
+        # thread started from now on (collectors, lookups, ...) gets its own,
+        # installed on its first call, and merged into the stats at the end.
+        if sys.version_info < (3, 12):
+            def install(*_):
+                profiler = cProfile.Profile()
+
+                with self.lock:
+                    self.thread_profilers.append(profiler)
+
+                profiler.enable()
+
+            threading.setprofile(install)
+
+    def stop_profile(self, directory):
+        """Stops profiling, writing the stats (of every thread) next to the log; returns their path."""
+
+        import pstats
+
+        if not self.profiler:
+            return None
+
+        threading.setprofile(None)
+        self.profiler.disable()
+
+        stats = pstats.Stats(self.profiler)
+
+        with self.lock:
+            profilers, self.thread_profilers = self.thread_profilers, []
+
+        for profiler in profilers:
+            profiler.disable()
+
+            try:
+                stats.add(profiler)
+            except TypeError:
+                # Threads which didn't make any (other) call.
+                pass
+
+        path = os.path.join(directory, f"ocsysinfo-{time.strftime('%Y%m%d-%H%M%S')}.pstats")
+
+        stats.dump_stats(path)
+        self.profiler = None
+
+        return path
+
+
+Timings = TimingsInst()
@@ -1,82 +1,185 @@
-import re
+import io
+from itertools import repeat
 from src.info import color_text
 
+# Passed as the key of list items.
+ITEM = object()
 
-def tree(name, data, nest=1, parent="", looped={}, value="", color=True):
+# Frame of a subtree which isn't rendered.
+_MUTE = None
+
+
+class _Glyphs:
+    """The pieces of the tree, rendered once per mode."""
+
+    def __init__(self, color):
+        def paint(text):
+            return color_text(text, "cyan") if color else text
+
+        def below(glyph):
+            # What a member's glyph turns into in the prefix of its own members.
+            return glyph.replace("└", " ").replace("─", " ").replace("├", paint("│"))
+
+        self.header = paint("─ ")
+        self.tee = paint("├── ")
+        self.elbow = paint("└── ")
+        self.pipe = below(self.tee)
+        self.blank = below(self.elbow)
+
+        # Prefix of the members of dicts within categories which are lists.
+        self.items = below(self.header)
+
+
+GLYPHS = {True: _Glyphs(True), False: _Glyphs(False)}
+
+
+class TreeWriter:
     """
-    Internal function to properly format nested objects / lists of objects,
-    and display them to the terminal (thanks, @[Dids](https://github.com/Dids)!)
+    Renders nested objects / lists of objects as a tree (thanks,
+    @[Dids](https://github.com/Dids)!), line by line, into `write`.
+
+    It's fed a depth-first walk of each category: `start` and `end` of
+    every dict/list, and `scalar` for everything else, with the key it's
+    under – or `ITEM`, within lists (see `render`).
+    Each line's prefix is built from its parent's, as it's walked.
+
+    Lists within dicts are rendered as they are, and empty keys and
+    list items are left out.
     """
 
-    spacing = ""
-    sp = ""
+    def __init__(self, write, color=True):
+        self.write = write
+        self.glyphs = GLYPHS[bool(color)]
+
+        # Each frame is `[keyed, prefix, i, l, name]`, where `i` is the
+        # position of the next member, out of `l`, or `_MUTE`.
+        self.stack = []
+
+    def _branch(self, frame):
+        """The prefix of the next member of `frame`, and that of its own members."""
 
-    i = looped.get("i", 1)
-    l = looped.get("l", len(data))
+        i, l = frame[2], frame[3]
+        frame[2] += 1
 
-    if nest == 1:
-        spacing = color_text("─ ", "cyan") if color else "─ "
+        if i < l:
+            return frame[1] + self.glyphs.tee, frame[1] + self.glyphs.pipe
 
-    if isinstance(data, dict):
-        if nest == 1:
-            value += f"{spacing}{name}\n"
+        return frame[1] + self.glyphs.elbow, frame[1] + self.glyphs.blank
 
-        for key in data:
+    def start(self, key, value):
+        stack = self.stack
+
+        if not stack:
+            self.write(f"{self.glyphs.header}{key}\n")
+            stack.append([
+                isinstance(value, dict),
+                "  " if isinstance(value, dict) else self.glyphs.items,
+                1,
+                len(value),
+                key
+            ])
+            return
+
+        frame = stack[-1]
+
+        if frame is _MUTE:
+            stack.append(_MUTE)
+        elif frame[0]:
             if not key:
-                continue
-
-            f = color_text("├── ", "cyan") if color else "├── "
-            s = color_text("└── ", "cyan") if color else "└── "
-
-            if len(looped):
-                sp = (
-                    re.sub(
-                        r"├",
-                        color_text("│", "cyan") if color else "│",
-                        re.sub(r"─", " ", re.sub(r"└", " ", parent)),
-                    )
-                    + (f if i < l else s)
-                )
+                stack.append(_MUTE)
+            elif isinstance(value, dict):
+                sp, prefix = self._branch(frame)
+                self.write(f"{sp}{key}\n")
+                stack.append([True, prefix, 1, len(value), key])
             else:
-                sp = " " * (len(parent) if parent else 2) + (f if i < l else s)
-
-            if len(key) and isinstance(data[key], dict):
-                value += f"{sp}{key}\n"
-                value = tree(
-                    key,
-                    data[key],
-                    nest=nest + 1,
-                    parent=sp,
-                    looped={"i": 1},
-                    value=value,
-                    color=color,
-                )
+                sp, _ = self._branch(frame)
+                self.write(f"{sp}{key}: {value}\n")
+                stack.append(_MUTE)
+        elif not value:
+            stack.append(_MUTE)
+        elif isinstance(value, dict):
+            # Members of dicts within lists carry on with the list's numbering.
+            stack.append([True, frame[1], frame[2], frame[3], frame[4]])
+            frame[2] += 1
+        else:
+            self.write(f"{frame[4]}\n")
+            stack.append([False, "", 1, len(value), frame[4]])
+            frame[2] += 1
+
+    def scalar(self, key, value):
+        if not self.stack:
+            return
+
+        frame = self.stack[-1]
+
+        if frame is _MUTE:
+            return
+        elif frame[0]:
+            if key:
+                sp, _ = self._branch(frame)
+                self.write(f"{sp}{key}: {value}\n")
+        elif value:
+            frame[2] += 1
+
+    def end(self):
+        self.stack.pop()
+
+
+def _recurse(writer, key, value):
+    writer.start(key, value)
+
+    for key, value in value.items() if isinstance(value, dict) else zip(repeat(ITEM), value):
+        if isinstance(value, (dict, list, tuple)):
+            _recurse(writer, key, value)
+        else:
+            writer.scalar(key, value)
+
+    writer.end()
+
+
+def _iterate(writer, key, value):
+    writer.start(key, value)
+
+    stack = [iter(value.items()) if isinstance(value, dict) else iter(value)]
+    keyed = [isinstance(value, dict)]
+
+    while stack:
+        for entry in stack[-1]:
+            key, value = entry if keyed[-1] else (ITEM, entry)
+
+            if isinstance(value, (dict, list, tuple)):
+                writer.start(key, value)
+                stack.append(iter(value.items()) if isinstance(value, dict) else iter(value))
+                keyed.append(isinstance(value, dict))
+                break
+
+            writer.scalar(key, value)
+        else:
+            stack.pop()
+            keyed.pop()
+            writer.end()
+
+
+def render(name, data, file, color=True, iterative=False):
+    """
+    Writes the tree of `data`, under `name`, into `file` (anything with
+    a `write` method), line by line, in a single depth-first pass.
 
-            else:
-                if i >= l:
-                    value += f"{re.sub(r'├', color_text('└', 'cyan') if color else '└', sp)}{key}: {data[key]}\n"
-                else:
-                    value += f"{sp}{key}: {data[key]}\n"
-
-            i += 1
-
-    elif isinstance(data, list):
-        value += f"{spacing}{name}\n"
-
-        i = 1
-        for d in data:
-            if not d:
-                continue
-
-            value = tree(
-                name,
-                d,
-                nest=nest + 1,
-                parent=spacing,
-                looped={"i": i, "l": len(data)},
-                value=value,
-                color=color,
-            )
-            i += 1
-
-    return value
+    The iterative mode has no recursion limit, for arbitrarily deep data.
+    """
+
+    writer = TreeWriter(file.write, color)
+
+    if not isinstance(data, (dict, list, tuple)):
+        return
+
+    (_iterate if iterative else _recurse)(writer, name, data)
+
+
+def tree(name, data, color=True):
+    """The tree of `data`, under `name`, as a string (see `render`)."""
+
+    buffer = io.StringIO()
+    render(name, data, buffer, color=color)
+
+    return buffer.getvalue()
@@ -3,9 +3,28 @@ import re
 
 from src import info
 from src.info import color_text
+from src.util.lookup_cache import MISS, LookupCache as lookup_cache
+from src.util.scraper import Field, scrape
 
 BASE_URL = "https://en.wikichip.org/wiki/amd"
 
+# Text of the first link to the core's, and microarchitecture's, articles;
+# e.g. `<a href="/wiki/amd/cores/matisse" title="amd/cores/matisse">Matisse</a>`.
+WC_FIELDS = [
+    Field("Codename", re.compile(
+        r"<a\s?href=\"/wiki/amd/cores/\w+\s?\w+?\"[^>]+>([^<]+?)</a>"
+    )),
+    Field("Microarchitecture", re.compile(
+        r"<a\s?href=\"/wiki/amd/microarchitectures/\w+\s?\w+?\"[^>]+>([^<]+?)</a>"
+    )),
+    # Only used if the above can't be found.
+    Field("Microarchitecture (microarch)", re.compile(
+        r"<a\s?href=\"/wiki/amd/\w+\s?\w+?\s?\(microarch\)\"[^>]+>([^<]+?)</a>"
+    ), required=False),
+]
+
+_SUFFIX = re.compile(r"(\d{1,2}?(-Core\s?)?(Processor))")
+
 
 def parse_codename(cpu_name):
     """
@@ -13,9 +32,7 @@ def parse_codename(cpu_name):
     parses the contents, and looks for the codename/µarch.
     """
 
-    formatted = re.sub(
-        r"(\d{1,2}?(-Core\s?)?(Processor))", "", cpu_name.replace("AMD", "")
-    ).strip()
+    formatted = _SUFFIX.sub("", cpu_name.replace("AMD", "")).strip()
 
     family = ""
     model = ""
@@ -36,51 +53,25 @@ def parse_codename(cpu_name):
 
     URL = URL.replace(" ", "_")
 
+    cached = lookup_cache.get("wikichip", URL)
+
+    if cached is not MISS:
+        return cached
+
     try:
-        contents = requests.get(URL, timeout=info.requests_timeout, headers=info.useragent_header).content.decode("utf-8")
+        _, values = scrape(URL, WC_FIELDS, timeout=info.requests_timeout, headers=info.useragent_header)
     except Exception as e:
         if isinstance(e, requests.ConnectionError):
             return
         else:
             raise e
-            
-    data = {"Microarchitecture": "", "Codename": ""}
 
-    try:
-        data["Codename"] = re.search(
-            r"(?<=\>).+(?=\<)",
-            re.search(
-                r"\<a\s?href=\"\/wiki\/amd\/cores\/(\w|\d)+\s?(\w|\d)+?\"[^>]+\>[^<]+?\<\/a\>",
-                contents,
-            ).group(),
-        ).group()
-    except Exception:
-        pass
-
-    try:
-        data["Microarchitecture"] = re.search(
-            r"(?<=\>).+(?=\<)",
-            re.search(
-                r"\<a\s?href=\"\/wiki\/amd\/microarchitectures\/(\w|\d)+\s?(\w|\d)+?\"[^>]+\>[^<]+?\<\/a\>",
-                contents,
-            ).group(),
-        ).group()
-    except Exception:
-        pass
-
-    try:
-        if not data["Microarchitecture"]:
-            data["Microarchitecture"] = re.search(
-                r"(?<=\>).+(?=\<)",
-                re.search(
-                    r"\<a\s?href=\"\/wiki\/amd\/(\w|\d)+\s?(\w|\d)+?\s?\(microarch\)\"[^>]+\>[^<]+?\<\/a\>",
-                    contents,
-                ).group(),
-            ).group()
-    except Exception:
-        pass
+    data = {
+        "Microarchitecture": values.get("Microarchitecture") or values.get("Microarchitecture (microarch)", ""),
+        "Codename": values.get("Codename", ""),
+    }
 
     if not data["Microarchitecture"] and not data["Codename"]:
-        return None
+        return lookup_cache.set("wikichip", URL, None)
 
-    return data
+    return lookup_cache.set("wikichip", URL, data)
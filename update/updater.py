@@ -1,15 +1,15 @@
 import os
 import shutil
 import sys
+import threading
 from platform import system
 from urllib.request import urlretrieve
 from zipfile import ZipFile
 
 import regex
-import requests
 
-from src.info import requests_timeout, useragent_header
 from src.util.debugger import Debugger as debugger
+from src.util.network import Network as network
 
 
 class OCSIUpdater:
@@ -20,22 +20,53 @@ class OCSIUpdater:
         self.delim = "\\" if system().lower() == "windows" else "/"
         self.root = self.delim.join(os.path.dirname(__file__).split(self.delim)[:-1])
         self.should_update = False
+        self.latest = None
+        self.thread = None
 
-    def run(self):
-        try:
-            requests.get(
-                "https://www.google.com",
-                timeout=requests_timeout,
-                headers=useragent_header,
-            )
-        except Exception:
+    def start(self):
+        """
+        Checks for a newer version in the background, so that
+        it doesn't hold up hardware discovery; see `finish`.
+        """
+
+        self.thread = threading.Thread(
+            target=self.check_version, name="ocsi-updater", daemon=True
+        )
+        self.thread.start()
+
+        return self
+
+    def finish(self):
+        """
+        Waits for the background version check, and only then
+        prompts the user to update, if a newer version exists.
+        """
+
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+        if not self.latest:
             return
 
-        self.check_version()
+        confirm = input(f"There's a new update (v{self.latest}). Would you like to update? [Y/N]")
+
+        self.latest = None
+
+        if confirm.lower() == "y":
+            self.should_update = True
 
         if not self.should_update:
             return
 
+        self.update()
+
+    def run(self):
+        self.check_version()
+        self.finish()
+
+    def update(self):
+
         self.obtain_updated()
 
         for path in ["main.py", "src"]:
@@ -44,24 +75,27 @@ class OCSIUpdater:
         self.handle_diffs()
 
     def check_version(self):
-        file = requests.get(
-            "https://raw.githubusercontent.com/KernelWanderers/OCSysInfo/main/src/info.py"
-        )
+        try:
+            file = network.get(
+                "https://raw.githubusercontent.com/KernelWanderers/OCSysInfo/main/src/info.py"
+            )
+        except Exception:
+            return
 
         if file.ok:
             contents = file.text
 
-            version = regex.findall(r"version = \"(.+)\"", contents)[0].replace("v", "")
+            try:
+                version = regex.findall(r"version = \"(.+)\"", contents)[0].replace("v", "")
+            except IndexError:
+                return
 
             from src.info import AppInfo
 
             if tuple(int(x) for x in version.split(".")) > tuple(
                 int(x) for x in AppInfo.version.replace("v", "").split(".")
             ):
-                confirm = input("There's a new update. Would you like to update? [Y/N]")
-
-                if confirm.lower() == "y":
-                    self.should_update = True
+                self.latest = version
 
     def handle_diffs(self):
         if not self.data or not self.local: